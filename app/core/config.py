@@ -9,6 +9,13 @@ class Settings(BaseSettings):
     
     # OpenAI API 설정
     OPENAI_API_KEY: Optional[str] = None
+    LLM_RULE_PARSER_ENABLED: bool = True  # 단순한 추가/조회 요청을 LLM 호출 없이 규칙으로 처리할지 여부
+    LLM_FAST_PATH_ENABLED: bool = True  # 의도/일정 개수/일정 정보를 한 번의 호출로 추출하는 빠른 경로 사용 여부
+    LLM_FAST_PATH_MIN_CONFIDENCE: float = 0.8  # 빠른 경로 결과의 신뢰도가 이보다 낮으면 단계별 워크플로우로 처리
+    LLM_CACHE_ENABLED: bool = True  # 같은 프롬프트의 LLM 응답을 캐시할지 여부 (한국 시간 자정에 만료)
+    LLM_CACHE_MAX_ENTRIES: int = 512  # 캐시할 최대 응답 수 (넘으면 가장 오래 사용하지 않은 응답부터 제거)
+    LLM_CACHE_SIMILARITY_THRESHOLD: float = 0.0  # 0보다 크면 임베딩 코사인 유사도가 이 값 이상인 프롬프트의 응답도 재사용 (예: 0.98)
+    LLM_CACHE_EMBEDDING_MODEL: str = "text-embedding-3-small"
     
     # Google Calendar API 설정 (OAuth 방식)
     GOOGLE_CALENDAR_CREDENTIALS: Optional[str] = None
@@ -25,6 +32,19 @@ class Settings(BaseSettings):
     # CHROMADB_PORT: int = 9000
     # CHROMADB_PERSIST_DIR: str = "./chroma_db"
     
+    # 로컬 일정 저장소 설정
+    EVENT_STORAGE_BACKEND: str = "json"  # "json": 파일 저장소, "sqlite": SQLite(WAL) 저장소 (여러 워커 공유 시 권장)
+    EVENT_STORAGE_DIR: str = "data/events"
+    EVENT_STORAGE_MODE: str = "json"  # "json": 매 변경마다 전체 저장, "journal": 변경 로그 추가 + 백그라운드 압축 (여러 워커는 journal 또는 sqlite 권장)
+    EVENT_JOURNAL_FSYNC_BATCH: int = 32  # 몇 건의 변경마다 fsync 할지
+    EVENT_JOURNAL_COMPACT_THRESHOLD: int = 1000  # 저널이 이 건수를 넘으면 스냅샷으로 압축
+    EVENT_RECURRENCE_HORIZON_DAYS: int = 366  # 기간 끝(또는 시작)이 없는 조회에서 반복 일정을 펼칠 최대 일수
+    EVENT_TOMBSTONE_RETENTION_DAYS: int = 30  # 삭제 기록(변경 목록에서 삭제를 알리는 용도) 보관 기간
+    EVENT_TOMBSTONE_PURGE_INTERVAL: int = 3600  # 삭제 기록을 정리하는 백그라운드 작업 주기 (초)
+    EVENT_PARTITION_MAX_OPEN: int = 64  # 동시에 열어 둘 사용자별 저장소 수 (넘으면 오래 쓰이지 않은 것부터 닫음)
+    EVENT_PARTITION_IDLE_SECONDS: int = 600  # 이 시간(초) 동안 쓰이지 않은 사용자별 저장소는 닫음
+    EVENT_STREAM_CHUNK_SIZE: int = 1000  # 내보내기/가져오기에서 한 번에 처리할 일정 수
+
     # TTS 설정 (향후 음성 응답을 위해)
     TTS_ENABLED: bool = False
     TTS_VOICE: str = "ko-KR-Wavenet-A"
@@ -1,13 +1,37 @@
+from contextlib import asynccontextmanager
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import get_settings
 from app.api.calendar import router as calendar_router
+from app.services.event_partitions import EventStoragePartitions
+from app.services.llm_service import LLMService
 
 settings = get_settings()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 일정 저장소는 사용자(세션)별로 나뉘며, 각 저장소는 처음 요청이 올 때 불러옵니다
+    app.state.event_storage = EventStoragePartitions()
+    # 쓰이지 않는 사용자 저장소 닫기와 보관 기간이 지난 삭제 기록 정리는 요청 처리와 별도로 백그라운드에서 처리
+    maintenance = asyncio.create_task(app.state.event_storage.run_maintenance())
+    # OpenAI 클라이언트와 워크플로우는 한 번만 만들어 모든 요청이 공유
+    try:
+        app.state.llm_service = LLMService()
+    except Exception as e:
+        # API 키가 없어도 일정 API는 동작하도록 AI 기능만 비활성화
+        print(f"⚠️ LLM 서비스를 시작하지 못했습니다: {str(e)}")
+        app.state.llm_service = None
+    yield
+    maintenance.cancel()
+    if app.state.llm_service is not None:
+        await app.state.llm_service.close()
+    app.state.event_storage.close()
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan
 )
 
 # CORS 미들웨어 설정
@@ -0,0 +1,36 @@
+import os
+import threading
+import time
+
+# Crockford Base32 (I, L, O, U 제외)
+_ENCODING = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_RANDOM_BITS = 80
+_RANDOM_MAX = (1 << _RANDOM_BITS) - 1
+
+_lock = threading.Lock()
+_last_ms = -1
+_last_random = 0
+
+def _encode(value: int, length: int) -> str:
+    chars = []
+    for _ in range(length):
+        value, remainder = divmod(value, 32)
+        chars.append(_ENCODING[remainder])
+    return "".join(reversed(chars))
+
+def generate_event_id() -> str:
+    """ULID 형식(26자)의 일정 id를 생성합니다.
+
+    앞 48비트는 밀리초 단위 시각, 뒤 80비트는 난수이므로 여러 프로세스가 동시에 만들어도 겹치지 않고,
+    같은 밀리초 안에서는 난수 부분을 1씩 증가시켜 생성 순서대로 정렬됩니다.
+    """
+    global _last_ms, _last_random
+    with _lock:
+        now_ms = int(time.time() * 1000)
+        if now_ms <= _last_ms and _last_random < _RANDOM_MAX:
+            now_ms = _last_ms
+            _last_random += 1
+        else:
+            _last_random = int.from_bytes(os.urandom(10), "big")
+        _last_ms = now_ms
+        return _encode(now_ms, 10) + _encode(_last_random, 16)
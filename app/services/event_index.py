@@ -0,0 +1,256 @@
+from typing import List, Dict, Any, Optional, Tuple, Set, Iterable, Iterator, Callable
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, defaultdict
+import heapq
+from datetime import datetime, timedelta, timezone
+import calendar
+
+KST = timezone(timedelta(hours=9))
+SECONDS_PER_DAY = 86400
+SEARCH_FIELDS = ("title", "description", "location")
+
+def to_epoch(value: Optional[str], is_end: bool = False) -> Optional[int]:
+    """ISO 날짜/시간 문자열을 한국 시간 기준 epoch 초로 변환합니다.
+
+    날짜만 있는 종료 값("2025-06-20")은 그날 하루 전체를 포함하도록 다음날 0시로 계산합니다.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(KST).replace(tzinfo=None)
+
+    epoch = calendar.timegm(parsed.timetuple())
+    if is_end and len(value) == 10:
+        epoch += SECONDS_PER_DAY
+    return epoch
+
+def spans_overlap(start: int, end: int, other_start: int, other_end: int) -> bool:
+    """두 [시작, 종료) 구간이 겹치는지 판단합니다.
+
+    길이가 0인 일정(시작 = 종료)은 그 시각 한 점을 차지하는 것으로 보므로, 시작이 같은 일정이나
+    그 시각을 포함하는 일정과 겹칩니다. 인덱스, 스윕, SQLite 조회가 모두 이 규칙을 따릅니다.
+    """
+    return start == other_start or (start < other_end and other_start < end)
+
+def sweep_conflicts(entries: Iterable[Tuple[int, int, Any]]) -> List[Tuple[Any, Any]]:
+    """시작 시각 순으로 정렬된 (시작, 종료, 일정) 목록에서 서로 겹치는 모든 일정 쌍을 찾습니다.
+
+    스윕 라인 방식으로 진행 중인 일정을 종료 시각 기준 힙에 유지하므로 O(n log n + k)입니다.
+    """
+    conflicts = []
+    active: List[Tuple[int, int, int, Any]] = []  # (종료, 시작, 순번, 일정)
+    for order, (start, end, event) in enumerate(entries):
+        # 시작이 같은 일정은 길이가 0이어도 겹치므로 남겨 둠 (같은 시작의 일정 순서와 무관하게 같은 결과)
+        while active and active[0][0] <= start and active[0][1] < start:
+            heapq.heappop(active)
+        for other_end, other_start, _, other in active:
+            if spans_overlap(other_start, other_end, start, end):
+                conflicts.append((other, event))
+        heapq.heappush(active, (end, start, order, event))
+    return conflicts
+
+class EventTimeIndex:
+    """시작 시각으로 정렬된 배열 기반의 일정 기간 인덱스
+
+    기간 조회는 이진 탐색으로 시작 위치를 찾은 뒤 범위 안의 일정만 확인하므로
+    전체 일정 수와 무관하게 O(log n + k)로 동작합니다.
+    겹침 조회는 현재 색인된 가장 긴 일정 길이만큼 앞에서부터 확인합니다.
+    일정 본문은 저장하지 않고 id와 구간만 보관하며, 조회 결과도 id로 반환합니다.
+    """
+
+    def __init__(self):
+        self._keys: List[Tuple[int, str]] = []  # (시작, id) 정렬 배열
+        self._spans: Dict[str, Tuple[int, int]] = {}
+        self._span_lengths: Counter = Counter()  # 일정 길이(초) -> 일정 수. 가장 긴 일정이 삭제되면 다음 길이로 줄이기 위해 사용
+        self._max_span = 0  # 가장 긴 일정의 길이(초)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def rebuild(self, spans: Iterable[Tuple[str, Optional[Tuple[int, int]]]]):
+        """(id, 구간) 목록으로 인덱스를 다시 만듭니다. 구간이 None인 일정은 제외합니다."""
+        self._spans = {event_id: span for event_id, span in spans if span is not None}
+        self._keys = sorted((start, event_id) for event_id, (start, _) in self._spans.items())
+        self._span_lengths = Counter(end - start for start, end in self._spans.values())
+        self._max_span = max(self._span_lengths, default=0)
+
+    def add(self, event_id: str, span: Optional[Tuple[int, int]]):
+        """일정을 인덱스에 추가합니다."""
+        if span is None:
+            return
+        self._spans[event_id] = span
+        insort(self._keys, (span[0], event_id))
+        self._span_lengths[span[1] - span[0]] += 1
+        self._max_span = max(self._max_span, span[1] - span[0])
+
+    def remove(self, event_id: str):
+        """일정을 인덱스에서 제거합니다."""
+        span = self._spans.pop(event_id, None)
+        if span is None:
+            return
+        position = bisect_left(self._keys, (span[0], event_id))
+        del self._keys[position]
+
+        length = span[1] - span[0]
+        self._span_lengths[length] -= 1
+        if not self._span_lengths[length]:
+            del self._span_lengths[length]
+            if length == self._max_span:
+                # 서로 다른 길이 수만큼만 확인 (일정 수보다 훨씬 적음)
+                self._max_span = max(self._span_lengths, default=0)
+
+    def update(self, event_id: str, span: Optional[Tuple[int, int]]):
+        """수정된 일정의 기간을 다시 반영합니다."""
+        self.remove(event_id)
+        self.add(event_id, span)
+
+    def contains(self, event_id: str, start: Optional[int] = None, end: Optional[int] = None) -> bool:
+        """일정이 [start, end] 기간 안에 완전히 포함되는지 확인합니다."""
+        span = self._spans.get(event_id)
+        if span is None:
+            return False
+        if start is not None and span[0] < start:
+            return False
+        if end is not None and span[1] > end:
+            return False
+        return True
+
+    def within(self, start: Optional[int] = None, end: Optional[int] = None) -> List[str]:
+        """[start, end] 기간 안에 완전히 포함되는 일정 id를 시작 시각 순으로 반환합니다."""
+        return [event_id for _, event_id in self.iter_within(start, end)]
+
+    def iter_within(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        after: Optional[Tuple[int, str]] = None
+    ) -> Iterator[Tuple[int, str]]:
+        """[start, end] 기간 안에 완전히 포함되는 일정을 (시작, id) 순으로 하나씩 반환합니다.
+
+        after가 주어지면 그 키 다음부터 시작하므로, 페이지 단위 조회에서 필요한 만큼만 훑습니다.
+        """
+        lo = 0 if start is None else bisect_left(self._keys, (start, ""))
+        if after is not None:
+            lo = max(lo, bisect_right(self._keys, after))
+        hi = len(self._keys) if end is None else bisect_left(self._keys, (end + 1, ""))
+
+        for position in range(lo, hi):
+            key = self._keys[position]
+            if end is not None and self._spans[key[1]][1] > end:
+                continue
+            yield key
+
+    def span_of(self, event_id: str) -> Optional[Tuple[int, int]]:
+        """색인된 일정의 [시작, 종료) 구간을 반환합니다."""
+        return self._spans.get(event_id)
+
+    def overlapping_entries(self, start: int, end: int) -> List[Tuple[int, int, str]]:
+        """[start, end) 구간과 겹치는 일정을 (시작, 종료, id)로 시작 시각 순으로 반환합니다."""
+        lo = bisect_left(self._keys, (start - self._max_span, ""))
+        # 길이가 0인 구간도 같은 시각에 시작하는 일정과 겹침 (spans_overlap)
+        hi = bisect_left(self._keys, (max(end, start + 1), ""))
+
+        entries = []
+        for event_start, event_id in self._keys[lo:hi]:
+            event_end = self._spans[event_id][1]
+            if spans_overlap(event_start, event_end, start, end):
+                entries.append((event_start, event_end, event_id))
+        return entries
+
+    def overlapping(self, start: int, end: int) -> List[str]:
+        """[start, end) 구간과 겹치는 일정 id를 시작 시각 순으로 반환합니다."""
+        return [event_id for _, _, event_id in self.overlapping_entries(start, end)]
+
+def _ngrams(text: str) -> Set[str]:
+    """검색용 1글자/2글자 n-gram 집합을 만듭니다."""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+class EventTextIndex:
+    """문자 n-gram 기반 일정 역색인
+
+    한국어는 조사가 붙거나 띄어쓰기가 제각각이라 단어 단위 색인으로는 부분 검색이 어렵기 때문에
+    1~2글자 n-gram으로 후보를 좁힌 뒤, 후보 일정의 본문에서 부분 문자열을 확인합니다.
+    일정은 Event 모델이며, 본문은 보관하지 않으므로 제거/수정 시에는 이전 일정을, 검색 시에는 일정을 읽어 올 함수를 받습니다.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        self._sequence_of: Dict[str, int] = {}  # id -> 추가 순서
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._sequence_of)
+
+    def rebuild(self, events: Iterable[Any]):
+        """전체 일정으로 색인을 다시 만듭니다."""
+        self._postings = defaultdict(set)
+        self._sequence_of = {}
+        self._sequence = 0
+        for event in events:
+            self.add(event)
+
+    def add(self, event: Any):
+        """일정을 색인에 추가합니다."""
+        event_id = event.id
+        self._sequence += 1
+        self._sequence_of[event_id] = self._sequence
+        for gram in _ngrams(event.search_text()):
+            self._postings[gram].add(event_id)
+
+    def remove(self, event: Any):
+        """일정을 색인에서 제거합니다."""
+        event_id = event.id
+        if self._sequence_of.pop(event_id, None) is None:
+            return
+        for gram in _ngrams(event.search_text()):
+            postings = self._postings.get(gram)
+            if postings is not None:
+                postings.discard(event_id)
+                if not postings:
+                    del self._postings[gram]
+
+    def update(self, old_event: Any, event: Any):
+        """수정된 일정의 본문을 다시 색인합니다. 추가 순서는 유지합니다."""
+        sequence = self._sequence_of.get(old_event.id)
+        self.remove(old_event)
+        self.add(event)
+        if sequence is not None:
+            self._sequence_of[event.id] = sequence
+
+    def search(self, query: str, load: Callable[[str], Any]) -> List[Any]:
+        """제목/설명/장소에 검색어가 포함된 일정을 추가된 순서대로 반환합니다.
+
+        load는 id로 일정을 읽어 오는 함수이며, n-gram으로 좁힌 후보에 대해서만 호출됩니다.
+        """
+        query = query.lower()
+        if not query:
+            ordered = sorted(self._sequence_of, key=self._sequence_of.__getitem__)
+            return [load(event_id) for event_id in ordered]
+
+        if len(query) == 1:
+            grams = {query}
+        else:
+            grams = {query[i:i + 2] for i in range(len(query) - 1)}
+
+        postings = []
+        for gram in grams:
+            ids = self._postings.get(gram)
+            if not ids:
+                return []
+            postings.append(ids)
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+
+        matches = []
+        for event_id in sorted(candidates, key=self._sequence_of.__getitem__):
+            event = load(event_id)
+            if query in event.search_text():
+                matches.append(event)
+        return matches
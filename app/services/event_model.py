@@ -0,0 +1,207 @@
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime
+import time
+from app.services.event_index import SECONDS_PER_DAY, SEARCH_FIELDS, to_epoch
+
+# 날짜가 없는 일정의 정렬 키. 목록과 페이지 커서에서 날짜가 있는 일정 뒤에 놓임
+UNDATED_SORT_KEY = (1 << 63) - 1
+
+_DATE_FORMAT = "%Y-%m-%d"
+_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+def format_epoch(epoch: int, date_only: bool = False) -> str:
+    """한국 시간 기준 epoch 초를 ISO 날짜/시간 문자열로 변환합니다."""
+    return time.strftime(_DATE_FORMAT if date_only else _DATETIME_FORMAT, time.gmtime(epoch))
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    if value is None or isinstance(value, (int, float)):
+        return value
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+def _text(value: Any) -> str:
+    """텍스트 필드(제목/설명/장소) 값을 문자열로 맞춥니다. 숫자 등이 들어와도 검색 본문을 만들 수 있도록 함"""
+    if value is None or isinstance(value, str):
+        return value or ""
+    return str(value)
+
+def _format_timestamp(value: Optional[float]) -> Optional[str]:
+    return None if value is None else datetime.fromtimestamp(value).isoformat()
+
+class EventVersionConflict(Exception):
+    """수정하려는 일정의 버전이 요청한 버전과 다를 때 발생합니다. (다른 요청이 먼저 수정함)"""
+
+    def __init__(self, event_id: str, current_version: int):
+        super().__init__(f"일정이 이미 수정되었습니다: {event_id} (현재 버전 {current_version})")
+        self.event_id = event_id
+        self.current_version = current_version
+
+class Event:
+    """저장소, LLM 워크플로우, API가 함께 쓰는 일정 모델
+
+    시작/종료 시각은 한국 시간 기준 epoch 초로 한 번만 파싱해 두고([start, end)),
+    종일 일정(all_day)은 날짜만 있는 형식으로 다시 변환합니다.
+    딕셔너리는 JSON 응답이나 저널처럼 외부와 주고받을 때만 to_dict()/from_dict()로 만듭니다.
+    version은 일정을 마지막으로 바꾼 변경 번호로, 저장소가 조회/수정 결과에 채워 주며 파일에는 저장하지 않습니다.
+    """
+
+    __slots__ = (
+        "id", "title", "description", "location", "start", "end", "all_day",
+        "timezone", "attendees", "created_at", "updated_at", "extra", "version"
+    )
+
+    # 모델 필드로 따로 저장하는 키. 나머지 키는 extra에 그대로 보관
+    _FIELDS = frozenset((
+        "id", "title", "description", "location", "start_date", "end_date",
+        "timezone", "attendees", "created_at", "updated_at"
+    ))
+
+    def __init__(
+        self,
+        id: Optional[str] = None,
+        title: str = "",
+        description: str = "",
+        location: str = "",
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        all_day: bool = False,
+        timezone: Optional[str] = None,
+        attendees: Optional[List[str]] = None,
+        created_at: Optional[float] = None,
+        updated_at: Optional[float] = None,
+        extra: Optional[Dict[str, Any]] = None
+    ):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.location = location
+        self.start = start
+        self.end = end
+        self.all_day = all_day
+        self.timezone = timezone
+        self.attendees = attendees
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.extra = extra
+        self.version: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Event":
+        """API/저널 형식의 일정 딕셔너리를 모델로 변환합니다. 날짜는 여기서 한 번만 파싱합니다."""
+        start_date = data.get("start_date")
+        start = to_epoch(start_date)
+        end = None
+        if start is not None:
+            end = to_epoch(data.get("end_date") or start_date, is_end=True)
+            if end is None or end < start:
+                end = start
+
+        extra = {key: value for key, value in data.items() if key not in cls._FIELDS}
+        # 해석할 수 없는 날짜(또는 시작 없이 들어온 종료 날짜)는 버리지 않고 받은 그대로 extra에 보관
+        if start_date is not None and start is None:
+            extra["start_date"] = start_date
+        end_date = data.get("end_date")
+        if end_date is not None and (start is None or to_epoch(end_date, is_end=True) is None):
+            extra["end_date"] = end_date
+        return cls(
+            id=data.get("id"),
+            title=_text(data.get("title")),
+            description=_text(data.get("description")),
+            location=_text(data.get("location")),
+            start=start,
+            end=end,
+            all_day=isinstance(start_date, str) and len(start_date) == 10,
+            timezone=data.get("timezone"),
+            attendees=data.get("attendees"),
+            created_at=_parse_timestamp(data.get("created_at")),
+            updated_at=_parse_timestamp(data.get("updated_at")),
+            extra=extra or None
+        )
+
+    @classmethod
+    def from_extracted_info(cls, info: Dict[str, Any]) -> "Event":
+        """LLM이 추출한 정보(날짜와 "HH:MM" 시각이 나뉜 형식)를 모델로 변환합니다.
+
+        종료 시각이 없으면 시작 1시간 후로 설정합니다. 나머지 키(알림, 반복 등)는 extra에 보관합니다.
+        """
+        data = {key: value for key, value in info.items() if key not in ("start_time", "end_time", "all_day")}
+        all_day = info.get("all_day", False)
+        start_time = None if all_day else info.get("start_time")
+        end_time = None if all_day else info.get("end_time")
+        start_date = info.get("start_date")
+        end_date = info.get("end_date") or start_date
+        if start_date and start_time:
+            data["start_date"] = f"{start_date}T{start_time}:00"
+        if end_date and end_time:
+            data["end_date"] = f"{end_date}T{end_time}:00"
+        elif start_time:
+            data["end_date"] = None
+
+        event = cls.from_dict(data)
+        if start_time and not end_time and event.start is not None:
+            event.end = event.start + 3600
+        return event
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON으로 내보낼 일정 딕셔너리를 만듭니다."""
+        data: Dict[str, Any] = {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "location": self.location,
+        }
+        if self.start is not None:
+            data["start_date"] = format_epoch(self.start, self.all_day)
+            # 종일 일정의 종료는 다음날 0시로 저장되어 있으므로 마지막 날짜로 되돌림
+            end = self.end - SECONDS_PER_DAY if self.all_day and self.end > self.start else self.end
+            data["end_date"] = format_epoch(end, self.all_day)
+        if self.timezone is not None:
+            data["timezone"] = self.timezone
+        if self.attendees is not None:
+            data["attendees"] = self.attendees
+        if self.extra:
+            # 해석하지 못한 원래 날짜 문자열이 있으면 그 값을 그대로 돌려줌
+            data.update(self.extra)
+        data["created_at"] = _format_timestamp(self.created_at)
+        data["updated_at"] = _format_timestamp(self.updated_at)
+        return data
+
+    def to_record(self) -> tuple:
+        """스냅샷 직렬화용 튜플을 반환합니다."""
+        return (
+            self.id, self.title, self.description, self.location, self.start, self.end, self.all_day,
+            self.timezone, self.attendees, self.created_at, self.updated_at, self.extra
+        )
+
+    @classmethod
+    def from_record(cls, record: tuple) -> "Event":
+        """to_record()로 만든 튜플에서 모델을 복원합니다."""
+        return cls(*record)
+
+    def copy(self) -> "Event":
+        """얕은 복사본을 반환합니다."""
+        return Event.from_record(self.to_record())
+
+    def span(self) -> Optional[Tuple[int, int]]:
+        """일정의 [시작, 종료) 구간을 반환합니다. 날짜가 없으면 None."""
+        return None if self.start is None else (self.start, self.end)
+
+    def sort_key(self) -> Tuple[int, str]:
+        """목록 정렬과 페이지 커서에 쓰는 (시작 시각, id)를 반환합니다."""
+        return (UNDATED_SORT_KEY if self.start is None else self.start, self.id)
+
+    def search_text(self) -> str:
+        """검색 대상 필드(제목/설명/장소)를 소문자로 이어 붙인 본문을 반환합니다."""
+        return "\n".join(getattr(self, field) or "" for field in SEARCH_FIELDS).lower()
+
+    def updated(self, changes: Dict[str, Any]) -> "Event":
+        """변경 내용을 반영한 새 일정을 반환합니다. 원본은 바꾸지 않습니다."""
+        event = Event.from_dict({**self.to_dict(), **changes})
+        event.id = self.id
+        event.created_at = self.created_at
+        return event
+
+    def __repr__(self) -> str:
+        return f"Event(id={self.id!r}, title={self.title!r}, start={self.start!r}, end={self.end!r})"
@@ -0,0 +1,188 @@
+from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+import asyncio
+import re
+import threading
+import time
+from app.core.config import get_settings
+from app.services.event_storage_service import create_event_storage
+
+settings = get_settings()
+
+DEFAULT_TENANT = "default"
+# 디렉터리가 없는 사용자의 조회에 쓰는 빈 저장소. 사용자 id 형식에 맞지 않으므로 요청으로는 지정할 수 없음
+_EMPTY_TENANT = ".empty"
+_TENANT_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+class EventStoragePartitions:
+    """사용자(세션)별로 나뉜 일정 저장소 모음
+
+    사용자마다 별도 디렉터리(EVENT_STORAGE_DIR/tenants/<id>)에 저장소를 두므로
+    파일, 잠금, 인덱스, 쓰기 스레드가 모두 분리되어 한 사용자의 쓰기가 다른 사용자의 조회를 막지 않습니다.
+    각 저장소는 처음 접근할 때 불러옵니다. 기본 사용자는 기존 데이터를 그대로 쓰도록 EVENT_STORAGE_DIR을 사용합니다.
+
+    디렉터리는 쓰기 요청에서만 만들고, 아직 없는 사용자의 조회는 공용 빈 저장소로 응답합니다.
+    열어 둔 저장소는 EVENT_PARTITION_MAX_OPEN개를 넘거나 EVENT_PARTITION_IDLE_SECONDS 동안 쓰이지 않으면
+    오래된 것부터 닫습니다(LRU). 요청이 사용 중인(acquire 후 release 전) 저장소는 닫지 않습니다.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[str] = None,
+        storage_dir: Optional[str] = None,
+        max_open: Optional[int] = None,
+        idle_seconds: Optional[float] = None
+    ):
+        self.backend = backend
+        self.storage_dir = Path(storage_dir or settings.EVENT_STORAGE_DIR)
+        self.max_open = max_open if max_open is not None else settings.EVENT_PARTITION_MAX_OPEN
+        self.idle_seconds = idle_seconds if idle_seconds is not None else settings.EVENT_PARTITION_IDLE_SECONDS
+        # 사용자 id → 저장소 (마지막 사용 순), 마지막 사용 시각, 사용 중인 요청 수
+        self._partitions: "OrderedDict[str, object]" = OrderedDict()
+        self._last_used: Dict[str, float] = {}
+        self._leases: Dict[str, int] = {}
+        self._lock = threading.Lock()  # 저장소 목록 관리에만 사용. 조회/쓰기는 각 저장소의 잠금을 사용
+
+    def _partition_dir(self, tenant_id: str) -> Path:
+        if tenant_id == DEFAULT_TENANT:
+            return self.storage_dir
+        if tenant_id == _EMPTY_TENANT:
+            return self.storage_dir / "tenants" / _EMPTY_TENANT
+        return self.storage_dir / "tenants" / tenant_id
+
+    def acquire(self, tenant_id: Optional[str] = None, create: bool = True) -> Tuple[str, object]:
+        """사용자의 일정 저장소를 (사용자 id, 저장소)로 반환합니다. 사용이 끝나면 반드시 release(사용자 id)를 호출해야 합니다.
+
+        create가 False이고 사용자의 디렉터리가 없으면 새로 만들지 않고 공용 빈 저장소를 반환합니다.
+        """
+        tenant_id = tenant_id or DEFAULT_TENANT
+        if not _TENANT_ID_PATTERN.match(tenant_id):
+            raise ValueError(f"사용할 수 없는 사용자 id입니다: {tenant_id!r}")
+        if not create and tenant_id != DEFAULT_TENANT and tenant_id not in self._partitions \
+                and not self._partition_dir(tenant_id).exists():
+            tenant_id = _EMPTY_TENANT
+
+        with self._lock:
+            storage = self._partitions.get(tenant_id)
+            if storage is None:
+                # 저장소 생성 중에는 다른 사용자의 요청도 기다리지만, 첫 접근에서 한 번뿐
+                storage = create_event_storage(self.backend, str(self._partition_dir(tenant_id)))
+                self._partitions[tenant_id] = storage
+                print(f"✅ 일정 저장소 로드: {tenant_id}")
+            self._partitions.move_to_end(tenant_id)
+            self._last_used[tenant_id] = time.monotonic()
+            self._leases[tenant_id] = self._leases.get(tenant_id, 0) + 1
+            evicted = self._collect_evictions()
+        self._close_evicted(evicted)
+        return tenant_id, storage
+
+    def release(self, tenant_id: str):
+        """acquire로 받은 저장소의 사용이 끝났음을 알립니다."""
+        with self._lock:
+            self._last_used[tenant_id] = time.monotonic()
+            count = self._leases.get(tenant_id, 0) - 1
+            if count > 0:
+                self._leases[tenant_id] = count
+            else:
+                self._leases.pop(tenant_id, None)
+
+    @contextmanager
+    def lease(self, tenant_id: Optional[str] = None, create: bool = True):
+        """with 블록 동안 사용자의 일정 저장소를 닫히지 않게 빌려 줍니다."""
+        tenant_id, storage = self.acquire(tenant_id, create)
+        try:
+            yield storage
+        finally:
+            self.release(tenant_id)
+
+    def _collect_evictions(self) -> List[Tuple[str, object]]:
+        """닫을 저장소를 목록에서 빼서 반환합니다. self._lock을 잡은 상태에서 호출해야 합니다."""
+        cutoff = time.monotonic() - self.idle_seconds
+        evicted = []
+        excess = len(self._partitions) - self.max_open
+        for tenant_id in list(self._partitions):
+            idle = self._last_used.get(tenant_id, 0) < cutoff
+            if excess <= 0 and not idle:
+                break  # 마지막 사용 순이므로 이후 저장소는 모두 최근에 사용됨
+            if tenant_id in (DEFAULT_TENANT, _EMPTY_TENANT) or self._leases.get(tenant_id):
+                continue
+            evicted.append((tenant_id, self._partitions.pop(tenant_id)))
+            self._last_used.pop(tenant_id, None)
+            excess -= 1
+        return evicted
+
+    def _close_evicted(self, evicted: List[Tuple[str, object]]):
+        # 대기 중인 쓰기를 마치느라 오래 걸릴 수 있으므로 self._lock 밖에서 닫음
+        for tenant_id, storage in evicted:
+            try:
+                storage.close()
+                print(f"🧹 사용하지 않는 일정 저장소 닫음: {tenant_id}")
+            except Exception as e:
+                print(f"❌ 일정 저장소 닫기 중 오류 발생 ({tenant_id}): {str(e)}")
+
+    def evict_idle(self) -> int:
+        """오래 쓰이지 않았거나 개수 제한을 넘은 저장소를 닫고, 닫은 개수를 반환합니다."""
+        with self._lock:
+            evicted = self._collect_evictions()
+        self._close_evicted(evicted)
+        return len(evicted)
+
+    def loaded(self) -> Dict[str, object]:
+        """지금 열려 있는 저장소를 반환합니다."""
+        return dict(self._partitions)
+
+    @contextmanager
+    def _lease_loaded(self):
+        """열려 있는 모든 저장소를 with 블록 동안 닫히지 않게 빌려 줍니다."""
+        with self._lock:
+            partitions = list(self._partitions.items())
+            for tenant_id, _ in partitions:
+                self._leases[tenant_id] = self._leases.get(tenant_id, 0) + 1
+        try:
+            yield partitions
+        finally:
+            with self._lock:
+                for tenant_id, _ in partitions:
+                    count = self._leases.get(tenant_id, 0) - 1
+                    if count > 0:
+                        self._leases[tenant_id] = count
+                    else:
+                        self._leases.pop(tenant_id, None)
+
+    def purge_tombstones(self) -> int:
+        """열려 있는 모든 저장소에서 보관 기간이 지난 삭제 기록을 정리합니다. 닫혀 있던 저장소는 다시 열린 뒤의 주기에 정리됩니다."""
+        purged = 0
+        with self._lease_loaded() as partitions:
+            for tenant_id, storage in partitions:
+                try:
+                    purged += storage.purge_tombstones()
+                except Exception as e:
+                    print(f"❌ 삭제 기록 정리 중 오류 발생 ({tenant_id}): {str(e)}")
+        return purged
+
+    async def run_maintenance(self, interval: Optional[float] = None):
+        """쓰이지 않는 저장소를 닫고 주기적으로(interval초) 삭제 기록을 정리하는 백그라운드 작업.
+        요청 처리와 겹치지 않도록 별도 스레드에서 실행합니다."""
+        interval = interval or settings.EVENT_TOMBSTONE_PURGE_INTERVAL
+        last_purge = time.monotonic()
+        while True:
+            await asyncio.sleep(max(1, min(interval, self.idle_seconds)))
+            await asyncio.to_thread(self.evict_idle)
+            if time.monotonic() - last_purge >= interval:
+                last_purge = time.monotonic()
+                await asyncio.to_thread(self.purge_tombstones)
+
+    def flush(self):
+        with self._lease_loaded() as partitions:
+            for _, storage in partitions:
+                storage.flush()
+
+    def close(self):
+        """열려 있는 저장소의 대기 중인 쓰기를 마치고 모두 닫습니다."""
+        with self._lock:
+            partitions, self._partitions = self._partitions, OrderedDict()
+            self._last_used.clear()
+        for storage in partitions.values():
+            storage.close()
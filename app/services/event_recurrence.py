@@ -0,0 +1,165 @@
+from typing import List, Dict, Optional, Tuple, Iterable, Iterator
+from collections import OrderedDict
+from datetime import datetime
+import calendar
+import time
+from app.services.event_index import KST, SECONDS_PER_DAY, spans_overlap, to_epoch
+from app.services.event_model import Event
+
+# LLM 추출 결과(get_default_event_info)와 같은 반복 필드 이름을 사용
+REPEAT_TYPES = ("daily", "weekly", "monthly", "yearly")
+RECURRENCE_CACHE_SIZE = 64  # 캐시할 조회 기간 수
+
+class RecurrenceRule:
+    """반복 규칙 (repeat_type / repeat_interval / repeat_count / repeat_until)
+
+    발생 일정은 미리 펼쳐 두지 않고, 요청한 기간에 걸치는 것만 계산합니다.
+    매일/매주 반복은 기간 시작 위치로 바로 건너뛰므로 첫 발생일부터 순회하지 않습니다.
+    """
+
+    __slots__ = ("freq", "interval", "count", "until")
+
+    def __init__(self, freq: str, interval: int = 1, count: Optional[int] = None, until: Optional[int] = None):
+        self.freq = freq
+        self.interval = max(1, interval)
+        self.count = count
+        self.until = until  # 이 시각 이전에 시작하는 발생 일정만 포함 (epoch, 미포함)
+
+    @classmethod
+    def from_event(cls, event: Event) -> Optional["RecurrenceRule"]:
+        """일정의 반복 필드로 규칙을 만듭니다. 반복 일정이 아니면 None."""
+        extra = event.extra or {}
+        freq = extra.get("repeat_type")
+        if freq not in REPEAT_TYPES or event.start is None:
+            return None
+        try:
+            interval = int(extra.get("repeat_interval") or 1)
+            count = int(extra["repeat_count"]) if extra.get("repeat_count") else None
+        except (TypeError, ValueError):
+            return None
+        return cls(freq, interval, count, to_epoch(extra.get("repeat_until"), is_end=True))
+
+    def occurrences(self, start: int, end: int, window_start: int, window_end: int) -> Iterator[Tuple[int, int]]:
+        """[start, end) 일정의 발생 중 [window_start, window_end) 구간에 걸치는 것을 시작 시각 순으로 반환합니다."""
+        duration = end - start
+        for occurrence_start in self._starts(start, duration, window_start):
+            if occurrence_start >= max(window_end, window_start + 1):
+                return
+            if self.until is not None and occurrence_start >= self.until:
+                return
+            occurrence_end = occurrence_start + duration
+            if spans_overlap(occurrence_start, occurrence_end, window_start, window_end):
+                yield occurrence_start, occurrence_end
+
+    def _starts(self, start: int, duration: int, window_start: int) -> Iterator[int]:
+        if self.freq in ("daily", "weekly"):
+            step = self.interval * SECONDS_PER_DAY * (7 if self.freq == "weekly" else 1)
+            # 기간 시작 직전의 발생 일정으로 바로 이동 (매일 반복도 O(기간 안의 발생 수))
+            index = max(0, (window_start - duration - start) // step)
+            while self.count is None or index < self.count:
+                yield start + index * step
+                index += 1
+            return
+
+        step_months = self.interval * (12 if self.freq == "yearly" else 1)
+        year, month, day, hour, minute, second = time.gmtime(start)[:6]
+        index = 0
+        if self.count is None:
+            # 한 달은 31일 이하이므로 경과 개월 수의 하한으로 건너뜀
+            elapsed_months = max(0, (window_start - duration - start) // (31 * SECONDS_PER_DAY))
+            index = max(0, elapsed_months // step_months - 1)
+
+        produced = 0
+        while self.count is None or produced < self.count:
+            months = month - 1 + index * step_months
+            occurrence_year, occurrence_month = year + months // 12, months % 12 + 1
+            index += 1
+            # 해당 월에 없는 날짜(예: 31일, 2월 29일)는 건너뜀 (RFC 5545와 동일)
+            if day > calendar.monthrange(occurrence_year, occurrence_month)[1]:
+                continue
+            produced += 1
+            yield calendar.timegm((occurrence_year, occurrence_month, day, hour, minute, second))
+
+def recurrence_window(start: Optional[int], end: Optional[int], horizon_days: int) -> Tuple[int, int]:
+    """반복 일정을 펼칠 [시작, 종료) 구간을 정합니다.
+
+    한쪽 경계가 없으면 다른 쪽에서 horizon_days 만큼으로 제한하고, 둘 다 없으면 오늘부터 시작합니다.
+    """
+    horizon = horizon_days * SECONDS_PER_DAY
+    if start is None and end is None:
+        start = to_epoch(datetime.now(KST).date().isoformat())
+    if start is None:
+        start = end - horizon
+    if end is None:
+        end = start + horizon
+    return start, end
+
+def make_occurrence(event: Event, start: int, end: int) -> Event:
+    """반복 일정의 발생 하나를 일정으로 만듭니다. id는 Google Calendar 인스턴스처럼 "원본id_시작시각" 형식입니다."""
+    occurrence = event.copy()
+    occurrence.id = f"{event.id}_{time.strftime('%Y%m%dT%H%M%S', time.gmtime(start))}"
+    occurrence.start = start
+    occurrence.end = end
+    occurrence.extra = {**(event.extra or {}), "recurring_event_id": event.id}
+    return occurrence
+
+class RecurrenceIndex:
+    """반복 일정의 첫 발생 구간과 규칙만 보관하고, 기간별 발생 목록을 캐시하는 인덱스
+
+    반복 일정이 추가/수정/삭제되면 캐시를 비웁니다.
+    """
+
+    def __init__(self, cache_size: int = RECURRENCE_CACHE_SIZE):
+        self._rules: Dict[str, Tuple[int, int, RecurrenceRule]] = {}
+        self._cache: "OrderedDict[Tuple[int, int], List[Tuple[int, int, str]]]" = OrderedDict()
+        self._cache_size = cache_size
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._rules
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rules)
+
+    def rebuild(self, entries: Iterable[Tuple[str, Tuple[int, int], RecurrenceRule]]):
+        """(id, 첫 발생 구간, 규칙) 목록으로 인덱스를 다시 만듭니다."""
+        self._rules = {event_id: (span[0], span[1], rule) for event_id, span, rule in entries}
+        self._cache.clear()
+
+    def add(self, event_id: str, span: Tuple[int, int], rule: RecurrenceRule):
+        self._rules[event_id] = (span[0], span[1], rule)
+        self._cache.clear()
+
+    def remove(self, event_id: str):
+        if self._rules.pop(event_id, None) is not None:
+            self._cache.clear()
+
+    def span_of(self, event_id: str) -> Optional[Tuple[int, int]]:
+        """첫 발생 구간을 반환합니다."""
+        entry = self._rules.get(event_id)
+        return (entry[0], entry[1]) if entry else None
+
+    def occurrences(self, window_start: int, window_end: int) -> List[Tuple[int, int, str]]:
+        """[window_start, window_end) 구간에 걸치는 모든 발생을 (시작, 종료, 원본 id)로 시작 시각 순으로 반환합니다."""
+        key = (window_start, window_end)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        occurrences = sorted(
+            (occurrence_start, occurrence_end, event_id)
+            for event_id, (start, end, rule) in self._rules.items()
+            for occurrence_start, occurrence_end in rule.occurrences(start, end, window_start, window_end)
+        )
+        self._cache[key] = occurrences
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return occurrences
+
+    def occurrences_of(self, event_id: str, window_start: int, window_end: int) -> List[Tuple[int, int]]:
+        """한 반복 일정의 발생 중 구간에 걸치는 것을 반환합니다."""
+        start, end, rule = self._rules[event_id]
+        return list(rule.occurrences(start, end, window_start, window_end))
@@ -0,0 +1,149 @@
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+from pathlib import Path
+from app.services.event_model import Event
+from app.services.event_recurrence import RecurrenceRule
+import json
+import mmap
+import os
+import struct
+
+# 일정 스냅샷 파일 형식
+#   헤더: SNAPSHOT_MAGIC (8바이트)[마지막 변경 번호 int64][정리된 마지막 삭제 기록의 변경 번호 int64]
+#   레코드: [본문 길이 uint32][시작 int64][종료 int64][id 길이 uint16][플래그 uint8][변경 번호 int64][id][본문] 의 반복 (LE)
+# 레코드 머리에 id, 기간, 플래그(반복 일정, 삭제 기록 여부), 변경 번호가 들어 있으므로 본문을 풀지 않고도 인덱스와 변경 목록을 만들 수 있습니다.
+# 본문은 Event.to_record() 필드 순서의 JSON 배열(UTF-8)이며, 삭제 기록(tombstone) 레코드의 본문은 삭제 시각(JSON 숫자)입니다.
+# 형식을 바꿀 때는 SNAPSHOT_MAGIC의 마지막 바이트(형식 버전)를 올립니다. 파이썬 버전과 무관하게 읽을 수 있습니다.
+SNAPSHOT_MAGIC = b"EVSNAP\x00\x01"
+_SNAPSHOT_HEADER = struct.Struct("<qq")
+_RECORD_HEADER = struct.Struct("<IqqHBq")
+NO_SPAN = -(1 << 63)  # 날짜가 없는 일정의 시작/종료 값
+RECORD_FLAG_RECURRING = 0x01
+RECORD_FLAG_TOMBSTONE = 0x02
+
+def encode_record(event: Event, seq: int = 0) -> bytes:
+    """일정 하나를 스냅샷 레코드로 직렬화합니다. seq는 일정을 마지막으로 바꾼 변경 번호입니다."""
+    event_id = event.id.encode("utf-8")
+    payload = _dump_payload(event.to_record())
+    span = event.span()
+    start, end = span if span is not None else (NO_SPAN, NO_SPAN)
+    flags = RECORD_FLAG_RECURRING if RecurrenceRule.from_event(event) else 0
+    return _RECORD_HEADER.pack(len(payload), start, end, len(event_id), flags, seq) + event_id + payload
+
+def encode_tombstone(event_id: str, seq: int, deleted_at: float) -> bytes:
+    """삭제된 일정의 삭제 기록을 스냅샷 레코드로 직렬화합니다."""
+    encoded_id = event_id.encode("utf-8")
+    payload = _dump_payload(deleted_at)
+    return _RECORD_HEADER.pack(
+        len(payload), NO_SPAN, NO_SPAN, len(encoded_id), RECORD_FLAG_TOMBSTONE, seq
+    ) + encoded_id + payload
+
+def _dump_payload(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def write_snapshot(path: Path, records: Iterable[bytes], last_seq: int = 0, deleted_seq: int = 0) -> List[int]:
+    """직렬화된 레코드들을 스냅샷 파일로 기록하고 fsync 한 뒤, 레코드마다 파일 안의 위치를 반환합니다.
+
+    last_seq는 마지막 변경 번호, deleted_seq는 정리되어 스냅샷에 남지 않은 마지막 삭제 기록의 변경 번호입니다.
+    """
+    offsets = []
+    position = len(SNAPSHOT_MAGIC) + _SNAPSHOT_HEADER.size
+    with open(path, 'wb') as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(_SNAPSHOT_HEADER.pack(last_seq, deleted_seq))
+        for record in records:
+            offsets.append(position)
+            f.write(record)
+            position += len(record)
+        f.flush()
+        os.fsync(f.fileno())
+    return offsets
+
+class SnapshotReader:
+    """스냅샷 파일을 메모리 매핑하여 필요한 레코드만 읽는 리더
+
+    파일 전체를 파싱하지 않고 레코드 머리만 훑어 (id, 위치, 기간, 플래그, 변경 번호)를 얻으며,
+    일정은 decode()를 호출할 때 해당 위치에서만 풀어냅니다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            self._mmap.close()
+            raise ValueError(f"일정 스냅샷 파일 형식이 아닙니다: {path}")
+        self.last_seq, self.deleted_seq = _SNAPSHOT_HEADER.unpack_from(self._mmap, len(SNAPSHOT_MAGIC))
+        self._records_offset = len(SNAPSHOT_MAGIC) + _SNAPSHOT_HEADER.size
+
+    def close(self):
+        self._mmap.close()
+
+    def scan(self) -> Iterator[Tuple[str, int, Optional[Tuple[int, int]], int, int]]:
+        """레코드마다 (id, 위치, 기간, 플래그, 변경 번호)를 반환합니다. 기간이 없으면 None."""
+        data = self._mmap
+        header = _RECORD_HEADER
+        size = len(data)
+        offset = self._records_offset
+        while offset + header.size <= size:
+            length, start, end, id_length, flags, seq = header.unpack_from(data, offset)
+            id_offset = offset + header.size
+            next_offset = id_offset + id_length + length
+            if next_offset > size:
+                # 스냅샷은 임시 파일에 쓴 뒤 교체하므로 정상적으로는 발생하지 않음
+                print(f"⚠️ 손상된 스냅샷 레코드를 건너뜁니다: {self.path}")
+                return
+            event_id = data[id_offset:id_offset + id_length].decode("utf-8")
+            yield event_id, offset, (None if start == NO_SPAN else (start, end)), flags, seq
+            offset = next_offset
+
+    def _payload(self, offset: int) -> Any:
+        length, _, _, id_length = _RECORD_HEADER.unpack_from(self._mmap, offset)[:4]
+        payload_offset = offset + _RECORD_HEADER.size + id_length
+        return json.loads(self._mmap[payload_offset:payload_offset + length])
+
+    def decode(self, offset: int) -> Event:
+        """해당 위치의 레코드를 일정으로 풀어냅니다."""
+        return Event.from_record(self._payload(offset))
+
+    def deleted_at(self, offset: int) -> float:
+        """해당 위치의 삭제 기록 레코드에서 삭제 시각을 읽습니다."""
+        return self._payload(offset)
+
+    def raw(self, offset: int, seq: Optional[int] = None) -> bytes:
+        """해당 위치의 레코드를 직렬화된 그대로 반환합니다. (스냅샷 재작성용)
+
+        seq가 주어지면 레코드 머리의 변경 번호만 바꿔서 반환합니다.
+        """
+        length, _, _, id_length = _RECORD_HEADER.unpack_from(self._mmap, offset)[:4]
+        record = self._mmap[offset:offset + _RECORD_HEADER.size + id_length + length]
+        if seq is None:
+            return record
+        record = bytearray(record)
+        fields = list(_RECORD_HEADER.unpack_from(record))
+        fields[5] = seq
+        _RECORD_HEADER.pack_into(record, 0, *fields)
+        return bytes(record)
+
+def import_json(path: Path) -> List[Dict[str, Any]]:
+    """JSON 배열 파일(이전 형식의 events.json 포함)에서 일정을 읽습니다."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def ndjson_line(event: Event) -> str:
+    """일정 하나를 NDJSON 한 줄로 만듭니다. (내보내기 형식)"""
+    return json.dumps(event.to_dict(), ensure_ascii=False) + "\n"
+
+def iter_ndjson(path: Path) -> Iterator[Dict[str, Any]]:
+    """NDJSON 파일에서 일정을 한 줄씩 읽습니다. 파일 전체를 메모리에 올리지 않습니다."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"NDJSON {line_number}번째 줄을 읽을 수 없습니다: {str(e)}") from e
+            if not isinstance(event, dict):
+                raise ValueError(f"NDJSON {line_number}번째 줄이 일정 객체가 아닙니다.")
+            yield event
@@ -1,88 +1,1244 @@
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple, Callable, Union, Set, Iterator, Iterable
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+import asyncio
+import heapq
+import itertools
 import json
 import os
+import threading
+import time
 from pathlib import Path
+from app.core.config import get_settings
+from app.services.event_id import generate_event_id
+from app.services.event_index import SECONDS_PER_DAY, EventTimeIndex, EventTextIndex, sweep_conflicts, to_epoch
+from app.services.event_model import UNDATED_SORT_KEY, Event, EventVersionConflict
+from app.services.file_lock import FileLock
+from app.services.event_recurrence import RecurrenceIndex, RecurrenceRule, make_occurrence, recurrence_window
+from app.services.event_snapshot import (
+    RECORD_FLAG_RECURRING, RECORD_FLAG_TOMBSTONE, SnapshotReader,
+    encode_record, encode_tombstone, write_snapshot, import_json
+)
+
+settings = get_settings()
+
+STORAGE_MODE_JSON = "json"
+STORAGE_MODE_JOURNAL = "journal"
+
+STORAGE_BACKEND_JSON = "json"
+STORAGE_BACKEND_SQLITE = "sqlite"
+
+def create_event_storage(backend: Optional[str] = None, storage_dir: Optional[str] = None):
+    """설정된 백엔드에 맞는 일정 저장소를 생성합니다."""
+    backend = backend or settings.EVENT_STORAGE_BACKEND
+    if backend == STORAGE_BACKEND_SQLITE:
+        from app.services.sqlite_event_storage_service import SQLiteEventStorageService
+        return SQLiteEventStorageService(storage_dir)
+    if backend != STORAGE_BACKEND_JSON:
+        raise ValueError(f"지원하지 않는 일정 저장소 백엔드입니다: {backend}")
+    return EventStorageService(storage_dir)
+
+def _journal_line(record: Dict[str, Any]) -> str:
+    """저널 기록 한 줄을 만듭니다. 일정은 JSON 경계이므로 여기서 딕셔너리로 변환합니다."""
+    if "event" in record:
+        record = {**record, "event": record["event"].to_dict()}
+    return json.dumps(record, ensure_ascii=False) + "\n"
 
 class EventStorageService:
-    def __init__(self):
-        self.storage_dir = Path("data/events")
+    """파일 기반 일정 저장소 (메모리 인덱스 + 스냅샷/저널)
+
+    여러 프로세스(uvicorn 워커)가 같은 디렉터리를 쓰면 변경마다 프로세스 간 파일 잠금을 잡고, 다른 프로세스가
+    바꾼 파일을 다시 로드합니다. JSON 모드는 변경마다 스냅샷 전체를 다시 쓰는 동안 잠금을 잡으므로 여러 워커에서는
+    저널 모드(EVENT_STORAGE_MODE=journal)나 SQLite 저장소(EVENT_STORAGE_BACKEND=sqlite)를 사용하세요.
+    """
+
+    def __init__(self, storage_dir: Optional[str] = None, mode: Optional[str] = None):
+        self.storage_dir = Path(storage_dir or settings.EVENT_STORAGE_DIR)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
-        self.events_file = self.storage_dir / "events.json"
-        self._load_events()
+        self.events_file = self.storage_dir / "events.snap"
+        self.legacy_json_file = self.storage_dir / "events.json"  # 이전 형식. 처음 로드할 때 스냅샷으로 변환
+        # 저널 모드: 변경 사항을 한 줄씩 추가하고, 일정 건수가 쌓이면 스냅샷(events.snap)으로 압축
+        self.journal_file = self.storage_dir / "events.journal"
+        self.compacting_file = self.storage_dir / "events.journal.compacting"
+        self.mode = mode or settings.EVENT_STORAGE_MODE
+        self.fsync_batch = max(1, settings.EVENT_JOURNAL_FSYNC_BATCH)
+        self.compact_threshold = max(1, settings.EVENT_JOURNAL_COMPACT_THRESHOLD)
+
+        self._lock = threading.RLock()
+        # 여러 프로세스(uvicorn 워커)가 같은 파일을 쓸 때의 잠금. 변경을 적용할 때 잡고 파일 저장이 끝나면 풂
+        # 잠금을 기다리는 동안 self._lock을 잡지 않으므로, 잡은 횟수는 별도의 짧은 잠금으로 보호
+        self._file_lock = FileLock(self.storage_dir / "events.lock")
+        self._file_lock_holds = 0
+        self._file_lock_guard = threading.Lock()
+        self._journal = None
+        self._journal_count = 0
+        self._unsynced_count = 0
+        self._compaction_thread: Optional[threading.Thread] = None
+        # 파일 저장은 전용 쓰기 스레드 하나에서 순서대로 처리
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="event-storage-writer")
+        self._generation = 0
+        self._pending_writes = 0
+        self._signature = None
+        self._reader: Optional[SnapshotReader] = None
+        self._time_index = EventTimeIndex()
+        # 반복 일정은 기간 인덱스 대신 규칙만 보관하고, 조회 기간의 발생 일정을 그때 계산
+        self._recurrence = RecurrenceIndex()
+        self._text_index = EventTextIndex()
+        self._text_index_ready = False
+        # 변경 번호: 생성/수정/삭제마다 1씩 증가하며, 변경 목록(get_changes)의 동기화 토큰으로 사용
+        self._seq = 0
+        self._sync_floor = 0  # 정리된 마지막 삭제 기록의 변경 번호. 이보다 오래된 토큰은 전체 동기화 필요
+        with self._files_locked(), self._lock:
+            self._load_events()
 
     def _load_events(self):
-        """저장된 일정을 로드합니다."""
+        """저장된 일정을 로드합니다.
+
+        스냅샷 파일은 메모리 매핑만 하고 레코드 머리에서 id → 위치와 기간만 읽어 두며,
+        일정은 실제로 반환할 때 풀어냅니다. 생성/수정된 일정만 Event 객체로 보관합니다.
+        """
+        self._close_reader()
+        # id -> 스냅샷 레코드 위치(int) 또는 Event (삽입 순서 유지). id 조회/수정/삭제가 O(1)로 동작
+        self._events: Dict[str, Union[int, Event]] = {}
+        # id -> (변경 번호, 삭제 시각). 변경 번호 순서를 유지하므로 최근 변경부터 거슬러 올라가며 찾을 수 있음
+        self._changes: "OrderedDict[str, Tuple[int, Optional[float]]]" = OrderedDict()
+        # 삭제된 일정 id -> 삭제 시각 (삭제 순서). 스냅샷과 저널에 남기고, 보관 기간이 지나면 purge_tombstones가 정리
+        self._tombstones: "OrderedDict[str, float]" = OrderedDict()
+        self._seq = self._sync_floor = 0
+        spans: Dict[str, Optional[Tuple[int, int]]] = {}
+        recurring: Set[str] = set()
+        needs_save = False
         if self.events_file.exists():
-            with open(self.events_file, 'r', encoding='utf-8') as f:
-                self.events = json.load(f)
+            self._reader = SnapshotReader(self.events_file)
+            spans, recurring, seqs, tombstones = self._scan_snapshot()
+            changes = [(seq, event_id, None) for event_id, seq in seqs.items()]
+            changes.extend((seq, event_id, deleted_at) for event_id, (seq, deleted_at) in tombstones.items())
+            for seq, event_id, deleted_at in sorted(changes):
+                self._mark_changed(event_id, seq, deleted_at)
+            self._seq, self._sync_floor = self._reader.last_seq, self._reader.deleted_seq
+        elif self.legacy_json_file.exists():
+            for data in import_json(self.legacy_json_file):
+                event = Event.from_dict(data)
+                # id가 없거나 앞의 일정과 겹치면 덮어쓰지 않고 새 id를 붙여 둘 다 보존
+                if not event.id or event.id in self._events:
+                    event.id = generate_event_id()
+                    print(f"⚠️ {self.legacy_json_file}의 일정 id({data.get('id')})가 없거나 중복되어 새 id를 붙였습니다: {event.id}")
+                self._events[event.id] = event
+            needs_save = True
+            print(f"✅ {self.legacy_json_file}을(를) 스냅샷 형식으로 변환합니다: {self.events_file}")
         else:
-            self.events = []
+            needs_save = True
+        if needs_save:
+            self._changes.update((event_id, (0, None)) for event_id in self._events)
+
+        # 스냅샷 이후의 변경 사항(압축 중이던 저널 → 현재 저널 순서)을 재적용
+        replayed_compacting = self._replay_journal(self.compacting_file)
+        self._journal_count = self._replay_journal(self.journal_file)
+
+        # 이전 실행에서 끝나지 않은 압축이 있거나 JSON 모드로 전환된 경우 바로 스냅샷에 반영
+        fold_journal = replayed_compacting or (self.mode != STORAGE_MODE_JOURNAL and self._journal_count)
+        if needs_save or fold_journal:
             self._save_events()
+            spans, recurring, _, _ = self._scan_snapshot()
+        if fold_journal:
+            for path in (self.compacting_file, self.journal_file):
+                if path.exists():
+                    path.unlink()
+            self._journal_count = 0
+
+        if self.mode == STORAGE_MODE_JOURNAL:
+            self._journal = open(self.journal_file, 'a', encoding='utf-8')
+        self._signature = self._file_signature()
+        self._rebuild_indexes(spans, recurring)
+        # 본문 색인은 모든 일정을 풀어야 하므로 첫 검색 때 만듦
+        self._text_index = EventTextIndex()
+        self._text_index_ready = False
+
+    def _scan_snapshot(
+        self,
+        reader: Optional[SnapshotReader] = None,
+        events: Optional[Dict[str, Union[int, Event]]] = None
+    ) -> Tuple[Dict[str, Optional[Tuple[int, int]]], Set[str], Dict[str, int], Dict[str, Tuple[int, float]]]:
+        """스냅샷 레코드 머리만 읽어 위치를 events(기본값은 현재 일정)에 등록합니다.
+
+        (id → 기간, 반복 일정 id 집합, id → 변경 번호, 삭제된 id → (변경 번호, 삭제 시각))을 반환합니다.
+        """
+        reader = reader or self._reader
+        events = self._events if events is None else events
+        spans: Dict[str, Optional[Tuple[int, int]]] = {}
+        recurring: Set[str] = set()
+        seqs: Dict[str, int] = {}
+        tombstones: Dict[str, Tuple[int, float]] = {}
+        for event_id, offset, span, flags, seq in reader.scan():
+            if flags & RECORD_FLAG_TOMBSTONE:
+                tombstones[event_id] = (seq, reader.deleted_at(offset))
+                continue
+            events[event_id] = offset
+            spans[event_id] = span
+            seqs[event_id] = seq
+            if flags & RECORD_FLAG_RECURRING:
+                recurring.add(event_id)
+        return spans, recurring, seqs, tombstones
+
+    def _rebuild_indexes(
+        self,
+        spans: Dict[str, Optional[Tuple[int, int]]],
+        recurring: Set[str],
+        reader: Optional[SnapshotReader] = None,
+        events: Optional[Dict[str, Union[int, Event]]] = None,
+        time_index: Optional[EventTimeIndex] = None,
+        recurrence: Optional[RecurrenceIndex] = None
+    ):
+        """기간 인덱스와 반복 일정 인덱스를 다시 만듭니다. 스냅샷에 있는 일정은 반복 일정만 풉니다.
+
+        인자를 주면 현재 상태 대신 그 스냅샷/일정/인덱스를 사용합니다.
+        """
+        reader = reader or self._reader
+        events = self._events if events is None else events
+        time_entries, recurrence_entries = [], []
+        for event_id, value in events.items():
+            if isinstance(value, int):
+                span = spans.get(event_id)
+                rule = RecurrenceRule.from_event(reader.decode(value)) if event_id in recurring else None
+            else:
+                span = value.span()
+                rule = RecurrenceRule.from_event(value)
+            if rule is not None:
+                recurrence_entries.append((event_id, span, rule))
+            else:
+                time_entries.append((event_id, span))
+        (time_index or self._time_index).rebuild(time_entries)
+        (recurrence or self._recurrence).rebuild(recurrence_entries)
+
+    def _index_event(self, event: Event):
+        rule = RecurrenceRule.from_event(event)
+        if rule is not None:
+            self._recurrence.add(event.id, event.span(), rule)
+        else:
+            self._time_index.add(event.id, event.span())
+
+    def _unindex_event(self, event_id: str):
+        self._time_index.remove(event_id)
+        self._recurrence.remove(event_id)
+
+    def _close_reader(self):
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def _materialize(self, value: Union[int, Event]) -> Event:
+        """스냅샷 위치이면 해당 레코드를 풀어 일정으로 반환합니다. (self._lock을 잡은 상태에서 호출)"""
+        return self._reader.decode(value) if isinstance(value, int) else value
+
+    def _event(self, event_id: str) -> Event:
+        return self._materialize(self._events[event_id])
+
+    def _ensure_text_index(self):
+        if not self._text_index_ready:
+            self._text_index.rebuild(self._materialize(value) for value in self._events.values())
+            self._text_index_ready = True
+
+    def _file_signature(self) -> tuple:
+        """스냅샷과 저널 파일의 (mtime, 크기)를 반환합니다."""
+        signature = []
+        for path in (self.events_file, self.journal_file):
+            try:
+                stat = path.stat()
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _hold_file_lock(self):
+        """프로세스 간 파일 잠금을 잡습니다. 이 프로세스가 이미 잡고 있으면 횟수만 늘립니다.
+
+        다른 프로세스가 잠금을 잡고 있으면 기다리므로 이벤트 루프 스레드나 self._lock을 잡은 상태에서는
+        이미 잡고 있는 경우(압축 시작 등)에만 호출합니다.
+        """
+        with self._file_lock_guard:
+            if self._file_lock_holds == 0:
+                self._file_lock.acquire()
+            self._file_lock_holds += 1
+
+    def _try_hold_file_lock(self) -> bool:
+        """기다리지 않고 파일 잠금을 잡아 봅니다. 다른 프로세스(또는 잠금을 기다리는 스레드)가 있으면 False."""
+        if not self._file_lock_guard.acquire(blocking=False):
+            return False
+        try:
+            if self._file_lock_holds == 0 and not self._file_lock.acquire(blocking=False):
+                return False
+            self._file_lock_holds += 1
+            return True
+        finally:
+            self._file_lock_guard.release()
+
+    def _release_file_lock(self):
+        """_hold_file_lock 한 번을 되돌리고, 마지막이면 잠금을 풉니다."""
+        with self._file_lock_guard:
+            self._file_lock_holds -= 1
+            if self._file_lock_holds == 0:
+                self._file_lock.release()
+
+    @contextmanager
+    def _files_locked(self):
+        self._hold_file_lock()
+        try:
+            yield
+        finally:
+            self._release_file_lock()
+
+    def _reload_if_changed(self, file_locked: bool = False):
+        """다른 프로세스가 파일을 변경한 경우에만 일정을 다시 로드합니다. (self._lock을 잡은 상태에서 호출)
+
+        조회에서는 다른 프로세스가 아직 저장 중이라 파일 잠금을 바로 잡을 수 없으면 기다리지 않고 현재 메모리 상태를
+        그대로 사용하며, 다음 조회 때 다시 확인합니다. 변경(_commit)은 파일 잠금을 잡은 뒤 file_locked=True로 호출하므로
+        항상 최신 상태에 적용됩니다.
+        """
+        if self._pending_writes:
+            # 아직 저장되지 않은 변경이 있으면 메모리 상태가 최신
+            return
+        if self._file_signature() == self._signature:
+            return
+        if file_locked:
+            self._reload()
+            return
+        if not self._try_hold_file_lock():
+            return
+        try:
+            self._reload()
+        finally:
+            self._release_file_lock()
+
+    def _replay_journal(self, path: Path) -> int:
+        """저널 파일의 변경 기록을 메모리에 재적용하고 적용한 건수를 반환합니다."""
+        if not path.exists():
+            return 0
+
+        count = 0
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 도중 중단된 마지막 줄은 무시
+                    print(f"⚠️ 손상된 저널 기록을 건너뜁니다: {path}")
+                    continue
+
+                # 변경 번호가 없는 이전 형식의 기록은 순서대로 번호를 붙임
+                seq = record.get("seq") or self._seq + 1
+                if record.get("op") == "put":
+                    event = Event.from_dict(record["event"])
+                    self._events[event.id] = event
+                    self._mark_changed(event.id, seq)
+                elif record.get("op") == "delete":
+                    self._events.pop(record["id"], None)
+                    self._mark_changed(record["id"], seq, record.get("deleted_at") or time.time())
+                elif record.get("op") == "purge":
+                    self._drop_tombstones(record["ids"])
+                    self._sync_floor = max(self._sync_floor, record["floor"])
+                count += 1
+
+        return count
+
+    def _mark_changed(self, event_id: str, seq: int, deleted_at: Optional[float] = None):
+        """일정의 변경 번호를 기록하고 변경 목록의 맨 뒤로 옮깁니다. 삭제면 삭제 기록을 남깁니다."""
+        self._seq = max(self._seq, seq)
+        self._changes[event_id] = (seq, deleted_at)
+        self._changes.move_to_end(event_id)
+        if deleted_at is not None:
+            self._tombstones[event_id] = deleted_at
+            self._tombstones.move_to_end(event_id)
+        else:
+            self._tombstones.pop(event_id, None)
+
+    def _drop_tombstones(self, event_ids: List[str]):
+        for event_id in event_ids:
+            if self._tombstones.pop(event_id, None) is not None:
+                self._changes.pop(event_id, None)
+
+    def _next_seq(self) -> int:
+        return self._seq + 1
+
+    def _snapshot_entries(self) -> Dict[str, Any]:
+        """스냅샷에 기록할 일정 목록을 모읍니다. (self._lock을 잡은 상태에서 호출)
+
+        일정 수만큼의 레코드 복사/직렬화는 잠금 밖의 _write_snapshot_tmp에서 하도록, 여기서는 id와 위치(또는 Event)의
+        얕은 복사와 변경 번호만 모읍니다. 스냅샷에 있던 일정의 레코드에는 변경 번호가 이미 들어 있습니다.
+        """
+        events = list(self._events.items())
+        return {
+            "events": events,
+            "seqs": {event_id: self._changes[event_id][0] for event_id, value in events if not isinstance(value, int)},
+            "tombstones": [
+                (event_id, self._changes[event_id][0], deleted_at) for event_id, deleted_at in self._tombstones.items()
+            ],
+            "header": (self._seq, self._sync_floor),
+            "reader": self._reader,
+            "generation": self._generation
+        }
 
     def _save_events(self):
-        """일정을 파일에 저장합니다."""
-        with open(self.events_file, 'w', encoding='utf-8') as f:
-            json.dump(self.events, f, ensure_ascii=False, indent=2)
+        """일정을 파일에 저장합니다. (self._lock을 잡은 상태에서 호출)"""
+        entries = self._snapshot_entries()
+        self._install_snapshot(*self._write_snapshot_tmp(entries), entries)
 
-    def create_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
-        """새로운 일정을 생성합니다."""
-        event_id = str(len(self.events) + 1)
-        event = {
-            "id": event_id,
-            **event_data,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
+    def _write_snapshot_tmp(self, entries: Dict[str, Any]) -> Tuple[Path, Dict[str, int]]:
+        """모은 일정을 임시 스냅샷 파일에 기록하고 (경로, id → 새 파일의 레코드 위치)를 반환합니다.
+
+        self._lock 없이 호출할 수 있습니다. 스냅샷 교체는 쓰기 스레드(와 압축 스레드)만 하므로 읽는 리더는 닫히지 않습니다.
+        """
+        reader, seqs = entries["reader"], entries["seqs"]
+
+        def records():
+            for event_id, value in entries["events"]:
+                yield reader.raw(value) if isinstance(value, int) else encode_record(value, seqs[event_id])
+            for event_id, seq, deleted_at in entries["tombstones"]:
+                yield encode_tombstone(event_id, seq, deleted_at)
+
+        tmp_file = self.events_file.with_suffix(".snap.tmp")
+        offsets = write_snapshot(tmp_file, records(), *entries["header"])
+        # 레코드를 쓴 순서 그대로 위치가 나오므로 새 파일을 다시 훑지 않음 (삭제 기록은 일정 뒤에 있음)
+        return tmp_file, {event_id: offset for (event_id, _), offset in zip(entries["events"], offsets)}
+
+    def _install_snapshot(self, tmp_file: Path, positions: Dict[str, int], entries: Dict[str, Any]) -> bool:
+        """임시 파일로 스냅샷을 교체하고 새 파일을 매핑합니다. (self._lock을 잡은 상태에서 호출)
+
+        기록한 뒤 바뀌지 않은 일정은 새 파일의 레코드 위치를 가리키게 하고, 수정된 일정은 Event로 남겨 둡니다.
+        기록하는 사이 변경이 없었으면 위치 딕셔너리를 통째로 바꿔 끼우므로 일정 수와 관계없이 빠릅니다.
+        기록하는 사이 다른 프로세스의 변경으로 다시 로드되었다면 False를 반환하며, 이때는 다시 로드해야 합니다.
+        """
+        reloaded = self._reader is not entries["reader"]
+        # Windows에서는 매핑된 파일을 교체할 수 없으므로 먼저 닫음
+        self._close_reader()
+        os.replace(tmp_file, self.events_file)
+        if reloaded:
+            return False
+
+        self._reader = SnapshotReader(self.events_file)
+        if self._generation == entries["generation"]:
+            self._events = positions
+            return True
+        for event_id, value in entries["events"]:
+            current = self._events.get(event_id)
+            if current is None:
+                continue
+            if isinstance(current, int) or current is value:
+                self._events[event_id] = positions[event_id]
+        return True
+
+    def _reload(self):
+        """다른 프로세스의 저장이 끝난 뒤의 파일을 다시 로드합니다. (self._lock과 파일 잠금을 잡은 상태에서 호출)"""
+        if self._journal:
+            self._journal.close()
+            self._journal = None
+        self._load_events()
+
+    def _persist(self, records: List[Dict[str, Any]]) -> Future:
+        """변경 사항의 저장을 전용 쓰기 스레드에 맡깁니다. (self._lock을 잡은 상태에서 호출)
+
+        저널 기록은 이후 변경과 섞이지 않도록 여기서 직렬화하고, 실제 파일 I/O는 쓰기 스레드가 처리합니다.
+        """
+        self._generation += 1
+        self._pending_writes += 1
+        if self.mode == STORAGE_MODE_JOURNAL:
+            lines = "".join(_journal_line(record) for record in records)
+            return self._writer.submit(self._write_journal, lines, len(records))
+        return self._writer.submit(self._write_events_file, self._generation)
+
+    def _write_events_file(self, generation: int):
+        """(쓰기 스레드) 현재 일정 전체를 스냅샷 파일로 저장합니다."""
+        try:
+            with self._lock:
+                if generation < self._generation:
+                    # 뒤에 대기 중인 저장이 더 최신 상태를 기록하므로 건너뜀
+                    return
+                entries = self._snapshot_entries()
+            # 레코드 복사와 파일 기록은 잠금 밖에서 하므로 그동안 조회와 다른 변경이 막히지 않음
+            tmp_file, positions = self._write_snapshot_tmp(entries)
+            with self._lock:
+                self._install_snapshot(tmp_file, positions, entries)
+                self._signature = self._file_signature()
+        finally:
+            with self._lock:
+                self._pending_writes -= 1
+                self._release_file_lock()
+
+    def _write_journal(self, lines: str, count: int):
+        """(쓰기 스레드) 저널에 기록을 추가하고, 일정 건수마다 fsync 합니다."""
+        try:
+            with self._lock:
+                self._journal.write(lines)
+                self._journal.flush()
+                self._journal_count += count
+                self._unsynced_count += count
+                if self._journal_count >= self.compact_threshold:
+                    self._start_compaction()
+                self._signature = self._file_signature()
+                needs_sync = self._unsynced_count >= self.fsync_batch
+                if needs_sync:
+                    self._unsynced_count = 0
+                journal = self._journal
+
+            if needs_sync:
+                os.fsync(journal.fileno())
+        finally:
+            with self._lock:
+                self._pending_writes -= 1
+                self._release_file_lock()
+
+    def _start_compaction(self):
+        """현재 저널을 떼어내고 백그라운드에서 스냅샷으로 압축합니다."""
+        if self._compaction_thread and self._compaction_thread.is_alive():
+            return
+        if self.compacting_file.exists():
+            return
+
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._journal.close()
+        os.replace(self.journal_file, self.compacting_file)
+        self._journal = open(self.journal_file, 'a', encoding='utf-8')
+        self._journal_count = 0
+        self._unsynced_count = 0
+
+        entries = self._snapshot_entries()
+        # 압축이 끝날 때까지 다른 프로세스가 저널을 다시 반영하지 않도록 파일 잠금을 유지
+        self._hold_file_lock()
+        self._compaction_thread = threading.Thread(
+            target=self._compact,
+            args=(entries,),
+            name="event-journal-compaction",
+            daemon=True
+        )
+        self._compaction_thread.start()
+
+    def _compact(self, entries: Dict[str, Any]):
+        """스냅샷을 기록하고 반영이 끝난 저널을 삭제합니다."""
+        try:
+            tmp_file, positions = self._write_snapshot_tmp(entries)
+            with self._lock:
+                remapped = self._install_snapshot(tmp_file, positions, entries)
+                self.compacting_file.unlink()
+                if not remapped:
+                    self._reload()
+                self._signature = self._file_signature()
+        except Exception as e:
+            # 저널은 남아 있으므로 다음 로드 시 다시 반영됨
+            print(f"❌ 저널 압축 중 오류 발생: {str(e)}")
+        finally:
+            with self._lock:
+                self._release_file_lock()
+
+    def flush(self):
+        """대기 중인 저장을 마치고, 아직 fsync 되지 않은 저널 기록을 디스크에 반영합니다."""
+        self._writer.submit(lambda: None).result()
+        with self._lock:
+            if self._journal and self._unsynced_count:
+                self._journal.flush()
+                os.fsync(self._journal.fileno())
+                self._unsynced_count = 0
+
+    def close(self):
+        """저장을 모두 마치고 진행 중인 압축이 끝날 때까지 기다립니다."""
+        self.flush()
+        self._writer.shutdown(wait=True)
+        if self._compaction_thread:
+            self._compaction_thread.join()
+        with self._lock:
+            if self._journal:
+                self._journal.close()
+                self._journal = None
+            self._close_reader()
+        self._file_lock.close()
+
+    def iter_export(self, chunk_size: Optional[int] = None) -> Iterator[List[Event]]:
+        """모든 일정을 chunk_size개씩 나눠 반환합니다. (NDJSON 내보내기용)
+
+        한 번에 한 묶음만 풀어 두므로 일정 수와 관계없이 메모리 사용량이 일정하며, 내보내는 도중 삭제된 일정은 건너뜁니다.
+        """
+        chunk_size = chunk_size or settings.EVENT_STREAM_CHUNK_SIZE
+        with self._lock:
+            self._reload_if_changed()
+            event_ids = list(self._events)
+        for position in range(0, len(event_ids), chunk_size):
+            with self._lock:
+                chunk = [
+                    self._event(event_id) for event_id in event_ids[position:position + chunk_size]
+                    if event_id in self._events
+                ]
+            if chunk:
+                yield chunk
+
+    def import_events(self, events: Iterable[Union[Event, Dict[str, Any]]]) -> Dict[str, int]:
+        """일정을 한꺼번에 가져옵니다. (백업 복원, 대량 이전)
+
+        가져오는 일정은 메모리에 쌓지 않고 임시 스냅샷 파일에 바로 직렬화한 뒤, 마지막에 현재 일정과 합친 스냅샷을
+        한 번만 쓰고 인덱스도 한 번만 다시 만듭니다. 같은 id의 일정이 이미 있으면 가져온 일정으로 바꾸며,
+        가져오는 목록 안에서 중복된 id는 처음 것만 사용합니다. 읽는 도중 오류가 나면 저장소는 바뀌지 않습니다.
+        """
+        imported_ids: Set[str] = set()
+        skipped = 0
+
+        def staged_records():
+            nonlocal skipped
+            for item in events:
+                event = Event.from_dict(item) if isinstance(item, dict) else item.copy()
+                if not event.id:
+                    event.id = generate_event_id()
+                elif event.id in imported_ids:
+                    skipped += 1
+                    continue
+                now = time.time()
+                event.created_at = event.created_at or now
+                event.updated_at = event.updated_at or now
+                imported_ids.add(event.id)
+                yield encode_record(event)
+
+        staging_file = self.events_file.with_suffix(".snap.import")
+        staging = None
+        try:
+            write_snapshot(staging_file, staged_records())
+            staging = SnapshotReader(staging_file)
+            # 스냅샷 교체는 쓰기 스레드에서만 하므로, 대기 중인 저장을 마친 뒤 쓰기 스레드에서 합침
+            self._writer.submit(self._install_import, staging, imported_ids).result()
+        finally:
+            if staging is not None:
+                staging.close()
+            if staging_file.exists():
+                staging_file.unlink()
+
+        print(f"✅ 일정 {len(imported_ids)}건 가져오기 완료 (중복 {skipped}건 제외): {self.storage_dir}")
+        return {"imported": len(imported_ids), "skipped": skipped}
+
+    def _install_import(self, staging: SnapshotReader, imported_ids: Set[str]):
+        """(쓰기 스레드) 현재 일정과 가져온 일정을 합친 스냅샷을 쓰고 다시 로드합니다.
+
+        합친 파일 기록과 그 파일의 상태(위치, 변경 목록, 인덱스) 준비는 self._lock 밖에서 하므로 그동안 조회는 막히지 않으며,
+        잠금은 파일과 상태를 바꿔 끼울 때만 잡습니다.
+        쓰는 사이 이 프로세스에서 변경이 생기면 다시 합치고, 두 번 실패하면 잠금을 잡은 채로 씁니다.
+        저널에 있던 변경은 메모리 상태에 이미 반영되어 있으므로 새 스냅샷에 함께 기록하고 저널은 비웁니다.
+        """
+        # 압축은 쓰기 스레드에서만 시작하므로 여기서 기다리면 교체가 끝날 때까지 새로 시작되지 않음
+        if self._compaction_thread:
+            self._compaction_thread.join()
+        with self._files_locked():
+            for attempt in range(3):
+                with self._lock:
+                    self._reload_if_changed(file_locked=True)
+                    generation = self._generation
+                    merged = self._merged_import_records(staging, imported_ids)
+                    if attempt == 2:
+                        tmp_file = merged()
+                        old_state = self._swap_import(tmp_file, self._prepare_snapshot_state(tmp_file))
+                        break
+                try:
+                    tmp_file = merged()
+                except RuntimeError:
+                    # 기록하는 사이 일정이 추가/삭제됨. 아래에서 변경 번호(generation)가 달라지므로 다시 합침
+                    tmp_file = None
+                state = self._prepare_snapshot_state(tmp_file) if tmp_file else None
+                with self._lock:
+                    if state is not None and self._generation == generation:
+                        old_state = self._swap_import(tmp_file, state)
+                        break
+                if state is not None:
+                    state["reader"].close()
+                    tmp_file.unlink()
+        # 이전 상태(일정 수만큼의 객체)는 잠금을 푼 뒤에 해제
+        del old_state
+
+    def _merged_import_records(self, staging: SnapshotReader, imported_ids: Set[str]) -> Callable[[], Path]:
+        """합친 스냅샷을 임시 파일에 쓰는 함수를 반환합니다. (self._lock을 잡은 상태에서 호출)
+
+        반환한 함수는 잠금 없이 현재 일정을 훑으며 레코드를 복사/직렬화합니다. 스냅샷 교체는 쓰기 스레드에서만 하고
+        다른 프로세스의 변경은 파일 잠금으로 막혀 있으므로 읽는 레코드 위치는 유효하며, 그사이 이 프로세스에서 생긴 변경은
+        호출한 쪽이 변경 번호(generation)로 확인해 다시 합칩니다. 훑는 도중 일정 수가 바뀌면 RuntimeError가 발생합니다.
+        """
+        reader, first_seq, sync_floor = self._reader, self._seq + 1, self._sync_floor
+
+        def records():
+            for event_id, value in self._events.items():
+                if event_id not in imported_ids:
+                    yield reader.raw(value) if isinstance(value, int) else encode_record(
+                        value, self._changes[event_id][0]
+                    )
+            for event_id, deleted_at in self._tombstones.items():
+                if event_id not in imported_ids:
+                    yield encode_tombstone(event_id, self._changes[event_id][0], deleted_at)
+            # 가져온 일정에는 변경 목록에 나타나도록 새 변경 번호를 붙임
+            for seq, (_, offset, _, _, _) in enumerate(staging.scan(), first_seq):
+                yield staging.raw(offset, seq)
+
+        def write() -> Path:
+            tmp_file = self.events_file.with_suffix(".snap.tmp")
+            write_snapshot(tmp_file, records(), first_seq - 1 + len(imported_ids), sync_floor)
+            return tmp_file
+
+        return write
+
+    def _prepare_snapshot_state(self, path: Path) -> Dict[str, Any]:
+        """스냅샷 파일의 레코드 머리만 읽어 새 메모리 상태를 만듭니다. 현재 상태는 건드리지 않으므로 잠금 없이 호출합니다."""
+        reader = SnapshotReader(path)
+        events: Dict[str, Union[int, Event]] = {}
+        spans, recurring, seqs, tombstones = self._scan_snapshot(reader, events)
+        changes: "OrderedDict[str, Tuple[int, Optional[float]]]" = OrderedDict()
+        deleted: "OrderedDict[str, float]" = OrderedDict()
+        entries = [(seq, event_id, None) for event_id, seq in seqs.items()]
+        entries.extend((seq, event_id, deleted_at) for event_id, (seq, deleted_at) in tombstones.items())
+        for seq, event_id, deleted_at in sorted(entries):
+            changes[event_id] = (seq, deleted_at)
+            if deleted_at is not None:
+                deleted[event_id] = deleted_at
+        time_index, recurrence = EventTimeIndex(), RecurrenceIndex()
+        self._rebuild_indexes(spans, recurring, reader, events, time_index, recurrence)
+        return {
+            "reader": reader, "events": events, "changes": changes, "tombstones": deleted,
+            "seq": reader.last_seq, "sync_floor": reader.deleted_seq,
+            "time_index": time_index, "recurrence": recurrence
         }
-        self.events.append(event)
-        self._save_events()
-        return event
-
-    def update_event(self, event_id: str, event_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """기존 일정을 수정합니다."""
-        for event in self.events:
-            if event["id"] == event_id:
-                event.update(event_data)
-                event["updated_at"] = datetime.now().isoformat()
-                self._save_events()
-                return event
-        return None
 
-    def delete_event(self, event_id: str) -> bool:
-        """일정을 삭제합니다."""
-        for i, event in enumerate(self.events):
-            if event["id"] == event_id:
-                del self.events[i]
-                self._save_events()
-                return True
-        return False
-
-    def get_events(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict[str, Any]]:
-        """일정을 조회합니다."""
-        if not start_date and not end_date:
-            return self.events
-
-        filtered_events = []
-        for event in self.events:
-            event_start = event.get("start_date")
-            event_end = event.get("end_date")
-
-            if start_date and event_start < start_date:
+    def _swap_import(self, tmp_file: Path, state: Dict[str, Any]) -> tuple:
+        """합친 스냅샷으로 교체하고 저널을 비운 뒤, 미리 만든 상태로 바꿉니다. (self._lock을 잡은 상태에서 호출)
+
+        이전 상태를 반환하므로 호출한 쪽이 잠금을 푼 뒤에 해제할 수 있습니다.
+        """
+        old_state = (self._events, self._changes, self._tombstones, self._time_index, self._recurrence, self._text_index)
+        if self._journal:
+            self._journal.close()
+            self._journal = None
+        self._close_reader()
+        # Windows에서는 매핑된 파일의 이름을 바꿀 수 없으므로 닫았다가 다시 매핑 (레코드 위치는 같음)
+        state["reader"].close()
+        os.replace(tmp_file, self.events_file)
+        for path in (self.compacting_file, self.journal_file):
+            if path.exists():
+                path.unlink()
+        self._reader = SnapshotReader(self.events_file)
+        self._events, self._changes, self._tombstones = state["events"], state["changes"], state["tombstones"]
+        self._seq, self._sync_floor = state["seq"], state["sync_floor"]
+        self._time_index, self._recurrence = state["time_index"], state["recurrence"]
+        self._text_index = EventTextIndex()
+        self._text_index_ready = False
+        self._journal_count = 0
+        if self.mode == STORAGE_MODE_JOURNAL:
+            self._journal = open(self.journal_file, 'a', encoding='utf-8')
+        self._signature = self._file_signature()
+        return old_state
+
+    def _apply_create(self, event_data: Union[Event, Dict[str, Any]]) -> Dict[str, Any]:
+        """메모리와 인덱스에 새 일정을 추가하고 저널 기록을 반환합니다."""
+        event = Event.from_dict(event_data) if isinstance(event_data, dict) else event_data.copy()
+        event.id = generate_event_id()
+        event.created_at = event.updated_at = time.time()
+        self._events[event.id] = event
+        self._index_event(event)
+        if self._text_index_ready:
+            self._text_index.add(event)
+        seq = event.version = self._next_seq()
+        self._mark_changed(event.id, seq)
+        return {"op": "put", "seq": seq, "event": event}
+
+    def _apply_update(
+        self,
+        event_id: str,
+        event_data: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """메모리의 일정을 수정하고 저널 기록을 반환합니다. 일정이 없으면 None.
+
+        expected_version이 주어지면 일정의 현재 버전(변경 번호)이 같을 때만 수정하고, 다르면 EventVersionConflict를 발생시킵니다.
+        """
+        current = self._events.get(event_id)
+        if current is None:
+            return None
+        current_version = self._changes[event_id][0]
+        if expected_version is not None and expected_version != current_version:
+            raise EventVersionConflict(event_id, current_version)
+
+        old_event = self._materialize(current)
+        return self._replace_event(event_id, old_event, old_event.updated(event_data))
+
+    def _replace_event(self, event_id: str, old_event: Event, event: Event) -> Dict[str, Any]:
+        """메모리와 인덱스의 일정을 수정된 새 객체로 바꾸고 저널 기록을 반환합니다."""
+        # 스냅샷 교체 시 변경 여부를 객체 동일성으로 판단하므로 항상 새 객체로 교체
+        event.updated_at = time.time()
+        self._events[event_id] = event
+        self._unindex_event(event_id)
+        self._index_event(event)
+        if self._text_index_ready:
+            self._text_index.update(old_event, event)
+        seq = event.version = self._next_seq()
+        self._mark_changed(event_id, seq)
+        return {"op": "put", "seq": seq, "event": event}
+
+    def _apply_delete(self, event_id: str) -> Optional[Dict[str, Any]]:
+        """메모리에서 일정을 삭제하고 저널 기록을 반환합니다. 일정이 없으면 None."""
+        current = self._events.pop(event_id, None)
+        if current is None:
+            return None
+
+        self._unindex_event(event_id)
+        if self._text_index_ready:
+            self._text_index.remove(self._materialize(current))
+        seq = self._next_seq()
+        deleted_at = time.time()
+        self._mark_changed(event_id, seq, deleted_at)
+        return {"op": "delete", "seq": seq, "id": event_id, "deleted_at": deleted_at}
+
+    def _apply_batch(
+        self,
+        create: Optional[List[Union[Event, Dict[str, Any]]]],
+        update: Optional[List[Dict[str, Any]]],
+        delete: Optional[List[str]]
+    ) -> Tuple[Dict[str, List[Any]], List[Dict[str, Any]]]:
+        """여러 건의 변경을 메모리에 적용하고 (결과, 저널 기록 목록)을 반환합니다.
+
+        입력을 모두 변환/검증한 뒤에 메모리를 바꾸므로, 잘못된 항목이 있으면 어떤 변경도 적용되지 않습니다.
+        """
+        records = []
+        created, updated, deleted, not_found = [], [], [], []
+        new_events = [Event.from_dict(data) if isinstance(data, dict) else data for data in create or []]
+        # 같은 일정을 여러 번 수정하면 앞선 수정 결과에 이어서 적용
+        planned: Dict[str, Event] = {}
+        replacements = []
+        for item in update or []:
+            event_id = item["id"]
+            old_event = planned.get(event_id)
+            if old_event is None and event_id in self._events:
+                old_event = self._materialize(self._events[event_id])
+            if old_event is None:
+                replacements.append((event_id, None, None))
+                continue
+            planned[event_id] = old_event.updated(item.get("data") or {})
+            replacements.append((event_id, old_event, planned[event_id]))
+
+        for event in new_events:
+            record = self._apply_create(event)
+            records.append(record)
+            created.append(record["event"])
+
+        for event_id, old_event, event in replacements:
+            if event is None:
+                not_found.append(event_id)
                 continue
-            if end_date and event_end > end_date:
+            record = self._replace_event(event_id, old_event, event)
+            records.append(record)
+            updated.append(record["event"])
+
+        for event_id in delete or []:
+            record = self._apply_delete(event_id)
+            if record is None:
+                not_found.append(event_id)
                 continue
+            records.append(record)
+            deleted.append(event_id)
+
+        result = {
+            "created": created,
+            "updated": updated,
+            "deleted": deleted,
+            "not_found": not_found
+        }
+        return result, records
+
+    def _commit(
+        self,
+        operation: Callable[[], Tuple[Any, List[Dict[str, Any]]]],
+        file_locked: bool = False
+    ) -> Tuple[Any, Optional[Future]]:
+        """잠금 안에서 변경을 메모리에 적용하고, 저장 작업을 쓰기 스레드에 넘깁니다.
+
+        프로세스 간 파일 잠금을 잡은 뒤 다른 프로세스의 변경을 먼저 다시 로드하므로 서로의 변경을 덮어쓰지 않습니다.
+        파일 잠금은 self._lock을 잡기 전에 잡으며(file_locked이면 이미 잡은 상태), 쓰기 스레드가 저장을 마친 뒤 풉니다.
+        """
+        if not file_locked:
+            self._hold_file_lock()
+        future = None
+        try:
+            with self._lock:
+                self._reload_if_changed(file_locked=True)
+                result, records = operation()
+                if records:
+                    future = self._persist(records)
+        finally:
+            if future is None:
+                self._release_file_lock()
+        return result, future
+
+    def _run(self, operation: Callable[[], Tuple[Any, List[Dict[str, Any]]]]) -> Any:
+        """변경을 적용하고 저장이 끝날 때까지 기다립니다."""
+        result, future = self._commit(operation)
+        if future is not None:
+            future.result()
+        return result
+
+    async def _arun(self, operation: Callable[[], Tuple[Any, List[Dict[str, Any]]]]) -> Any:
+        """변경을 적용하고, 이벤트 루프를 막지 않은 채 저장이 끝나기를 기다립니다.
+
+        파일 잠금을 바로 잡을 수 있으면 이벤트 루프에서 바로 적용하고, 다른 프로세스가 잡고 있으면
+        잠금을 기다리는 일부터 별도 스레드에서 처리합니다.
+        """
+        if self._try_hold_file_lock():
+            result, future = self._commit(operation, file_locked=True)
+        else:
+            result, future = await asyncio.to_thread(self._commit, operation)
+        if future is not None:
+            await asyncio.wrap_future(future)
+        return result
+
+    def _create_operation(self, event_data: Union[Event, Dict[str, Any]]):
+        record = self._apply_create(event_data)
+        return record["event"], [record]
+
+    def _update_operation(self, event_id: str, event_data: Dict[str, Any], expected_version: Optional[int] = None):
+        record = self._apply_update(event_id, event_data, expected_version)
+        return (record["event"], [record]) if record else (None, [])
+
+    def _delete_operation(self, event_id: str):
+        record = self._apply_delete(event_id)
+        return (True, [record]) if record else (False, [])
+
+    def create_event(self, event_data: Union[Event, Dict[str, Any]]) -> Event:
+        """새로운 일정을 생성합니다."""
+        return self._run(lambda: self._create_operation(event_data))
+
+    def update_event(
+        self,
+        event_id: str,
+        event_data: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> Optional[Event]:
+        """기존 일정을 수정합니다.
+
+        expected_version이 주어지면 일정의 현재 버전과 같을 때만 수정하며, 다르면 EventVersionConflict가 발생합니다.
+        """
+        return self._run(lambda: self._update_operation(event_id, event_data, expected_version))
+
+    def delete_event(self, event_id: str) -> bool:
+        """일정을 삭제합니다."""
+        return self._run(lambda: self._delete_operation(event_id))
+
+    def apply_batch(
+        self,
+        create: Optional[List[Union[Event, Dict[str, Any]]]] = None,
+        update: Optional[List[Dict[str, Any]]] = None,
+        delete: Optional[List[str]] = None
+    ) -> Dict[str, List[Any]]:
+        """여러 건의 생성/수정/삭제를 한 번에 적용하고 한 번만 저장합니다.
+
+        update 항목은 {"id": 일정 id, "data": 변경 내용} 형식입니다.
+        """
+        return self._run(lambda: self._apply_batch(create, update, delete))
+
+    def bulk_create(self, events_data: List[Union[Event, Dict[str, Any]]]) -> List[Event]:
+        """여러 일정을 한 번에 생성합니다."""
+        return self.apply_batch(create=events_data)["created"]
+
+    def bulk_update(self, updates: List[Dict[str, Any]]) -> List[Event]:
+        """여러 일정을 한 번에 수정하고, 수정된 일정만 반환합니다."""
+        return self.apply_batch(update=updates)["updated"]
+
+    def bulk_delete(self, event_ids: List[str]) -> List[str]:
+        """여러 일정을 한 번에 삭제하고, 삭제된 id만 반환합니다."""
+        return self.apply_batch(delete=event_ids)["deleted"]
+
+    def purge_tombstones(self, retention_seconds: Optional[float] = None) -> int:
+        """보관 기간이 지난 삭제 기록을 정리하고 정리한 건수를 반환합니다. (백그라운드 정리 작업에서 호출)
+
+        정리된 삭제 기록보다 오래된 동기화 토큰은 이후 전체 동기화가 필요합니다.
+        """
+        if retention_seconds is None:
+            retention_seconds = settings.EVENT_TOMBSTONE_RETENTION_DAYS * SECONDS_PER_DAY
+        cutoff = time.time() - retention_seconds
+
+        def operation():
+            # 삭제 기록은 삭제 순서로 보관되므로 보관 기간 안의 기록을 만나면 멈춤
+            expired = []
+            for event_id, deleted_at in self._tombstones.items():
+                if deleted_at >= cutoff:
+                    break
+                expired.append(event_id)
+            if not expired:
+                return 0, []
+            self._sync_floor = max(self._sync_floor, max(self._changes[event_id][0] for event_id in expired))
+            self._drop_tombstones(expired)
+            return len(expired), [{"op": "purge", "ids": expired, "floor": self._sync_floor}]
+
+        purged = self._run(operation)
+        if purged:
+            print(f"🧹 보관 기간이 지난 삭제 기록 {purged}건 정리: {self.storage_dir}")
+        return purged
+
+    # 비동기 API: 메모리 반영은 즉시, 파일 저장은 쓰기 스레드에서 처리되어 이벤트 루프를 막지 않음
+
+    async def acreate_event(self, event_data: Union[Event, Dict[str, Any]]) -> Event:
+        """create_event의 비동기 버전입니다."""
+        return await self._arun(lambda: self._create_operation(event_data))
+
+    async def aupdate_event(
+        self,
+        event_id: str,
+        event_data: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> Optional[Event]:
+        """update_event의 비동기 버전입니다."""
+        return await self._arun(lambda: self._update_operation(event_id, event_data, expected_version))
+
+    async def adelete_event(self, event_id: str) -> bool:
+        """delete_event의 비동기 버전입니다."""
+        return await self._arun(lambda: self._delete_operation(event_id))
+
+    async def aapply_batch(
+        self,
+        create: Optional[List[Union[Event, Dict[str, Any]]]] = None,
+        update: Optional[List[Dict[str, Any]]] = None,
+        delete: Optional[List[str]] = None
+    ) -> Dict[str, List[Any]]:
+        """apply_batch의 비동기 버전입니다."""
+        return await self._arun(lambda: self._apply_batch(create, update, delete))
+
+    def get_event(self, event_id: str) -> Optional[Event]:
+        """id로 일정을 조회합니다. 반환한 일정의 version에 현재 버전을 채웁니다."""
+        with self._lock:
+            self._reload_if_changed()
+            value = self._events.get(event_id)
+            if value is None:
+                return None
+            event = self._materialize(value)
+            event.version = self._changes[event_id][0]
+            return event
+
+    def get_changes(self, since: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """변경 번호 since 이후에 생성/수정/삭제된 일정을 반환합니다.
+
+        since가 없으면 전체 일정을 반환합니다. since 이후의 삭제를 알 수 없으면(너무 오래된 토큰) None을 반환하며,
+        이때 클라이언트는 전체 동기화를 해야 합니다. 반환값의 "seq"를 다음 요청의 since로 사용합니다.
+        """
+        with self._lock:
+            self._reload_if_changed()
+            if since is None:
+                events = [self._materialize(value) for value in self._events.values()]
+                return {"events": events, "deleted": [], "seq": self._seq}
+            if since < self._sync_floor or since > self._seq:
+                return None
+
+            changed = []
+            for event_id, (seq, deleted_at) in reversed(self._changes.items()):
+                if seq <= since:
+                    break
+                changed.append((event_id, deleted_at is not None))
+            changed.reverse()
+            return {
+                "events": [self._event(event_id) for event_id, deleted in changed if not deleted],
+                "deleted": [event_id for event_id, deleted in changed if deleted],
+                "seq": self._seq
+            }
+
+    def _occurrences(self, window_start: int, window_end: int, masters: Dict[str, Event]) -> List[Event]:
+        """구간에 걸치는 반복 일정의 발생을 일정으로 만들어 반환합니다. masters는 원본 일정 캐시입니다."""
+        occurrences = []
+        for start, end, event_id in self._recurrence.occurrences(window_start, window_end):
+            if event_id not in masters:
+                masters[event_id] = self._event(event_id)
+            occurrences.append(make_occurrence(masters[event_id], start, end))
+        return occurrences
+
+    def _occurrences_within(self, range_start: Optional[int], range_end: Optional[int]) -> List[Event]:
+        """[range_start, range_end] 기간 안에 완전히 포함되는 반복 일정의 발생을 반환합니다."""
+        window = recurrence_window(
+            range_start,
+            range_end + 1 if range_end is not None else None,
+            settings.EVENT_RECURRENCE_HORIZON_DAYS
+        )
+        return [
+            occurrence for occurrence in self._occurrences(*window, {})
+            if (range_start is None or occurrence.start >= range_start)
+            and (range_end is None or occurrence.end <= range_end)
+        ]
+
+    def get_events(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Event]:
+        """일정을 조회합니다. 기간이 주어지면 그 안에 포함되는 일정(반복 일정의 발생 포함)을 시작 시각 순으로 반환합니다."""
+        with self._lock:
+            self._reload_if_changed()
+            if not start_date and not end_date:
+                return [self._materialize(value) for value in self._events.values()]
+
+            range_start = to_epoch(start_date)
+            range_end = to_epoch(end_date, is_end=True)
+            events = [self._event(event_id) for event_id in self._time_index.within(range_start, range_end)]
+            if self._recurrence:
+                events.extend(self._occurrences_within(range_start, range_end))
+                events.sort(key=lambda event: (event.start, event.id))
+            return events
+
+    def search_events(
+        self,
+        query: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> List[Event]:
+        """일정을 검색합니다. 검색어는 역색인으로, 기간은 기간 인덱스로 걸러냅니다."""
+        with self._lock:
+            if not query:
+                return self.get_events(start_date, end_date)
+
+            self._reload_if_changed()
+            self._ensure_text_index()
+            events = self._text_index.search(query, self._event)
+            if not start_date and not end_date:
+                return events
+
+            range_start = to_epoch(start_date)
+            range_end = to_epoch(end_date, is_end=True)
+            window = recurrence_window(
+                range_start,
+                range_end + 1 if range_end is not None else None,
+                settings.EVENT_RECURRENCE_HORIZON_DAYS
+            )
+            results = []
+            for event in events:
+                if event.id not in self._recurrence:
+                    if self._time_index.contains(event.id, range_start, range_end):
+                        results.append(event)
+                    continue
+                for start, end in self._recurrence.occurrences_of(event.id, *window):
+                    if (range_start is None or start >= range_start) and (range_end is None or end <= range_end):
+                        results.append(make_occurrence(event, start, end))
+            return results
+
+    def _sorted_entries(
+        self,
+        range_start: Optional[int],
+        range_end: Optional[int],
+        after: Optional[Tuple[int, str]]
+    ) -> Iterator[Tuple[Tuple[int, str], Union[str, Event]]]:
+        """조회 대상을 (정렬 키, 일정 id 또는 반복 일정의 발생) 형태로 정렬 키 순서대로 하나씩 반환합니다.
+
+        기간 인덱스는 필요한 만큼만 훑고, 날짜가 없는 일정은 날짜가 있는 일정을 모두 반환한 뒤에 모읍니다.
+        """
+        ranged = range_start is not None or range_end is not None
+        dated = self._time_index.iter_within(range_start, range_end, after)
+        sources = [((key, key[1]) for key in dated)]
+        if self._recurrence and ranged:
+            occurrences = sorted(
+                (occurrence.sort_key(), occurrence)
+                for occurrence in self._occurrences_within(range_start, range_end)
+            )
+        elif self._recurrence:
+            # 기간이 없으면 get_events와 같이 반복 일정의 원본을 반환
+            occurrences = sorted(
+                ((self._recurrence.span_of(event_id)[0], event_id), event_id) for event_id in self._recurrence
+            )
+        else:
+            occurrences = []
+        sources.append(entry for entry in occurrences if after is None or entry[0] > after)
+        entries = heapq.merge(*sources, key=lambda entry: entry[0])
+        if ranged:
+            return entries
+
+        def undated():
+            keys = sorted(
+                (UNDATED_SORT_KEY, event_id) for event_id in self._events
+                if self._time_index.span_of(event_id) is None and event_id not in self._recurrence
+            )
+            for key in keys:
+                if after is None or key > after:
+                    yield key, key[1]
+
+        return itertools.chain(entries, undated())
+
+    def search_page(
+        self,
+        query: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 10,
+        after: Optional[Tuple[int, str]] = None
+    ) -> Tuple[List[Event], Optional[Tuple[int, str]]]:
+        """검색 결과를 (시작 시각, id) 순으로 limit개까지 반환합니다.
+
+        after(이전 페이지 마지막 일정의 sort_key()) 다음부터 시작하며, 페이지가 차면 인덱스 탐색을 멈춥니다.
+        (일정 목록, 다음 페이지가 있으면 마지막 일정의 정렬 키)를 반환합니다.
+        """
+        with self._lock:
+            self._reload_if_changed()
+            matched = None
+            if query:
+                self._ensure_text_index()
+                matched = {event.id for event in self._text_index.search(query, self._event)}
+
+            page: List[Union[str, Event]] = []
+            for _, item in self._sorted_entries(to_epoch(start_date), to_epoch(end_date, is_end=True), after):
+                master_id = item if isinstance(item, str) else item.extra["recurring_event_id"]
+                if matched is not None and master_id not in matched:
+                    continue
+                page.append(item)
+                if len(page) > limit:
+                    break
+
+            has_more = len(page) > limit
+            events = [self._event(item) if isinstance(item, str) else item for item in page[:limit]]
+        return events, (events[-1].sort_key() if has_more and events else None)
+
+    def find_conflicts(self, event_id: str) -> Optional[List[Event]]:
+        """해당 일정과 시간이 겹치는 다른 일정(반복 일정의 발생 포함)을 반환합니다. 일정이 없으면 None.
+
+        반복 일정이면 첫 발생과 겹치는 일정을 찾습니다.
+        """
+        with self._lock:
+            self._reload_if_changed()
+            if event_id not in self._events:
+                return None
+
+            span = self._time_index.span_of(event_id) or self._recurrence.span_of(event_id)
+            if span is None:
+                return []
+            conflicts = [
+                self._event(other_id) for other_id in self._time_index.overlapping(*span)
+                if other_id != event_id
+            ]
+            if self._recurrence:
+                conflicts.extend(
+                    occurrence for occurrence in self._occurrences(span[0], span[1], {})
+                    if occurrence.extra["recurring_event_id"] != event_id
+                )
+                conflicts.sort(key=lambda event: (event.start, event.id))
+            return conflicts
 
-            filtered_events.append(event)
+    def find_all_conflicts(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> List[Tuple[Event, Event]]:
+        """기간 안에서 서로 시간이 겹치는 모든 일정 쌍을 반환합니다.
 
-        return filtered_events
+        반복 일정은 기간 안의 발생만 확인하며, 기간이 열려 있으면 EVENT_RECURRENCE_HORIZON_DAYS 만큼만 펼칩니다.
+        """
+        range_start = to_epoch(start_date)
+        range_end = to_epoch(end_date, is_end=True)
+        with self._lock:
+            self._reload_if_changed()
+            # 일정 id 또는 반복 일정의 발생(Event)을 키로 사용
+            entries: List[Tuple[int, int, Any]] = self._time_index.overlapping_entries(
+                range_start if range_start is not None else float("-inf"),
+                range_end if range_end is not None else float("inf")
+            )
+            if self._recurrence:
+                window = recurrence_window(range_start, range_end, settings.EVENT_RECURRENCE_HORIZON_DAYS)
+                entries.extend(
+                    (occurrence.start, occurrence.end, occurrence)
+                    for occurrence in self._occurrences(*window, {})
+                )
+                entries.sort(key=lambda entry: entry[0])
+            pairs = sweep_conflicts(entries)
 
-    def search_events(self, query: str) -> List[Dict[str, Any]]:
-        """일정을 검색합니다."""
-        query = query.lower()
-        results = []
-        for event in self.events:
-            if (query in event.get("title", "").lower() or
-                query in event.get("description", "").lower() or
-                query in event.get("location", "").lower()):
-                results.append(event)
-        return results 
\ No newline at end of file
+            # 여러 쌍에 등장하는 일정은 한 번만 풂
+            events: Dict[str, Event] = {}
+            for key in {key for pair in pairs for key in pair if isinstance(key, str)}:
+                events[key] = self._event(key)
+            resolve = lambda key: events[key] if isinstance(key, str) else key
+            return [(resolve(first), resolve(second)) for first, second in pairs]
@@ -0,0 +1,48 @@
+from pathlib import Path
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+    import time
+
+class FileLock:
+    """여러 프로세스(uvicorn 워커 등) 사이의 배타적 파일 잠금
+
+    잠금 파일 하나를 열어 두고 acquire/release로 잠금을 잡고 풉니다. 한 프로세스 안에서의 중첩 여부는
+    호출하는 쪽에서 관리하며, 잠금을 잡은 스레드와 다른 스레드에서 풀어도 됩니다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """잠금을 얻습니다. blocking이 False이면 기다리지 않고, 다른 프로세스가 잡고 있으면 False를 반환합니다."""
+        if fcntl is not None:
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+            return True
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                msvcrt.locking(self._fd, msvcrt.LK_NBLCK, 1)
+                return True
+            except OSError:
+                if not blocking:
+                    return False
+                time.sleep(0.01)
+
+    def release(self):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            return
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+
+    def close(self):
+        os.close(self._fd)
@@ -0,0 +1,210 @@
+from typing import Optional, List, Dict, Any, Tuple
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+import hashlib
+import json
+import math
+import re
+import pytz
+
+KST = pytz.timezone('Asia/Seoul')
+
+# 프롬프트에는 분 단위 현재 시각이 들어감. 사용자 입력이 현재 시각과 무관할 때만 키에서 제외 (날짜는 자정에 전체 만료)
+_CURRENT_TIME_PATTERN = re.compile(r'현재 시간:\s*\d{1,2}:\d{2}')
+# 현재 시각을 기준으로 해석해야 하는 표현 ("1시간 뒤에", "지금", "오늘 남은 일정"). "오후"의 "후"는 제외
+_RELATIVE_TIME_PATTERN = re.compile(r'지금|이따|방금|곧|나중|남은|남았|(?<!오)후|뒤|전에|\d+\s*(분|시간)\s*전')
+# 워크플로우가 처리 중인 사용자 입력. 설정되지 않았으면 현재 시각을 항상 키에 포함
+_user_input: ContextVar[Optional[str]] = ContextVar("llm_cache_user_input", default=None)
+
+@contextmanager
+def cache_user_input(user_input: str):
+    """이 블록 안의 LLM 호출이 어떤 사용자 입력을 처리하는지 캐시에 알려 줍니다."""
+    token = _user_input.set(user_input)
+    try:
+        yield
+    finally:
+        _user_input.reset(token)
+
+def depends_on_current_time(user_input: Optional[str]) -> bool:
+    """사용자 입력이 현재 시각에 따라 다르게 해석되는지 여부. 입력을 모르면 True."""
+    return user_input is None or bool(_RELATIVE_TIME_PATTERN.search(user_input))
+# "뭐 있어?"와 "뭐있어"를 같은 입력으로 취급 (숫자 사이의 마침표는 유지)
+_PUNCTUATION_PATTERN = re.compile(r'[?？!！~]+|(?<!\d)\.|\.(?!\d)')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_DIGITS_PATTERN = re.compile(r'\d+')
+# 유사도 조회에서 반드시 같아야 하는 날짜/시간 표현 ("내일 회의"와 "모레 회의"는 임베딩이 거의 같음)
+_GUARD_WORDS = (
+    '오늘', '내일', '모레', '글피', '어제', '이번주', '다음주', '지난주', '이번달', '다음달', '내년',
+    '월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일',
+    '오전', '오후', '아침', '점심', '저녁', '밤', '새벽', '반'
+)
+
+def normalize_prompt(prompt: str, keep_time: bool = True) -> str:
+    """캐시 키에 사용할 프롬프트 정규화: 문장부호/공백 차이 무시, 소문자화. keep_time이 False이면 현재 시각도 제거"""
+    if not keep_time:
+        prompt = _CURRENT_TIME_PATTERN.sub('', prompt)
+    prompt = _PUNCTUATION_PATTERN.sub('', prompt)
+    return _WHITESPACE_PATTERN.sub('', prompt).lower()
+
+def next_midnight(now: datetime) -> datetime:
+    """now 다음의 한국 시간 자정을 반환합니다."""
+    now = now.astimezone(KST)
+    return KST.localize(datetime.combine(now.date() + timedelta(days=1), datetime.min.time()))
+
+class LLMResponseCache:
+    """LLM 응답 캐시 (LRU, 한국 시간 자정에 전체 만료)
+
+    키는 정규화한 프롬프트(메시지 목록) + 모델 + temperature(+ response_format)이며, 프롬프트 속 현재 시각은
+    처리 중인 사용자 입력(cache_user_input)에 "지금", "~후", "남은" 같은 상대 시간 표현이 없을 때만 키에서 뺍니다.
+    similarity_threshold가 0보다 크면 정확히 일치하는 항목이 없을 때 임베딩 코사인 유사도로 비슷한 프롬프트를 찾습니다.
+    유사도 조회는 숫자와 날짜/시간 표현이 모두 같은 항목만 후보로 삼습니다.
+    """
+
+    def __init__(self, max_entries: int = 512, similarity_threshold: float = 0.0):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        # 키 → (응답, 정규화한 프롬프트 또는 None, 단위 벡터 또는 None)
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[str], Optional[List[float]]]]" = OrderedDict()
+        self._expires_at = next_midnight(datetime.now(KST))
+        self.hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+
+    def _expire(self):
+        now = datetime.now(KST)
+        if now >= self._expires_at:
+            if self._entries:
+                print(f"🧹 날짜가 바뀌어 LLM 응답 캐시 {len(self._entries)}건을 비웠습니다.")
+            self._entries.clear()
+            self._expires_at = next_midnight(now)
+
+    @staticmethod
+    def make_key(
+        messages: List[Dict[str, Any]],
+        model: str,
+        temperature: Any,
+        keep_time: bool = True,
+        **options
+    ) -> Tuple[str, str]:
+        """(캐시 키, 정규화한 프롬프트)를 반환합니다."""
+        prompt = "\n".join(
+            f"{message.get('role')}:{normalize_prompt(str(message.get('content', '')), keep_time)}" for message in messages
+        )
+        header = json.dumps([model, temperature, options], sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(f"{header}\n{prompt}".encode("utf-8")).hexdigest(), f"{header}\n{prompt}"
+
+    def get(self, key: str) -> Optional[Any]:
+        self._expire()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def find_similar(self, prompt: str, vector: List[float]) -> Optional[Any]:
+        """같은 모델/옵션으로 캐시된 프롬프트 중 유사도가 기준 이상인 가장 비슷한 항목의 응답을 반환합니다."""
+        self._expire()
+        header, _, body = prompt.partition("\n")
+        guard = _similarity_guard(body)
+        best_key, best_score = None, self.similarity_threshold
+        for key, (_, cached_prompt, cached_vector) in self._entries.items():
+            if cached_vector is None:
+                continue
+            cached_header, _, cached_body = cached_prompt.partition("\n")
+            if cached_header != header or _similarity_guard(cached_body) != guard:
+                continue
+            score = sum(a * b for a, b in zip(vector, cached_vector))
+            if score >= best_score:
+                best_key, best_score = key, score
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        self.similar_hits += 1
+        return self._entries[best_key][0]
+
+    def put(self, key: str, response: Any, prompt: Optional[str] = None, vector: Optional[List[float]] = None):
+        self._expire()
+        self._entries[key] = (response, prompt, _unit(vector) if vector else None)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        hits = self.hits + self.similar_hits
+        total = hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "similar_hits": self.similar_hits,
+            "misses": self.misses,
+            "hit_rate": hits / total if total else 0.0
+        }
+
+class CachedChatCompletions:
+    """AsyncOpenAI의 chat.completions를 감싸 같은(또는 비슷한) 요청은 네트워크 호출 없이 캐시된 응답을 반환합니다.
+
+    stream=True 요청과 n > 1 요청은 캐시하지 않습니다.
+    """
+
+    def __init__(self, completions, cache: LLMResponseCache, embeddings=None, embedding_model: str = "text-embedding-3-small"):
+        self._completions = completions
+        self.cache = cache
+        self._embeddings = embeddings
+        self._embedding_model = embedding_model
+
+    async def _embed(self, prompt: str) -> Optional[List[float]]:
+        try:
+            # 모델/옵션 줄은 빼고 프롬프트 본문만 임베딩
+            response = await self._embeddings.create(model=self._embedding_model, input=prompt.partition("\n")[2])
+            return response.data[0].embedding
+        except Exception as e:
+            print(f"⚠️ 임베딩 생성 실패, 유사도 캐시 조회를 건너뜁니다: {str(e)}")
+            return None
+
+    async def create(self, **kwargs):
+        if kwargs.get("stream") or (kwargs.get("n") or 1) > 1:
+            return await self._completions.create(**kwargs)
+
+        options = {name: value for name, value in kwargs.items() if name not in ("model", "messages", "temperature")}
+        key, prompt = self.cache.make_key(
+            kwargs.get("messages", []),
+            kwargs.get("model"),
+            kwargs.get("temperature"),
+            keep_time=depends_on_current_time(_user_input.get()),
+            **options
+        )
+        response = self.cache.get(key)
+        if response is not None:
+            print("✅ LLM 응답 캐시 적중")
+            return response
+
+        vector = None
+        if self.cache.similarity_threshold > 0 and self._embeddings is not None:
+            vector = await self._embed(prompt)
+            if vector is not None:
+                response = self.cache.find_similar(prompt, _unit(vector))
+                if response is not None:
+                    print("✅ LLM 응답 캐시 적중 (유사 프롬프트)")
+                    return response
+
+        self.cache.misses += 1
+        response = await self._completions.create(**kwargs)
+        self.cache.put(key, response, prompt, vector)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._completions, name)
+
+def _similarity_guard(prompt: str) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+    """유사도 조회 후보가 되려면 같아야 하는 값: 프롬프트 속 숫자들과 날짜/시간 표현의 등장 횟수"""
+    return tuple(_DIGITS_PATTERN.findall(prompt)), tuple(prompt.count(word) for word in _GUARD_WORDS)
+
+def _unit(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(value * value for value in vector))
+    return [value / norm for value in vector] if norm else list(vector)
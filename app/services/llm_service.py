@@ -1,7 +1,11 @@
 from typing import Optional, List, Dict, Any, TypedDict, Annotated
-from openai import OpenAI
+from openai import AsyncOpenAI
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, END
 from app.core.config import get_settings
+from app.services.event_index import SECONDS_PER_DAY
+from app.services.event_model import Event, format_epoch
+from app.services.llm_cache import LLMResponseCache, CachedChatCompletions, cache_user_input
 # from app.services.google_calendar_service import GoogleCalendarService
 # from app.services.vector_store import VectorStoreService
 import json
@@ -357,6 +361,19 @@ def extract_title_from_input(user_input: str) -> str:
     
     return '새 일정'
 
+def _parse_clock(value: Optional[str]) -> Optional[int]:
+    """"HH:MM" 형식의 시각을 자정 기준 분으로 변환합니다. 형식이 맞지 않으면 None."""
+    if not value or not re.match(r'^\d{2}:\d{2}$', value):
+        return None
+    hours, minutes = int(value[:2]), int(value[3:])
+    if hours > 23 or minutes > 59:
+        return None
+    return hours * 60 + minutes
+
+def _format_clock(minutes: int) -> str:
+    minutes %= 24 * 60
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
 def validate_and_correct_info(info: dict, current_date: datetime) -> dict:
     """추출된 정보 검증 및 보정"""
     try:
@@ -387,31 +404,26 @@ def validate_and_correct_info(info: dict, current_date: datetime) -> dict:
         end_time = info.get('end_time')
         if end_time and not re.match(r'^\d{2}:\d{2}$', end_time):
             info['end_time'] = None  # 잘못된 형식이면 초기화
-          # 종료 시간 자동 설정 (시간이 있는 경우에만)
+          # 시작 시각은 한 번만 파싱하여 아래 보정에 함께 사용 (분 단위)
+        start_minutes = _parse_clock(info.get('start_time'))
+        
+        # 종료 시간 자동 설정 (시간이 있는 경우에만)
         if info.get('start_time') and not info.get('end_time') and not info.get('all_day', False):
-            try:
-                start_dt = datetime.strptime(info['start_time'], '%H:%M')
+            if start_minutes is not None:
                 # 커스터마이징 포인트: 기본 일정 길이 변경 가능 (현재 1시간)
-                end_dt = start_dt + timedelta(hours=1)  # 기본 1시간, 필요시 변경
-                info['end_time'] = end_dt.strftime('%H:%M')
+                info['end_time'] = _format_clock(start_minutes + 60)  # 기본 1시간, 필요시 변경
                 print(f"🕐 종료 시간 자동 설정: {info['start_time']} → {info['end_time']}")
-            except:
+            else:
                 info['end_time'] = None
         
         # 종료 시간이 시작 시간보다 빠른 경우 보정 (시간이 있는 경우에만)
         if info.get('start_time') and info.get('end_time') and not info.get('all_day', False):
-            try:
-                start_dt = datetime.strptime(info['start_time'], '%H:%M')
-                end_dt = datetime.strptime(info['end_time'], '%H:%M')
-                
-                if end_dt <= start_dt:
-                    print(f"⚠️ 종료 시간이 시작 시간보다 빠름: {info['start_time']} → {info['end_time']}")
-                    # 다음날로 가정하지 않고 1시간 후로 설정
-                    end_dt = start_dt + timedelta(hours=1)
-                    info['end_time'] = end_dt.strftime('%H:%M')
-                    print(f"✅ 종료 시간 보정됨: {info['end_time']}")
-            except:
-                pass
+            end_minutes = _parse_clock(info['end_time'])
+            if start_minutes is not None and end_minutes is not None and end_minutes <= start_minutes:
+                print(f"⚠️ 종료 시간이 시작 시간보다 빠름: {info['start_time']} → {info['end_time']}")
+                # 다음날로 가정하지 않고 1시간 후로 설정
+                info['end_time'] = _format_clock(start_minutes + 60)
+                print(f"✅ 종료 시간 보정됨: {info['end_time']}")
         
         # 종료 날짜 설정
         if not info.get('end_date'):
@@ -449,6 +461,153 @@ def get_default_event_info() -> dict:
         "category": "other"
     }
 
+# =============================================================================
+# 규칙 기반 파서 (LLM 호출 없이 처리할 수 있는 단순한 입력)
+# =============================================================================
+
+# 상대 날짜 규칙 중 하루를 가리키는 표현 (긴 표현부터 매칭)
+_RULE_DAY_KEYS = ["오늘", "내일", "모레", "글피"] + [
+    f"{week} {day}요일" for week in ("이번주", "다음주") for day in "일월화수목금토"
+]
+_RULE_DAY_PATTERN = re.compile(
+    r'(\d{1,2})월\s*(\d{1,2})일|' + "|".join(sorted(map(re.escape, _RULE_DAY_KEYS), key=len, reverse=True))
+)
+# 조회에서만 사용하는 한 주 전체 표현
+_RULE_WEEK_PATTERN = re.compile(r'(이번주|다음주)(?!\s*[일월화수목금토]요일)')
+# "오후 3시", "3시 30분", "7시 반", "15:00"
+_RULE_TIME_PATTERN = re.compile(
+    r'(오전|오후|아침|낮|저녁|밤)?\s*(\d{1,2})\s*시\s*(?:(\d{1,2})\s*분|(반))?|(\d{1,2}):(\d{2})'
+)
+# 날짜/시간 표현에 붙은 조사 ("내일은", "3시엔", "월요일에는")
+_RULE_PARTICLE = re.compile(r'^(에는|에도|엔|에|은|는|도)(?=\s|$)')
+# 여러 일정, 기간/반복 일정처럼 전용 추출 단계가 필요한 표현이 있으면 LLM으로 처리
+_RULE_BLOCKERS = (
+    '부터', '까지', '동안', '내내', '일간', '박', '매일', '매주', '매월', '마다',
+    '그리고', '추가로', '하고', '랑', '또 ', '~',
+    '휴가', '여행', '출장', '캠프', '워크샵', '세미나', '연수', '방학', '휴업',
+    '수정', '변경', '바꿔', '삭제', '지워', '취소', '복사', '옮겨', '미뤄', '당겨'
+)
+# 일정 추가는 명시적인 추가 요청이나 의무 표현으로 끝날 때만 처리 ("~기로 했어" 같은 표현은 제목 추출이 불안정)
+_RULE_ADD_ENDING = re.compile(r'((추가|등록|예약)\s*(해\s*줘|해\s*주세요|해)?|(잡아|넣어)\s*(줘|주세요)?|(가|와|봐|해)야\s*(해|돼))\s*[.!]?$')
+# 날짜를 뺀 나머지가 이 형태일 때만 기간 전체 조회로 처리 ("일정 뭐 있어", "스케줄 알려줘")
+_RULE_SEARCH_REST = re.compile(
+    r'^(나\s*)?(의\s*)?((내\s*)?(일정|스케줄|약속)\s*(은|이|좀)?\s*)?'
+    r'(뭐\s*(있어|있나|있지|야)|알려\s*줘|보여\s*줘|확인\s*해\s*줘|있어)\s*[?？]?$'
+)
+
+def _rule_parse_time(match) -> Optional[str]:
+    """시간 표현 매칭을 "HH:MM"으로 변환합니다. 오전/오후 구분이 없어 모호하면 None."""
+    if match.group(5) is not None:
+        hours, minutes = int(match.group(5)), int(match.group(6))
+        return _format_clock(hours * 60 + minutes) if hours <= 23 and minutes <= 59 else None
+    meridiem, hours = match.group(1), int(match.group(2))
+    minutes = 30 if match.group(4) else int(match.group(3) or 0)
+    if minutes > 59 or hours > 24:
+        return None
+    if meridiem is None:
+        # "3시"는 오전/오후를 알 수 없으므로 13시 이후 표기만 확정
+        if hours < 13:
+            return None
+    elif meridiem in ('오후', '저녁', '밤'):
+        if hours == 12 and meridiem != '오후':
+            return None
+        if hours < 12:
+            hours += 12
+    elif meridiem == '낮':
+        if not 11 <= hours <= 12 and not 1 <= hours <= 5:
+            return None
+        if hours <= 5:
+            hours += 12
+    elif hours >= 12:  # 오전/아침 (오전 12시는 자정인지 정오인지 모호함)
+        return None
+    if hours == 24:
+        return None
+    return _format_clock(hours * 60 + minutes)
+
+def _rule_parse_day(match, current_date: datetime, date_rules: dict) -> Optional[str]:
+    """날짜 표현 매칭을 "YYYY-MM-DD"로 변환합니다. 존재하지 않는 날짜면 None."""
+    if match.group(1) is None:
+        return date_rules[match.group(0)]
+    try:
+        return current_date.replace(month=int(match.group(1)), day=int(match.group(2))).strftime('%Y-%m-%d')
+    except ValueError:
+        return None
+
+def rule_based_extraction(user_input: str, current_date: datetime) -> Optional[dict]:
+    """LLM 없이 단순한 일정 추가/조회 요청을 처리합니다.
+
+    날짜 하나(와 시간 하나)로 이루어진 단일 일정 추가, 또는 특정 날짜/주의 일정 조회만 처리하며,
+    조금이라도 모호하면 None을 반환하여 LLM 워크플로우로 넘깁니다.
+    반환 형식: {"intent": ..., "extracted_info": ...} (extracted_info는 LLM 추출 결과와 같은 형태)
+    """
+    text = re.sub(r'(이번|다음)\s+주', r'\1주', user_input.strip())
+    if not text or any(blocker in text for blocker in _RULE_BLOCKERS):
+        return None
+    
+    intent = keyword_based_classification(text).get('intent')
+    if intent not in ('calendar_add', 'calendar_search'):
+        return None
+    
+    date_rules = get_relative_date_rules(current_date)
+    today = current_date.strftime('%Y-%m-%d')
+    day_matches = list(_RULE_DAY_PATTERN.finditer(text))
+    week_matches = list(_RULE_WEEK_PATTERN.finditer(text)) if intent == 'calendar_search' else []
+    if len(day_matches) + len(week_matches) != 1:
+        return None
+    
+    if week_matches:
+        date_match = week_matches[0]
+        start_date = date_rules[f"{date_match.group(1)} 일요일"]
+        end_date = date_rules[f"{date_match.group(1)} 토요일"]
+    else:
+        date_match = day_matches[0]
+        start_date = end_date = _rule_parse_day(date_match, current_date, date_rules)
+        # 지난 날짜는 연도 보정 규칙이 필요하므로 LLM으로 처리
+        if start_date is None or start_date < today:
+            return None
+    rest = (text[:date_match.start()] + " " + _RULE_PARTICLE.sub('', text[date_match.end():])).strip()
+    
+    if intent == 'calendar_search':
+        if not _RULE_SEARCH_REST.match(rest):
+            return None
+        # 날짜가 규칙으로 확정되었으므로 과거 날짜 보정(validate_and_correct_info)을 거치지 않음
+        extracted_info = get_default_event_info()
+        extracted_info.update({"start_date": start_date, "end_date": end_date, "is_multiple": False})
+        return {"intent": intent, "extracted_info": extracted_info}
+    
+    if not _RULE_ADD_ENDING.search(rest):
+        return None
+    time_matches = list(_RULE_TIME_PATTERN.finditer(rest))
+    if len(time_matches) > 1:
+        return None
+    start_time = None
+    if time_matches:
+        start_time = _rule_parse_time(time_matches[0])
+        if start_time is None:
+            return None
+        rest = rest[:time_matches[0].start()] + " " + _RULE_PARTICLE.sub('', rest[time_matches[0].end():])
+    
+    title = extract_title_from_input(rest.strip())
+    # "팀 회의"처럼 회의/미팅 등이 제목의 일부인 경우 extract_title_from_input이 잘라낸 부분을 되살림
+    title_match = re.search(re.escape(title) + r'\s*(미팅|회의|만남|약속|수업)', rest)
+    if title_match:
+        title = title_match.group(0)
+    # 제목에 숫자나 날짜/시간 표현이 남아 있으면 파싱이 불완전한 것으로 판단
+    if title == '새 일정' or len(title) > 30 or re.search(r'\d|오전|오후|저녁|아침|요일|시에', title):
+        return None
+    
+    extracted_info = get_default_event_info()
+    extracted_info.update({
+        "title": title,
+        "start_date": start_date,
+        "end_date": end_date,
+        "start_time": start_time,
+        "all_day": start_time is None
+    })
+    extracted_info = validate_and_correct_info(extracted_info, current_date)
+    extracted_info["is_multiple"] = False
+    return {"intent": intent, "extracted_info": extracted_info}
+
 # =============================================================================
 # 상태 정의
 # =============================================================================
@@ -462,21 +621,220 @@ class CalendarState(TypedDict):
     action_type: Optional[str]
     calendar_result: Optional[Dict[str, Any]]
     context: Optional[List[str]]
+    fast_path: Optional[str]  # 빠른 경로 결과: "rule"(규칙 기반 파서로 처리), "hit"(추출 완료), "intent"(의도만 확정), "miss"
+
+# 빠른 경로에서 추출까지 끝낼 수 있는 의도. 수정/삭제/복사와 기간 일정은 전용 추출 단계가 필요
+FAST_PATH_INTENTS = ("calendar_add", "calendar_search", "general_chat")
+FAST_PATH_CARDINALITIES = ("SINGLE", "MULTIPLE")
+
+class _WorkflowNode(RunnableLambda):
+    """이름으로만 표시되는 워크플로우 노드
+
+    langchain-core는 노드를 실행할 때마다 repr()로 직렬화하는데, 기본 RunnableLambda는 이때 함수 소스를
+    다시 읽어 파싱하므로(inspect.getsource + ast.parse) 긴 노드 함수에서는 대화 한 번에 수백 ms의 CPU를 씁니다.
+    """
+
+    @property
+    def deps(self) -> List[Any]:
+        # 노드 안에서 다른 Runnable을 쓰지 않으므로 소스를 분석할 필요가 없음
+        return []
+
+    def __repr__(self) -> str:
+        return f"WorkflowNode({self.name})"
 
 # =============================================================================
 # 메인 서비스 클래스
 # =============================================================================
 
 class LLMService:
+    """AI 캘린더 워크플로우와 OpenAI 호출을 담당하는 서비스
+
+    OpenAI 클라이언트(HTTP 연결 풀)와 컴파일된 워크플로우는 요청마다 만들지 않고, 앱 시작 시 만든 인스턴스 하나를
+    모든 요청이 함께 사용합니다. (app.main의 lifespan 참고) 워크플로우 상태는 요청마다 새로 만들어 넘기므로
+    여러 요청이 동시에 사용해도 됩니다.
+    """
+
     def __init__(self):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        # 워크플로우 노드는 모두 비동기이며, OpenAI 응답을 기다리는 동안 이벤트 루프가 다른 대화를 처리함
+        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        # 같은 요청은 OpenAI를 다시 호출하지 않도록 chat.completions를 응답 캐시로 감쌈
+        self.response_cache = None
+        if settings.LLM_CACHE_ENABLED:
+            self.response_cache = LLMResponseCache(
+                max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+                similarity_threshold=settings.LLM_CACHE_SIMILARITY_THRESHOLD
+            )
+            self.client.chat.completions = CachedChatCompletions(
+                self.client.chat.completions,
+                self.response_cache,
+                embeddings=self.client.embeddings,
+                embedding_model=settings.LLM_CACHE_EMBEDDING_MODEL
+            )
+        # 규칙 기반 파서 적중 통계 (LLM 호출 없이 처리된 요청 수 / 전체 요청 수)
+        self.rule_parser_hits = 0
+        self.rule_parser_total = 0
         # # self.calendar_service = GoogleCalendarService()
         # self.vector_store = VectorStoreService()
         self.workflow = self._create_calendar_workflow()
+
+    async def close(self):
+        """OpenAI 클라이언트의 연결 풀을 닫습니다."""
+        await self.client.close()
+    
+    def get_rule_parser_stats(self) -> Dict[str, Any]:
+        """규칙 기반 파서의 적중 통계를 반환합니다."""
+        total = self.rule_parser_total
+        return {
+            "hits": self.rule_parser_hits,
+            "total": total,
+            "hit_rate": self.rule_parser_hits / total if total else 0.0
+        }
         
     def _create_calendar_workflow(self):
         """AI 캘린더를 위한 LangGraph 워크플로우를 생성합니다."""
-        def classify_intent(state: CalendarState) -> CalendarState:
+        async def rule_extract(state: CalendarState) -> CalendarState:
+            """0단계: 규칙 기반 파서 - 단순한 추가/조회 요청은 LLM 호출 없이 의도와 일정 정보를 추출"""
+            state['fast_path'] = "miss"
+            if not settings.LLM_RULE_PARSER_ENABLED:
+                return state
+            try:
+                current_date = datetime.now(pytz.timezone('Asia/Seoul'))
+                result = rule_based_extraction(state['current_input'], current_date)
+            except Exception as e:
+                print(f"규칙 기반 파싱 중 오류: {str(e)}")
+                result = None
+            
+            self.rule_parser_total += 1
+            if result is not None:
+                self.rule_parser_hits += 1
+                state['intent'] = result['intent']
+                state['extracted_info'] = result['extracted_info']
+                state['fast_path'] = "rule"
+            stats = self.get_rule_parser_stats()
+            print(f"{'✅' if result is not None else '⚠️'} 규칙 기반 파서 {'적중' if result is not None else '미적중'} "
+                  f"(적중률 {stats['hits']}/{stats['total']}, {stats['hit_rate']:.1%})")
+            return state
+        
+        async def fast_extract(state: CalendarState) -> CalendarState:
+            """0단계: 빠른 경로 - 의도, 일정 개수, 일정 정보를 한 번의 JSON 응답으로 추출
+
+            신뢰도가 충분하고 추가/조회/일반 대화처럼 이 응답만으로 처리할 수 있으면 분류/추출 단계를 건너뜁니다.
+            의도만 확실하면 의도 분류만 건너뛰고, 그 외에는 기존 단계별 워크플로우로 처리합니다.
+            """
+            state['fast_path'] = "miss"
+            if not settings.LLM_FAST_PATH_ENABLED:
+                return state
+            try:
+                current_date = datetime.now(pytz.timezone('Asia/Seoul'))
+                date_rules = get_relative_date_rules(current_date)
+                rule_text = "\n".join([f'- "{key}" → {value}' for key, value in date_rules.items()])
+                prompt = f"""
+현재 날짜: {current_date.strftime('%Y년 %m월 %d일 %A')}
+현재 시간: {current_date.strftime('%H:%M')}
+
+사용자 입력을 분석하여 의도, 일정 개수, 일정 정보를 한 번에 추출해주세요:
+"{state['current_input']}"
+
+**의도 (intent):**
+- calendar_add: 새로운 일정 추가 ("~해야해", "~하기로 했어", "~예정이야" 같은 간접 표현 포함)
+- calendar_update: 기존 일정 수정
+- calendar_delete: 일정 삭제
+- calendar_search: 일정 조회/검색 ("있어?", "뭐 있어?" 같은 의문문 포함)
+- calendar_copy: 일정 복사
+- general_chat: 일반 대화
+
+**일정 개수 (cardinality):**
+- SINGLE: 하나의 일정
+- MULTIPLE: 연결어("그리고", "또", "추가로")로 나열된 서로 다른 여러 일정
+- RANGE: "~부터 ~까지", "3일간", "월,화,수요일에" 같은 기간/반복 일정
+- NONE: 일정 정보 없음 (일반 대화)
+
+**일정 정보 (events):**
+- calendar_add는 일정마다 하나씩, calendar_search는 조회할 기간을 하나로 (start_date~end_date)
+- 제목에서 "추가", "잡아", "해줘", "해야해", "기로 했어" 같은 동작/간접 표현은 빼고 핵심만 (예: "내일 5시에 맥주 일정 추가해줘" → "맥주")
+- 시간이 없으면 start_time/end_time은 null, all_day는 true
+- "6시부터 8시까지" → start_time "18:00", end_time "20:00"; 종료 시간이 없으면 시작 + 1시간
+- 반복은 명시적으로 언급된 경우만 설정
+
+상대적 표현 해석 규칙 (주의 시작: 일요일):
+{rule_text}
+
+다음 JSON 형식으로 응답해주세요. confidence는 의도와 일정 정보 전체에 대한 0~1 사이의 신뢰도입니다:
+{{
+    "intent": "calendar_add",
+    "confidence": 0.95,
+    "cardinality": "SINGLE",
+    "events": [
+        {{
+            "title": "일정 제목",
+            "start_date": "YYYY-MM-DD",
+            "start_time": "HH:MM",
+            "end_date": "YYYY-MM-DD",
+            "end_time": "HH:MM",
+            "description": "",
+            "location": "",
+            "repeat_type": "none|daily|weekly|monthly|yearly",
+            "all_day": false,
+            "priority": "normal|high|low"
+        }}
+    ]
+}}
+"""
+                response = await self.client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.1,
+                    response_format={"type": "json_object"}
+                )
+                
+                response_text = response.choices[0].message.content.strip()
+                print(f"빠른 경로 응답: {response_text}")
+                result = safe_json_parse(response_text, {})
+                
+                intent = result.get('intent')
+                try:
+                    confidence = float(result.get('confidence') or 0)
+                except (TypeError, ValueError):
+                    confidence = 0
+                if confidence < settings.LLM_FAST_PATH_MIN_CONFIDENCE or intent not in (
+                    'calendar_add', 'calendar_update', 'calendar_delete', 'calendar_search', 'calendar_copy', 'general_chat'
+                ):
+                    return state
+                
+                state['intent'] = intent
+                state['fast_path'] = "intent"
+                if intent not in FAST_PATH_INTENTS:
+                    return state
+                if intent == 'general_chat':
+                    state['fast_path'] = "hit"
+                    return state
+                
+                events = [event for event in result.get('events') or [] if isinstance(event, dict) and event.get('start_date')]
+                cardinality = result.get('cardinality')
+                if not events or cardinality not in FAST_PATH_CARDINALITIES:
+                    return state
+                
+                validated_events = []
+                for event in events:
+                    info = get_default_event_info()
+                    info.update({key: value for key, value in event.items() if value is not None or key in ('start_time', 'end_time')})
+                    info["title"] = info.get("title") or extract_title_from_input(state['current_input'])
+                    validated_events.append(validate_and_correct_info(info, current_date))
+                
+                if intent == 'calendar_add' and cardinality == "MULTIPLE" and len(validated_events) > 1:
+                    state['extracted_info'] = {"events": validated_events, "is_multiple": True}
+                else:
+                    extracted_info = validated_events[0]
+                    extracted_info["is_multiple"] = False
+                    state['extracted_info'] = extracted_info
+                state['fast_path'] = "hit"
+                return state
+                
+            except Exception as e:
+                print(f"빠른 경로 처리 중 오류: {str(e)}")
+                return state
+        
+        async def classify_intent(state: CalendarState) -> CalendarState:
             """1단계: 의도 분류 - 간접적 표현 강화"""
             try:
                 prompt = f"""
@@ -532,7 +890,7 @@ class LLMService:
 {{"intent": "분류결과", "confidence": 0.95, "reason": "분류 이유"}}
 """
                 
-                response = self.client.chat.completions.create(
+                response = await self.client.chat.completions.create(
                     model="gpt-4o-mini",
                     messages=[{"role": "user", "content": prompt}],
                     temperature=0.1
@@ -559,7 +917,7 @@ class LLMService:
                 state['intent'] = result.get('intent', 'general_chat')
                 return state
         
-        def extract_information(state: CalendarState) -> CalendarState:
+        async def extract_information(state: CalendarState) -> CalendarState:
             """2단계: 정보 추출 (다중 일정 지원)"""
             try:
                 if state['intent'] == 'general_chat':
@@ -575,11 +933,11 @@ class LLMService:
                 
                 # 삭제의 경우 특별 처리
                 if state['intent'] == 'calendar_delete':
-                    return self._extract_delete_information(state, current_date, rule_text)
+                    return await self._extract_delete_information(state, current_date, rule_text)
                 
                 # 수정의 경우 특별 처리
                 if state['intent'] == 'calendar_update':
-                    return self._extract_update_information(state, current_date, rule_text)                # 기간/범위 기반 일정인지 먼저 판단 (Multi Day Event로 처리)
+                    return await self._extract_update_information(state, current_date, rule_text)                # 기간/범위 기반 일정인지 먼저 판단 (Multi Day Event로 처리)
                 range_patterns = [
                     r'.*(부터|에서).*까지.*',  # "~부터 ~까지", "~에서 ~까지"
                     r'.*\d+일간.*',  # "3일간", "5일간"
@@ -618,7 +976,7 @@ class LLMService:
                             break
                 
                 if is_multi_day or ("부터" in state['current_input'] and "까지" in state['current_input']):
-                    return self._extract_range_events(state, current_date, rule_text)
+                    return await self._extract_range_events(state, current_date, rule_text)
                 
                 # 여러 개별 일정인지 단일 일정인지 판단
                 detection_prompt = f"""
@@ -647,7 +1005,7 @@ class LLMService:
 3. SINGLE:
    - 위 조건에 해당하지 않는 단일 일정
 """
-                detection_response = self.client.chat.completions.create(
+                detection_response = await self.client.chat.completions.create(
                     model="gpt-4o-mini",
                     messages=[{"role": "user", "content": detection_prompt}],
                     temperature=0.1                )
@@ -658,7 +1016,7 @@ class LLMService:
                 
                 if is_range:
                     # 반복되는 개별 일정들로 처리 (예: "월,화,수요일에 회의")
-                    return self._extract_range_events(state, current_date, rule_text)
+                    return await self._extract_range_events(state, current_date, rule_text)
                 elif is_multiple:
                     # 다중 일정 처리
                     prompt = f"""
@@ -807,7 +1165,7 @@ class LLMService:
 6. "다음주"는 다음 주 일요일(주의 시작)을 의미함
 """
                 
-                response = self.client.chat.completions.create(
+                response = await self.client.chat.completions.create(
                     model="gpt-4o-mini",
                     messages=[{"role": "user", "content": prompt}],
                     temperature=0.1
@@ -849,7 +1207,7 @@ class LLMService:
                 state['extracted_info'] = {"events": [default_info], "is_multiple": False}
                 return state
         
-        def determine_action(state: CalendarState) -> CalendarState:
+        async def determine_action(state: CalendarState) -> CalendarState:
             """3단계: 작업 유형 결정"""
             try:
                 intent = state.get('intent', 'general_chat')
@@ -869,7 +1227,7 @@ class LLMService:
                 state['action_type'] = 'chat'
                 return state
         
-        def execute_calendar_action(state: CalendarState) -> CalendarState:
+        async def execute_calendar_action(state: CalendarState) -> CalendarState:
             """4단계: 캘린더 작업 실행 (다중 일정 지원)"""
             try:
                 action_type = state.get('action_type')
@@ -1051,7 +1409,7 @@ class LLMService:
                 state['calendar_result'] = {"error": f"작업 실행 중 오류 발생: {str(e)}"}
                 return state
         
-        def generate_response(state: CalendarState) -> CalendarState:
+        async def generate_response(state: CalendarState) -> CalendarState:
             """5단계: 응답 생성"""
             try:
                 action_type = state.get('action_type', 'chat')
@@ -1072,7 +1430,7 @@ class LLMService:
                     
                     messages.append({"role": "user", "content": state['current_input']})
                     
-                    response = self.client.chat.completions.create(
+                    response = await self.client.chat.completions.create(
                         model="gpt-4o-mini",
                         messages=messages,
                         temperature=0.7  # 자연스러운 대화를 위해 약간 높은 temperature
@@ -1367,14 +1725,50 @@ class LLMService:
         builder = StateGraph(CalendarState)
         
         # 노드 추가
-        builder.add_node("classify_intent", classify_intent)
-        builder.add_node("extract_information", extract_information)
-        builder.add_node("determine_action", determine_action)
-        builder.add_node("execute_calendar_action", execute_calendar_action)
-        builder.add_node("generate_response", generate_response)
+        builder.add_node("rule_extract", _WorkflowNode(rule_extract))
+        builder.add_node("fast_extract", _WorkflowNode(fast_extract))
+        builder.add_node("classify_intent", _WorkflowNode(classify_intent))
+        builder.add_node("extract_information", _WorkflowNode(extract_information))
+        builder.add_node("determine_action", _WorkflowNode(determine_action))
+        builder.add_node("execute_calendar_action", _WorkflowNode(execute_calendar_action))
+        builder.add_node("generate_response", _WorkflowNode(generate_response))
         
         # 엣지 정의
-        builder.set_entry_point("classify_intent")
+        builder.set_entry_point("rule_extract")
+        
+        # 규칙 기반 파서가 처리했으면 LLM 단계를 모두 건너뜀
+        def route_after_rule_extract(state: CalendarState) -> str:
+            if state.get('fast_path') == "rule":
+                return "determine_action"
+            return "fast_extract"
+        
+        builder.add_conditional_edges(
+            "rule_extract",
+            route_after_rule_extract,
+            {
+                "determine_action": "determine_action",
+                "fast_extract": "fast_extract"
+            }
+        )
+        
+        # 빠른 경로 결과에 따라 분류/추출 단계를 건너뜀
+        def route_after_fast_extract(state: CalendarState) -> str:
+            fast_path = state.get('fast_path')
+            if fast_path == "hit":
+                return "determine_action"
+            if fast_path == "intent":
+                return "extract_information"
+            return "classify_intent"
+        
+        builder.add_conditional_edges(
+            "fast_extract",
+            route_after_fast_extract,
+            {
+                "determine_action": "determine_action",
+                "extract_information": "extract_information",
+                "classify_intent": "classify_intent"
+            }
+        )
         builder.add_edge("classify_intent", "extract_information")
         builder.add_edge("extract_information", "determine_action")
         
@@ -1401,7 +1795,7 @@ class LLMService:
         # 그래프 컴파일
         return builder.compile()
     
-    def _extract_delete_information(self, state: CalendarState, current_date: datetime, rule_text: str) -> CalendarState:
+    async def _extract_delete_information(self, state: CalendarState, current_date: datetime, rule_text: str) -> CalendarState:
         """삭제 관련 정보 추출 (다중 삭제 및 전체 삭제 지원)"""
         try:
             user_input = state['current_input']
@@ -1614,7 +2008,7 @@ class LLMService:
 - 개별 일정과 전체 삭제가 섞인 경우 (혼합삭제 패턴)
 """
                 
-                detection_response = self.client.chat.completions.create(
+                detection_response = await self.client.chat.completions.create(
                     model="gpt-4o-mini",
                     messages=[{"role": "user", "content": detection_prompt}],
                     temperature=0.1
@@ -1685,7 +2079,7 @@ class LLMService:
 3. 시간이 명시되지 않으면 null로 설정
 """
             
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.1
@@ -1758,7 +2152,7 @@ class LLMService:
             state['extracted_info'] = default_delete_info
             return state
     
-    def _extract_update_information(self, state: CalendarState, current_date: datetime, rule_text: str) -> CalendarState:
+    async def _extract_update_information(self, state: CalendarState, current_date: datetime, rule_text: str) -> CalendarState:
         """수정 관련 정보 추출 (다중 수정 지원)"""
         try:
             user_input = state['current_input']
@@ -1778,7 +2172,7 @@ class LLMService:
 - 예: "팀 미팅 시간 4시로 바꾸고 프로젝트 회의도 내일로 옮겨줘"
 """
             
-            detection_response = self.client.chat.completions.create(
+            detection_response = await self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": detection_prompt}],
                 temperature=0.1
@@ -1888,7 +2282,7 @@ class LLMService:
 3. 시간 범위가 명확하지 않으면 end_time을 null로 설정하여 기본 1시간 일정으로 처리
 """
             
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.1
@@ -1934,7 +2328,7 @@ class LLMService:
             state['extracted_info'] = default_update_info
             return state
     
-    def _extract_range_events(self, state: CalendarState, current_date: datetime, rule_text: str) -> CalendarState:
+    async def _extract_range_events(self, state: CalendarState, current_date: datetime, rule_text: str) -> CalendarState:
         """기간/범위 기반 일정 정보 추출 및 개별 일정로 변환"""
         try:
             user_input = state['current_input']
@@ -1990,7 +2384,7 @@ Multi Day Event 처리 가이드라인:
 - "3일간 워크샵" → start_date: 시작일, end_date: 시작일+2일, all_day: true
 """
             
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.1
@@ -2257,52 +2651,36 @@ Multi Day Event 처리 가이드라인:
     def _create_event_data(self, extracted_info: Dict[str, Any]) -> Dict[str, Any]:
         """추출된 정보를 Google Calendar API 형식으로 변환"""
         try:
+            # 날짜/시간은 Event 모델로 한 번만 파싱하고 epoch 값에서 바로 형식을 만듦
+            event = Event.from_extracted_info(extracted_info)
             event_data = {
                 'summary': extracted_info.get('title', '새 일정'),
-                'description': extracted_info.get('description', ''),
-                'location': extracted_info.get('location', ''),
+                'description': event.description,
+                'location': event.location,
             }
             
             # 시간 설정
-            start_date = extracted_info.get('start_date')
-            start_time = extracted_info.get('start_time')
-            end_date = extracted_info.get('end_date', start_date)
-            end_time = extracted_info.get('end_time')
-            timezone = extracted_info.get('timezone', 'Asia/Seoul')
-            
-            if extracted_info.get('all_day', False):
-                event_data['start'] = {'date': start_date}
-                event_data['end'] = {'date': end_date}
-            else:
-                if start_time:
-                    start_datetime = f"{start_date}T{start_time}:00"
+            timezone = event.timezone or 'Asia/Seoul'
+            if event.start is not None:
+                if event.all_day:
+                    event_data['start'] = {'date': format_epoch(event.start, date_only=True)}
+                    event_data['end'] = {'date': format_epoch(event.end - SECONDS_PER_DAY, date_only=True)}
+                else:
                     event_data['start'] = {
-                        'dateTime': start_datetime,
+                        'dateTime': format_epoch(event.start),
                         'timeZone': timezone
                     }
-                
-                if end_time:
-                    end_datetime = f"{end_date}T{end_time}:00"
                     event_data['end'] = {
-                        'dateTime': end_datetime,
-                        'timeZone': timezone
-                    }
-                elif start_time:
-                    # 종료 시간이 없으면 1시간 후로 설정
-                    start_dt = datetime.strptime(f"{start_date} {start_time}", "%Y-%m-%d %H:%M")
-                    end_dt = start_dt + timedelta(hours=1)
-                    event_data['end'] = {
-                        'dateTime': end_dt.strftime("%Y-%m-%dT%H:%M:00"),
+                        'dateTime': format_epoch(event.end),
                         'timeZone': timezone
                     }
             
             # 참석자 설정
-            attendees = extracted_info.get('attendees', [])
-            if attendees:
-                event_data['attendees'] = [{'email': email} for email in attendees]
+            if event.attendees:
+                event_data['attendees'] = [{'email': email} for email in event.attendees]
             
             # 알림 설정
-            reminders = extracted_info.get('reminders', [15])
+            reminders = (event.extra or {}).get('reminders', [15])
             if reminders:
                 event_data['reminders'] = {
                     'useDefault': False,
@@ -2347,7 +2725,8 @@ Multi Day Event 처리 가이드라인:
                 "extracted_info": None,
                 "action_type": None,
                 "calendar_result": None,
-                "context": None
+                "context": None,
+                "fast_path": None
             }
             
             # 워크플로우 실행
@@ -2369,11 +2748,10 @@ Multi Day Event 처리 가이드라인:
             }
     
     async def _run_workflow_async(self, initial_state: CalendarState) -> CalendarState:
-        """비동기적으로 워크플로우를 실행합니다."""
-        # LangGraph는 동기 실행이므로 비동기 래퍼 사용
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.workflow.invoke, initial_state)
+        """비동기적으로 워크플로우를 실행합니다. 노드가 모두 비동기이므로 스레드 풀을 거치지 않습니다."""
+        # 응답 캐시가 현재 시각을 키에 넣을지 판단할 수 있도록 사용자 입력을 알려 줌
+        with cache_user_input(initial_state['current_input']):
+            return await self.workflow.ainvoke(initial_state)
     
     # =============================================================================
     # 기존 메서드들 (호환성 유지)
@@ -2387,7 +2765,7 @@ Multi Day Event 처리 가이드라인:
     ) -> str:
         """사용자 메시지에 대한 응답을 생성합니다."""
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=messages,
                 temperature=temperature,
@@ -2398,6 +2776,10 @@ Multi Day Event 처리 가이드라인:
             print(f"LLM 요청 중 오류 발생: {str(e)}")
             return "죄송합니다, 응답을 생성하는 중 오류가 발생했습니다."
 
+    async def get_completion(self, prompt: str, temperature: float = 0.1) -> str:
+        """프롬프트 하나에 대한 응답을 반환합니다. (카테고리 분류 등 단발성 요청용)"""
+        return await self.generate_response([{"role": "user", "content": prompt}], temperature=temperature)
+
     async def process_calendar_input(
         self,
         user_input: str,
@@ -0,0 +1,711 @@
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from app.core.config import get_settings
+from app.services.event_id import generate_event_id
+from app.services.event_index import sweep_conflicts, to_epoch, SEARCH_FIELDS, SECONDS_PER_DAY
+from app.services.event_model import UNDATED_SORT_KEY, Event, EventVersionConflict
+from app.services.event_recurrence import RecurrenceIndex, RecurrenceRule, make_occurrence, recurrence_window
+from app.services.event_snapshot import iter_ndjson, ndjson_line
+
+settings = get_settings()
+
+# 반복 일정(recurring = 1)은 규칙만 저장하고 발생 일정은 조회할 때 계산하므로, 기간 조건 검색에서는 제외
+# 변경 번호(change_seq)는 생성/수정/삭제마다 1씩 증가하며, 변경 목록(get_changes)의 동기화 토큰으로 사용
+# 삭제 기록(event_deletions)은 EVENT_TOMBSTONE_RETENTION_DAYS가 지나면 purge_tombstones가 정리하고,
+# 정리한 마지막 변경 번호를 event_meta의 sync_floor에 남김
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    start_ts INTEGER,
+    end_ts INTEGER,
+    title TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    location TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL,
+    recurring INTEGER NOT NULL DEFAULT 0,
+    change_seq INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_events_start_ts ON events(start_ts);
+CREATE INDEX IF NOT EXISTS idx_events_end_ts ON events(end_ts);
+CREATE INDEX IF NOT EXISTS idx_events_recurring ON events(recurring) WHERE recurring = 1;
+CREATE INDEX IF NOT EXISTS idx_events_change_seq ON events(change_seq);
+CREATE TABLE IF NOT EXISTS event_deletions (
+    id TEXT PRIMARY KEY,
+    change_seq INTEGER NOT NULL,
+    deleted_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_event_deletions_change_seq ON event_deletions(change_seq);
+CREATE TABLE IF NOT EXISTS event_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# 한국어 부분 검색을 위해 trigram 토크나이저를 사용 (SQLite 3.34 이상)
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+    title, description, location,
+    content='events', content_rowid='seq', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS events_fts_insert AFTER INSERT ON events BEGIN
+    INSERT INTO events_fts(rowid, title, description, location)
+    VALUES (new.seq, new.title, new.description, new.location);
+END;
+CREATE TRIGGER IF NOT EXISTS events_fts_delete AFTER DELETE ON events BEGIN
+    INSERT INTO events_fts(events_fts, rowid, title, description, location)
+    VALUES ('delete', old.seq, old.title, old.description, old.location);
+END;
+CREATE TRIGGER IF NOT EXISTS events_fts_update AFTER UPDATE ON events BEGIN
+    INSERT INTO events_fts(events_fts, rowid, title, description, location)
+    VALUES ('delete', old.seq, old.title, old.description, old.location);
+    INSERT INTO events_fts(rowid, title, description, location)
+    VALUES (new.seq, new.title, new.description, new.location);
+END;
+"""
+
+# trigram 토크나이저는 3글자 미만의 검색어를 처리하지 못함
+FTS_MIN_QUERY_LENGTH = 3
+
+# 페이지 조회 정렬 키 (Event.sort_key와 같은 순서). 날짜가 없는 일정은 맨 뒤
+SORT_KEY_SQL = f"IFNULL(e.start_ts, {UNDATED_SORT_KEY})"
+
+class _ImmediateTransaction:
+    """BEGIN IMMEDIATE ~ COMMIT/ROLLBACK 컨텍스트 매니저"""
+
+    BEGIN = "BEGIN IMMEDIATE"
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self):
+        self._conn.execute(self.BEGIN)
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+class _ReadTransaction(_ImmediateTransaction):
+    """여러 SELECT가 같은 시점의 데이터를 보도록 묶는 읽기 트랜잭션"""
+
+    BEGIN = "BEGIN"
+
+class SQLiteEventStorageService:
+    """SQLite(WAL 모드)에 일정을 저장하는 저장소
+
+    EventStorageService와 같은 인터페이스를 제공하며, 모든 쓰기는 트랜잭션 안에서 처리되므로
+    여러 uvicorn 워커가 같은 파일을 동시에 사용해도 서로의 변경을 덮어쓰지 않습니다.
+    """
+
+    def __init__(self, storage_dir: Optional[str] = None):
+        self.storage_dir = Path(storage_dir or settings.EVENT_STORAGE_DIR)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.db_file = self.storage_dir / "events.db"
+
+        # 읽기와 쓰기는 연결을 나눠 씀. WAL 모드에서는 쓰기 트랜잭션(다른 프로세스의 쓰기 잠금을 기다리는 동안 포함)이
+        # 진행 중이어도 읽기 연결은 마지막으로 커밋된 데이터를 바로 읽으므로, 이벤트 루프의 조회가 쓰기를 기다리지 않음
+        self._lock = threading.RLock()  # 읽기 연결(self._conn)용
+        self._write_lock = threading.RLock()  # 쓰기 연결(self._write_conn)용
+        self._write_conn = self._connect()
+        self._write_conn.execute("PRAGMA journal_mode=WAL")
+        self._write_conn.executescript(SCHEMA)
+        self.fts_enabled = self._init_fts()
+        self._conn = self._connect()
+        # 반복 일정 규칙. 데이터베이스가 바뀐 뒤(읽기 연결의 PRAGMA data_version) 처음 조회할 때 다시 읽음
+        self._recurrence = RecurrenceIndex()
+        self._recurrence_version: Optional[int] = None
+        # 쓰기 트랜잭션(커밋 시 디스크 동기화 포함)은 전용 스레드에서 처리
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="event-storage-writer")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.db_file),
+            check_same_thread=False,
+            isolation_level=None  # 트랜잭션은 직접 관리
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def _init_fts(self) -> bool:
+        """FTS5 검색 테이블을 준비합니다. 지원하지 않는 SQLite면 LIKE 검색으로 대체합니다."""
+        try:
+            self._write_conn.executescript(FTS_SCHEMA)
+            return True
+        except sqlite3.OperationalError as e:
+            print(f"⚠️ FTS5(trigram)를 사용할 수 없어 LIKE 검색을 사용합니다: {str(e)}")
+            return False
+
+    def _write(self):
+        """다른 프로세스와 겹치지 않도록 즉시 쓰기 잠금을 잡는 트랜잭션을 반환합니다."""
+        return _ImmediateTransaction(self._write_conn)
+
+    @staticmethod
+    def _row_to_event(row: sqlite3.Row) -> Event:
+        return Event.from_dict({"id": row["id"], **json.loads(row["data"])})
+
+    @staticmethod
+    def _columns(event: Event) -> tuple:
+        """일정에서 색인 컬럼 값(start_ts, end_ts, title, description, location, data, recurring)을 만듭니다."""
+        data = event.to_dict()
+        del data["id"]
+        return (
+            event.start,
+            event.end,
+            *(getattr(event, field) for field in SEARCH_FIELDS),
+            json.dumps(data, ensure_ascii=False),
+            int(RecurrenceRule.from_event(event) is not None)
+        )
+
+    def flush(self):
+        """SQLite는 커밋 시점에 반영되므로 별도 작업이 없습니다."""
+
+    def close(self):
+        """대기 중인 쓰기를 마치고 데이터베이스 연결을 닫습니다."""
+        self._writer.shutdown(wait=True)
+        with self._write_lock:
+            self._write_conn.close()
+        with self._lock:
+            self._conn.close()
+
+    def _next_seq(self) -> int:
+        """트랜잭션 안에서 다음 변경 번호를 발급합니다."""
+        self._write_conn.execute("INSERT OR IGNORE INTO event_meta (key, value) VALUES ('change_seq', 0)")
+        self._write_conn.execute("UPDATE event_meta SET value = value + 1 WHERE key = 'change_seq'")
+        return self._last_seq(self._write_conn)
+
+    def _last_seq(self, conn: sqlite3.Connection) -> int:
+        return self._meta(conn, "change_seq")
+
+    @staticmethod
+    def _meta(conn: sqlite3.Connection, key: str) -> int:
+        row = conn.execute("SELECT value FROM event_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def _insert(self, event_data: Union[Event, Dict[str, Any]]) -> Event:
+        """트랜잭션 안에서 새 일정을 추가합니다."""
+        event = Event.from_dict(event_data) if isinstance(event_data, dict) else event_data.copy()
+        event.id = generate_event_id()
+        event.created_at = event.updated_at = time.time()
+        event.version = self._next_seq()
+        self._write_conn.execute(
+            "INSERT INTO events (id, start_ts, end_ts, title, description, location, data, recurring, change_seq) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (event.id, *self._columns(event), event.version)
+        )
+        return event
+
+    def _update(
+        self,
+        event_id: str,
+        event_data: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> Optional[Event]:
+        """트랜잭션 안에서 일정을 수정합니다. 일정이 없으면 None.
+
+        expected_version이 현재 버전(change_seq)과 다르면 EventVersionConflict를 발생시키며, 트랜잭션은 롤백됩니다.
+        """
+        row = self._write_conn.execute("SELECT id, data, change_seq FROM events WHERE id = ?", (event_id,)).fetchone()
+        if row is None:
+            return None
+        if expected_version is not None and expected_version != row["change_seq"]:
+            raise EventVersionConflict(event_id, row["change_seq"])
+
+        event = self._row_to_event(row).updated(event_data)
+        event.updated_at = time.time()
+        event.version = self._next_seq()
+        self._write_conn.execute(
+            "UPDATE events SET start_ts = ?, end_ts = ?, title = ?, description = ?, location = ?, data = ?, "
+            "recurring = ?, change_seq = ? WHERE id = ?",
+            (*self._columns(event), event.version, event_id)
+        )
+        return event
+
+    def _delete(self, event_id: str) -> bool:
+        """트랜잭션 안에서 일정을 삭제합니다."""
+        cursor = self._write_conn.execute("DELETE FROM events WHERE id = ?", (event_id,))
+        if cursor.rowcount == 0:
+            return False
+        self._write_conn.execute(
+            "INSERT OR REPLACE INTO event_deletions (id, change_seq, deleted_at) VALUES (?, ?, ?)",
+            (event_id, self._next_seq(), time.time())
+        )
+        return True
+
+    def create_event(self, event_data: Union[Event, Dict[str, Any]]) -> Event:
+        """새로운 일정을 생성합니다."""
+        with self._write_lock, self._write():
+            return self._insert(event_data)
+
+    def update_event(
+        self,
+        event_id: str,
+        event_data: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> Optional[Event]:
+        """기존 일정을 수정합니다.
+
+        expected_version이 주어지면 일정의 현재 버전과 같을 때만 수정하며, 다르면 EventVersionConflict가 발생합니다.
+        버전 확인과 수정이 같은 쓰기 트랜잭션 안에서 이루어지므로 다른 프로세스와도 겹치지 않습니다.
+        """
+        with self._write_lock, self._write():
+            return self._update(event_id, event_data, expected_version)
+
+    def delete_event(self, event_id: str) -> bool:
+        """일정을 삭제합니다."""
+        with self._write_lock, self._write():
+            return self._delete(event_id)
+
+    def apply_batch(
+        self,
+        create: Optional[List[Union[Event, Dict[str, Any]]]] = None,
+        update: Optional[List[Dict[str, Any]]] = None,
+        delete: Optional[List[str]] = None
+    ) -> Dict[str, List[Any]]:
+        """여러 건의 생성/수정/삭제를 하나의 트랜잭션으로 적용합니다.
+
+        update 항목은 {"id": 일정 id, "data": 변경 내용} 형식입니다.
+        """
+        created, updated, deleted, not_found = [], [], [], []
+        with self._write_lock, self._write():
+            for event_data in create or []:
+                created.append(self._insert(event_data))
+
+            for item in update or []:
+                event = self._update(item["id"], item.get("data") or {})
+                if event is None:
+                    not_found.append(item["id"])
+                else:
+                    updated.append(event)
+
+            for event_id in delete or []:
+                if self._delete(event_id):
+                    deleted.append(event_id)
+                else:
+                    not_found.append(event_id)
+
+        return {
+            "created": created,
+            "updated": updated,
+            "deleted": deleted,
+            "not_found": not_found
+        }
+
+    def bulk_create(self, events_data: List[Union[Event, Dict[str, Any]]]) -> List[Event]:
+        """여러 일정을 한 번에 생성합니다."""
+        return self.apply_batch(create=events_data)["created"]
+
+    def bulk_update(self, updates: List[Dict[str, Any]]) -> List[Event]:
+        """여러 일정을 한 번에 수정하고, 수정된 일정만 반환합니다."""
+        return self.apply_batch(update=updates)["updated"]
+
+    def bulk_delete(self, event_ids: List[str]) -> List[str]:
+        """여러 일정을 한 번에 삭제하고, 삭제된 id만 반환합니다."""
+        return self.apply_batch(delete=event_ids)["deleted"]
+
+    def iter_export(self, chunk_size: Optional[int] = None) -> Iterator[List[Event]]:
+        """모든 일정을 chunk_size개씩 나눠 반환합니다. (NDJSON 내보내기용)
+
+        seq 기준 키셋 조회로 한 묶음씩 읽으므로 일정 수와 관계없이 메모리 사용량이 일정합니다.
+        """
+        chunk_size = chunk_size or settings.EVENT_STREAM_CHUNK_SIZE
+        last_seq = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT seq, id, data FROM events WHERE seq > ? ORDER BY seq LIMIT ?", (last_seq, chunk_size)
+                ).fetchall()
+            if not rows:
+                return
+            last_seq = rows[-1]["seq"]
+            yield [self._row_to_event(row) for row in rows]
+
+    def import_events(self, events: Iterable[Union[Event, Dict[str, Any]]]) -> Dict[str, int]:
+        """일정을 한꺼번에 가져옵니다. (백업 복원, 대량 이전)
+
+        가져오는 일정은 먼저 임시 파일(NDJSON)에 정리해 두고, 읽기가 모두 끝나면 하나의 트랜잭션으로
+        EVENT_STREAM_CHUNK_SIZE개씩 넣습니다. 같은 id의 일정이 이미 있으면 가져온 일정으로 바꾸며,
+        가져오는 목록 안에서 중복된 id는 처음 것만 사용합니다. 읽는 도중 오류가 나면 저장소는 바뀌지 않습니다.
+        """
+        seen = set()
+        skipped = 0
+        staging_file = self.storage_dir / "events.import.ndjson"
+        try:
+            with open(staging_file, 'w', encoding='utf-8') as f:
+                for item in events:
+                    event = Event.from_dict(item) if isinstance(item, dict) else item.copy()
+                    if not event.id:
+                        event.id = generate_event_id()
+                    elif event.id in seen:
+                        skipped += 1
+                        continue
+                    now = time.time()
+                    event.created_at = event.created_at or now
+                    event.updated_at = event.updated_at or now
+                    seen.add(event.id)
+                    f.write(ndjson_line(event))
+
+            with self._write_lock, self._write():
+                batch: List[Event] = []
+                for data in iter_ndjson(staging_file):
+                    batch.append(Event.from_dict(data))
+                    if len(batch) >= settings.EVENT_STREAM_CHUNK_SIZE:
+                        self._import_batch(batch)
+                        batch = []
+                if batch:
+                    self._import_batch(batch)
+        finally:
+            if staging_file.exists():
+                staging_file.unlink()
+
+        print(f"✅ 일정 {len(seen)}건 가져오기 완료 (중복 {skipped}건 제외): {self.db_file}")
+        return {"imported": len(seen), "skipped": skipped}
+
+    def _import_batch(self, batch: List[Event]):
+        """트랜잭션 안에서 일정 묶음을 넣거나 바꿉니다. 변경 번호도 묶음 단위로 한 번에 발급합니다."""
+        first_seq = self._last_seq(self._write_conn) + 1
+        self._write_conn.executemany(
+            "INSERT INTO events (id, start_ts, end_ts, title, description, location, data, recurring, change_seq) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET start_ts = excluded.start_ts, end_ts = excluded.end_ts, "
+            "title = excluded.title, description = excluded.description, location = excluded.location, "
+            "data = excluded.data, recurring = excluded.recurring, change_seq = excluded.change_seq",
+            [(event.id, *self._columns(event), seq) for seq, event in enumerate(batch, first_seq)]
+        )
+        self._write_conn.executemany("DELETE FROM event_deletions WHERE id = ?", [(event.id,) for event in batch])
+        self._write_conn.execute(
+            "INSERT INTO event_meta (key, value) VALUES ('change_seq', ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (first_seq + len(batch) - 1,)
+        )
+
+    def purge_tombstones(self, retention_seconds: Optional[float] = None) -> int:
+        """보관 기간이 지난 삭제 기록을 정리하고 정리한 건수를 반환합니다. (백그라운드 정리 작업에서 호출)"""
+        if retention_seconds is None:
+            retention_seconds = settings.EVENT_TOMBSTONE_RETENTION_DAYS * SECONDS_PER_DAY
+        cutoff = time.time() - retention_seconds
+        with self._write_lock, self._write():
+            floor = self._write_conn.execute(
+                "SELECT max(change_seq) FROM event_deletions WHERE deleted_at < ?", (cutoff,)
+            ).fetchone()[0]
+            if floor is None:
+                return 0
+            purged = self._write_conn.execute("DELETE FROM event_deletions WHERE change_seq <= ?", (floor,)).rowcount
+            self._write_conn.execute(
+                "INSERT INTO event_meta (key, value) VALUES ('sync_floor', ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = max(value, excluded.value)",
+                (floor,)
+            )
+        print(f"🧹 보관 기간이 지난 삭제 기록 {purged}건 정리: {self.db_file}")
+        return purged
+
+    # 비동기 API: 쓰기 트랜잭션을 쓰기 스레드에서 실행하여 이벤트 루프를 막지 않음
+
+    async def _arun(self, method, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._writer, method, *args)
+
+    async def acreate_event(self, event_data: Union[Event, Dict[str, Any]]) -> Event:
+        """create_event의 비동기 버전입니다."""
+        return await self._arun(self.create_event, event_data)
+
+    async def aupdate_event(
+        self,
+        event_id: str,
+        event_data: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> Optional[Event]:
+        """update_event의 비동기 버전입니다."""
+        return await self._arun(self.update_event, event_id, event_data, expected_version)
+
+    async def adelete_event(self, event_id: str) -> bool:
+        """delete_event의 비동기 버전입니다."""
+        return await self._arun(self.delete_event, event_id)
+
+    async def aapply_batch(
+        self,
+        create: Optional[List[Union[Event, Dict[str, Any]]]] = None,
+        update: Optional[List[Dict[str, Any]]] = None,
+        delete: Optional[List[str]] = None
+    ) -> Dict[str, List[Any]]:
+        """apply_batch의 비동기 버전입니다."""
+        return await self._arun(self.apply_batch, create, update, delete)
+
+    def get_event(self, event_id: str) -> Optional[Event]:
+        """id로 일정을 조회합니다. 반환한 일정의 version에 현재 버전을 채웁니다."""
+        with self._lock:
+            row = self._conn.execute("SELECT id, data, change_seq FROM events WHERE id = ?", (event_id,)).fetchone()
+        if row is None:
+            return None
+        event = self._row_to_event(row)
+        event.version = row["change_seq"]
+        return event
+
+    def get_changes(self, since: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """변경 번호 since 이후에 생성/수정/삭제된 일정을 반환합니다.
+
+        since가 없으면 전체 일정을 반환합니다. 정리된 삭제 기록보다 오래되었거나 알 수 없는 토큰이면 None을 반환하며,
+        이때 클라이언트는 전체 동기화를 해야 합니다.
+        반환값의 "seq"를 다음 요청의 since로 사용합니다.
+        """
+        with self._lock, _ReadTransaction(self._conn):
+            last_seq = self._last_seq(self._conn)
+            if since is None:
+                rows = self._conn.execute("SELECT id, data FROM events ORDER BY seq").fetchall()
+                return {"events": [self._row_to_event(row) for row in rows], "deleted": [], "seq": last_seq}
+            if since < self._meta(self._conn, "sync_floor") or since > last_seq:
+                return None
+
+            rows = self._conn.execute(
+                "SELECT id, data FROM events WHERE change_seq > ? ORDER BY change_seq", (since,)
+            ).fetchall()
+            deleted = self._conn.execute(
+                "SELECT id FROM event_deletions WHERE change_seq > ? ORDER BY change_seq", (since,)
+            ).fetchall()
+        return {
+            "events": [self._row_to_event(row) for row in rows],
+            "deleted": [row["id"] for row in deleted],
+            "seq": last_seq
+        }
+
+    def _recurrence_index(self) -> RecurrenceIndex:
+        """반복 일정 인덱스를 반환합니다. 이 연결 또는 다른 프로세스가 데이터베이스를 바꿨으면 다시 읽습니다."""
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if self._recurrence_version != version:
+            entries = []
+            for row in self._conn.execute("SELECT id, data FROM events WHERE recurring = 1"):
+                event = self._row_to_event(row)
+                rule = RecurrenceRule.from_event(event)
+                if rule is not None:
+                    entries.append((event.id, event.span(), rule))
+            self._recurrence.rebuild(entries)
+            self._recurrence_version = version
+        return self._recurrence
+
+    def _masters(self, event_ids) -> Dict[str, Event]:
+        """반복 일정 원본을 id로 한 번에 읽어 옵니다."""
+        event_ids = list(set(event_ids))
+        if not event_ids:
+            return {}
+        placeholders = ", ".join("?" * len(event_ids))
+        rows = self._conn.execute(f"SELECT id, data FROM events WHERE id IN ({placeholders})", event_ids).fetchall()
+        return {row["id"]: self._row_to_event(row) for row in rows}
+
+    def _occurrences(self, window_start: int, window_end: int) -> List[Event]:
+        """구간에 걸치는 반복 일정의 발생을 일정으로 만들어 반환합니다. 잠금을 잡은 상태에서 호출합니다."""
+        occurrences = self._recurrence_index().occurrences(window_start, window_end)
+        masters = self._masters(event_id for _, _, event_id in occurrences)
+        return [make_occurrence(masters[event_id], start, end) for start, end, event_id in occurrences]
+
+    def _occurrences_within(self, start_date: Optional[str], end_date: Optional[str]) -> List[Event]:
+        """기간 안에 완전히 포함되는 반복 일정의 발생을 반환합니다. 잠금을 잡은 상태에서 호출합니다."""
+        range_start = to_epoch(start_date)
+        range_end = to_epoch(end_date, is_end=True)
+        window = recurrence_window(
+            range_start,
+            range_end + 1 if range_end is not None else None,
+            settings.EVENT_RECURRENCE_HORIZON_DAYS
+        )
+        return [
+            occurrence for occurrence in self._occurrences(*window)
+            if (range_start is None or occurrence.start >= range_start)
+            and (range_end is None or occurrence.end <= range_end)
+        ]
+
+    @staticmethod
+    def _range_clause(start_date: Optional[str], end_date: Optional[str], alias: str = "") -> tuple:
+        """기간에 완전히 포함되는 일정을 고르는 WHERE 조건과 인자를 만듭니다."""
+        conditions, params = [f"{alias}recurring = 0"], []
+        range_start = to_epoch(start_date)
+        range_end = to_epoch(end_date, is_end=True)
+        if range_start is not None:
+            conditions.append(f"{alias}start_ts >= ?")
+            params.append(range_start)
+        if range_end is not None:
+            conditions.append(f"{alias}start_ts <= ? AND {alias}end_ts <= ?")
+            params.extend([range_end, range_end])
+        return conditions, params
+
+    def get_events(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Event]:
+        """일정을 조회합니다. 기간이 주어지면 그 안에 포함되는 일정(반복 일정의 발생 포함)을 시작 시각 순으로 반환합니다."""
+        if not start_date and not end_date:
+            with self._lock:
+                rows = self._conn.execute("SELECT id, data FROM events ORDER BY seq").fetchall()
+            return [self._row_to_event(row) for row in rows]
+
+        conditions, params = self._range_clause(start_date, end_date)
+        if len(conditions) == 1:
+            return []  # 해석할 수 있는 날짜가 없음
+        sql = f"SELECT id, data FROM events WHERE {' AND '.join(conditions)} ORDER BY start_ts, id"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            occurrences = self._occurrences_within(start_date, end_date)
+        events = [self._row_to_event(row) for row in rows]
+        if occurrences:
+            events.extend(occurrences)
+            events.sort(key=lambda event: (event.start, event.id))
+        return events
+
+    def search_events(
+        self,
+        query: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> List[Event]:
+        """일정을 검색합니다. 3글자 이상이면 FTS5, 그보다 짧으면 LIKE 검색을 사용합니다."""
+        if not query:
+            return self.get_events(start_date, end_date)
+
+        ranged = bool(start_date or end_date)
+        source, conditions, params = self._query_clause(query)
+        if ranged:
+            range_conditions, range_params = self._range_clause(start_date, end_date, alias="e.")
+            conditions += range_conditions
+            params += range_params
+
+        sql = f"SELECT e.id, e.data FROM {source} WHERE {' AND '.join(conditions)} ORDER BY e.seq"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            if ranged and self._recurrence_index():
+                # 검색어가 맞는 반복 일정은 기간 안의 발생으로 바꿔서 반환
+                matched = {event.id for event in self._search_recurring(query)}
+                occurrences = [
+                    occurrence for occurrence in self._occurrences_within(start_date, end_date)
+                    if occurrence.extra["recurring_event_id"] in matched
+                ]
+            else:
+                occurrences = []
+        return [self._row_to_event(row) for row in rows] + occurrences
+
+    def _query_clause(self, query: str) -> Tuple[str, List[str], List[Any]]:
+        """검색어 조건 (FROM 절, WHERE 조건, 인자)을 만듭니다. 3글자 이상이면 FTS5, 그보다 짧으면 LIKE 검색을 사용합니다."""
+        if self.fts_enabled and len(query) >= FTS_MIN_QUERY_LENGTH:
+            return (
+                "events_fts JOIN events e ON e.seq = events_fts.rowid",
+                ["events_fts MATCH ?"],
+                ['"' + query.replace('"', '""') + '"']
+            )
+        pattern = "%" + query.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        like_conditions = [f"lower(e.{field}) LIKE ? ESCAPE '\\'" for field in SEARCH_FIELDS]
+        return "events e", ["(" + " OR ".join(like_conditions) + ")"], [pattern] * len(SEARCH_FIELDS)
+
+    def search_page(
+        self,
+        query: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 10,
+        after: Optional[Tuple[int, str]] = None
+    ) -> Tuple[List[Event], Optional[Tuple[int, str]]]:
+        """검색 결과를 (시작 시각, id) 순으로 limit개까지 반환합니다.
+
+        after(이전 페이지 마지막 일정의 sort_key()) 다음부터 키셋 조건으로 조회하므로 앞 페이지를 다시 읽지 않습니다.
+        (일정 목록, 다음 페이지가 있으면 마지막 일정의 정렬 키)를 반환합니다.
+        """
+        ranged = bool(start_date or end_date)
+        source, conditions, params = self._query_clause(query) if query else ("events e", [], [])
+        # 기간 조건이 있으면 start_ts가 항상 있으므로 인덱스 순서 그대로 정렬
+        sort_key = "e.start_ts" if ranged else SORT_KEY_SQL
+        if ranged:
+            range_conditions, range_params = self._range_clause(start_date, end_date, alias="e.")
+            if len(range_conditions) == 1:
+                return [], None  # 해석할 수 있는 날짜가 없음
+            conditions += range_conditions
+            params += range_params
+        if after is not None:
+            conditions.append(f"({sort_key}, e.id) > (?, ?)")
+            params.extend(after)
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = f"SELECT e.id, e.data FROM {source}{where} ORDER BY {sort_key}, e.id LIMIT ?"
+        with self._lock:
+            rows = self._conn.execute(sql, params + [limit + 1]).fetchall()
+            page = [self._row_to_event(row) for row in rows]
+            if ranged and self._recurrence_index():
+                matched = {event.id for event in self._search_recurring(query)} if query else None
+                occurrences = [
+                    occurrence for occurrence in self._occurrences_within(start_date, end_date)
+                    if (matched is None or occurrence.extra["recurring_event_id"] in matched)
+                    and (after is None or occurrence.sort_key() > after)
+                ]
+                page = sorted(page + occurrences, key=Event.sort_key)[:limit + 1]
+
+        has_more = len(page) > limit
+        events = page[:limit]
+        return events, (events[-1].sort_key() if has_more and events else None)
+
+    def _search_recurring(self, query: str) -> List[Event]:
+        """검색어가 맞는 반복 일정 원본을 반환합니다. 반복 일정 수는 적으므로 메모리에서 비교합니다."""
+        query = query.lower()
+        rows = self._conn.execute("SELECT id, data FROM events WHERE recurring = 1").fetchall()
+        return [event for event in map(self._row_to_event, rows) if query in event.search_text()]
+
+    def find_conflicts(self, event_id: str) -> Optional[List[Event]]:
+        """해당 일정과 시간이 겹치는 다른 일정(반복 일정의 발생 포함)을 반환합니다. 일정이 없으면 None.
+
+        반복 일정이면 첫 발생과 겹치는 일정을 찾습니다.
+        """
+        with self._lock:
+            target = self._conn.execute(
+                "SELECT start_ts, end_ts FROM events WHERE id = ?", (event_id,)
+            ).fetchone()
+            if target is None:
+                return None
+            if target["start_ts"] is None:
+                return []
+
+            rows = self._conn.execute(
+                "SELECT id, data FROM events WHERE (start_ts = ? OR (start_ts < ? AND end_ts > ?)) "
+                "AND id != ? AND recurring = 0 ORDER BY start_ts, id",
+                (target["start_ts"], target["end_ts"], target["start_ts"], event_id)
+            ).fetchall()
+            occurrences = [
+                occurrence for occurrence in self._occurrences(target["start_ts"], target["end_ts"])
+                if occurrence.extra["recurring_event_id"] != event_id
+            ]
+        conflicts = [self._row_to_event(row) for row in rows]
+        if occurrences:
+            conflicts.extend(occurrences)
+            conflicts.sort(key=lambda event: (event.start, event.id))
+        return conflicts
+
+    def find_all_conflicts(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> List[Tuple[Event, Event]]:
+        """기간 안에서 서로 시간이 겹치는 모든 일정 쌍을 반환합니다.
+
+        반복 일정은 기간 안의 발생만 확인하며, 기간이 열려 있으면 EVENT_RECURRENCE_HORIZON_DAYS 만큼만 펼칩니다.
+        """
+        conditions, params = ["start_ts IS NOT NULL", "recurring = 0"], []
+        range_start = to_epoch(start_date)
+        range_end = to_epoch(end_date, is_end=True)
+        if range_start is not None:
+            conditions.append("(end_ts > ? OR start_ts = ?)")
+            params.extend((range_start, range_start))
+        if range_end is not None:
+            conditions.append("start_ts < ?")
+            params.append(range_end)
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, data, start_ts, end_ts FROM events WHERE {' AND '.join(conditions)} "
+                "ORDER BY start_ts, id",
+                params
+            ).fetchall()
+            window = recurrence_window(range_start, range_end, settings.EVENT_RECURRENCE_HORIZON_DAYS)
+            occurrences = self._occurrences(*window) if self._recurrence_index() else []
+        entries = [(row["start_ts"], row["end_ts"], self._row_to_event(row)) for row in rows]
+        if occurrences:
+            entries.extend((occurrence.start, occurrence.end, occurrence) for occurrence in occurrences)
+            entries.sort(key=lambda entry: entry[0])
+        return sweep_conflicts(entries)
@@ -0,0 +1,42 @@
+"""로컬 일정 저장소 백업/복원 도구 (NDJSON)
+
+사용 예:
+    python event_backup.py export backup.ndjson
+    python event_backup.py import backup.ndjson --session alice
+"""
+import argparse
+from app.services.event_partitions import EventStoragePartitions
+from app.services.event_snapshot import iter_ndjson, ndjson_line
+
+def export_events(storage, path: str) -> int:
+    """저장소의 일정을 NDJSON 파일로 내보내고 내보낸 건수를 반환합니다."""
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for chunk in storage.iter_export():
+            f.write("".join(ndjson_line(event) for event in chunk))
+            count += len(chunk)
+    return count
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 일정 저장소 백업/복원 (NDJSON)")
+    parser.add_argument("command", choices=["export", "import"], help="export: 내보내기, import: 가져오기")
+    parser.add_argument("path", help="NDJSON 파일 경로")
+    parser.add_argument("--session", default=None, help="사용자(세션) id. 없으면 기본 저장소")
+    parser.add_argument("--backend", default=None, help="저장소 백엔드 (json/sqlite). 없으면 설정값")
+    parser.add_argument("--storage-dir", default=None, help="저장소 디렉터리. 없으면 설정값")
+    args = parser.parse_args()
+
+    partitions = EventStoragePartitions(args.backend, args.storage_dir)
+    try:
+        with partitions.lease(args.session) as storage:
+            if args.command == "export":
+                count = export_events(storage, args.path)
+                print(f"✅ 일정 {count}건을 내보냈습니다: {args.path}")
+            else:
+                result = storage.import_events(iter_ndjson(args.path))
+                print(f"✅ 일정 {result['imported']}건을 가져왔습니다. (중복 {result['skipped']}건 제외)")
+    finally:
+        partitions.close()
+
+if __name__ == "__main__":
+    main()
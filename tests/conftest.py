@@ -0,0 +1,50 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.core.config import get_settings
+from app.services.event_storage_service import EventStorageService
+from app.services.sqlite_event_storage_service import SQLiteEventStorageService
+
+settings = get_settings()
+CALENDAR_API = f"{settings.API_V1_STR}/calendar"
+
+# 저장 형식 테스트용 예시 일정 (시간 일정, 종일 일정, 날짜 없는 일정, 반복 일정)
+SAMPLE_EVENTS = [
+    {"id": "meeting", "title": "팀 회의 ☕", "start_date": "2026-03-02T10:00:00", "end_date": "2026-03-02T11:00:00",
+     "location": "본사 3층", "attendees": ["kim@example.com"]},
+    {"id": "holiday", "title": "휴가", "start_date": "2026-03-03", "end_date": "2026-03-04"},
+    {"id": "memo", "title": "날짜 없는 메모", "memo": {"tags": ["a", "b"], "pinned": True}},
+    {"id": "standup", "title": "스탠드업", "start_date": "2026-03-02T09:00:00", "end_date": "2026-03-02T09:15:00",
+     "repeat_type": "weekly", "repeat_count": 4},
+]
+
+def open_storage(kind: str, storage_dir):
+    """kind("json", "journal", "sqlite")에 맞는 저장소를 storage_dir에 엽니다."""
+    if kind == "sqlite":
+        return SQLiteEventStorageService(str(storage_dir))
+    return EventStorageService(str(storage_dir), mode=kind)
+
+@pytest.fixture(params=["json", "journal", "sqlite"])
+def storage(request, tmp_path):
+    """임시 디렉터리의 일정 저장소 (저장 방식별로 한 번씩 실행)"""
+    store = open_storage(request.param, tmp_path)
+    yield store
+    store.close()
+
+@pytest.fixture(params=["json", "sqlite"])
+def client(request, tmp_path, monkeypatch):
+    """임시 디렉터리를 일정 저장소로 쓰는 API 클라이언트"""
+    monkeypatch.setattr(settings, "EVENT_STORAGE_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "EVENT_STORAGE_BACKEND", request.param)
+    from app.main import app
+    with TestClient(app) as test_client:
+        yield test_client
+
+def api_create_event(client, summary="회의", **headers):
+    """일정 생성 API를 호출하고 성공했는지 확인한 응답을 반환합니다. (headers: X-Session-Id 등)"""
+    response = client.post(f"{CALENDAR_API}/events/create", json={
+        "summary": summary,
+        "start_datetime": "2026-06-01T10:00:00",
+        "end_datetime": "2026-06-01T11:00:00"
+    }, headers=headers)
+    assert response.status_code == 200, response.text
+    return response
@@ -0,0 +1,13 @@
+from tests.conftest import CALENDAR_API, api_create_event
+
+def test_search_with_invalid_time_bound_returns_400(client):
+    """해석할 수 없는 기간 조건은 조건 없음으로 처리하지 않고 400을 반환해야 한다."""
+    api_create_event(client)
+    for params in ({"time_min": "어제"}, {"time_max": "2026-13-45"}):
+        response = client.get(f"{CALENDAR_API}/events/search", params=params)
+        assert response.status_code == 400, response.text
+    assert client.get(f"{CALENDAR_API}/events/conflicts", params={"time_min": "abc"}).status_code == 400
+
+    valid = client.get(f"{CALENDAR_API}/events/search", params={"time_min": "2026-06-01", "time_max": "2026-06-02"})
+    assert valid.status_code == 200
+    assert valid.json()["count"] == 1
@@ -0,0 +1,35 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+def _run_backup(*args):
+    result = subprocess.run(
+        [sys.executable, "event_backup.py", *map(str, args)],
+        cwd=REPO_ROOT, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+def test_backup_cli_import_then_export(tmp_path):
+    """event_backup.py로 가져온 일정을 다른 세션에 영향 없이 그대로 내보낼 수 있어야 한다."""
+    source = tmp_path / "source.ndjson"
+    source.write_text("".join(json.dumps(data, ensure_ascii=False) + "\n" for data in [
+        {"id": "a", "title": "회의", "start_date": "2026-07-01T10:00:00", "end_date": "2026-07-01T11:00:00"},
+        {"id": "b", "title": "날짜 없는 메모"},
+        {"id": "a", "title": "중복"},
+    ]), encoding="utf-8")
+    storage_dir = tmp_path / "events"
+
+    output = _run_backup("import", source, "--session", "alice", "--storage-dir", storage_dir)
+    assert "2건을 가져왔습니다" in output and "중복 1건" in output
+
+    exported = tmp_path / "exported.ndjson"
+    assert "2건을 내보냈습니다" in _run_backup("export", exported, "--session", "alice", "--storage-dir", storage_dir)
+    rows = [json.loads(line) for line in exported.read_text(encoding="utf-8").splitlines()]
+    assert {row["id"]: row["title"] for row in rows} == {"a": "회의", "b": "날짜 없는 메모"}
+
+    default_export = tmp_path / "default.ndjson"
+    assert "0건을 내보냈습니다" in _run_backup("export", default_export, "--storage-dir", storage_dir)
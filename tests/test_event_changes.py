@@ -0,0 +1,113 @@
+import pytest
+from tests.conftest import CALENDAR_API, api_create_event, open_storage
+
+def test_changes_since_token(storage):
+    """since 이후에 바뀐 일정만 마지막 변경 순서대로, 삭제된 일정은 id로 반환해야 한다."""
+    first = storage.create_event({"title": "첫 일정"})
+    second = storage.create_event({"title": "둘째 일정"})
+    full = storage.get_changes()
+    assert [event.id for event in full["events"]] == [first.id, second.id]
+    assert full["deleted"] == []
+    token = full["seq"]
+
+    third = storage.create_event({"title": "셋째 일정"})
+    storage.update_event(first.id, {"title": "수정된 첫 일정"})
+    storage.delete_event(second.id)
+    changes = storage.get_changes(token)
+    assert [event.id for event in changes["events"]] == [third.id, first.id]
+    assert changes["events"][1].title == "수정된 첫 일정"
+    assert changes["deleted"] == [second.id]
+    assert changes["seq"] == token + 3
+
+    latest = storage.get_changes(changes["seq"])
+    assert (latest["events"], latest["deleted"], latest["seq"]) == ([], [], changes["seq"])
+
+def test_repeated_updates_are_reported_once(storage):
+    """같은 일정이 여러 번 바뀌어도 마지막 상태로 한 번만 반환해야 한다."""
+    event = storage.create_event({"title": "회의"})
+    token = storage.get_changes()["seq"]
+    for title in ("회의 1", "회의 2", "회의 3"):
+        storage.update_event(event.id, {"title": title})
+    changes = storage.get_changes(token)
+    assert [(e.id, e.title) for e in changes["events"]] == [(event.id, "회의 3")]
+
+def test_token_from_the_future_is_rejected(storage):
+    """저장소가 발급한 적 없는 토큰은 전체 동기화가 필요하다고 알려야 한다."""
+    storage.create_event({"title": "회의"})
+    assert storage.get_changes(storage.get_changes()["seq"] + 1) is None
+
+def test_changes_api_round_trip(client):
+    """API의 동기화 토큰으로 다음 변경만 받고, 잘못된 토큰은 400을 반환해야 한다."""
+    full = client.get(f"{CALENDAR_API}/events/changes")
+    assert full.status_code == 200 and full.json()["full_sync"]
+    token = full.json()["next_sync_token"]
+
+    event_id = api_create_event(client).json()["event_id"]
+    changes = client.get(f"{CALENDAR_API}/events/changes", params={"since": token}).json()
+    assert not changes["full_sync"]
+    assert [event["id"] for event in changes["events"]] == [event_id]
+    assert changes["next_sync_token"] != token
+
+    assert client.get(f"{CALENDAR_API}/events/changes", params={"since": "잘못된 토큰"}).status_code == 400
+
+def test_purge_keeps_recent_tombstones(storage):
+    """보관 기간이 지나지 않은 삭제 기록은 정리하지 않아야 한다."""
+    event = storage.create_event({"title": "회의"})
+    token = storage.get_changes()["seq"]
+    storage.delete_event(event.id)
+    assert storage.purge_tombstones(retention_seconds=3600) == 0
+    assert storage.get_changes(token)["deleted"] == [event.id]
+
+def test_purge_expires_older_tokens_only(storage):
+    """정리된 삭제 기록 이전의 토큰은 만료되고, 그 이후의 토큰은 계속 쓸 수 있어야 한다."""
+    first = storage.create_event({"title": "첫 일정"})
+    old_token = storage.get_changes()["seq"]
+    storage.delete_event(first.id)
+    new_token = storage.get_changes()["seq"]
+    second = storage.create_event({"title": "둘째 일정"})
+
+    assert storage.purge_tombstones(retention_seconds=0) == 1
+    assert storage.get_changes(old_token) is None
+    changes = storage.get_changes(new_token)
+    assert [event.id for event in changes["events"]] == [second.id]
+    assert changes["deleted"] == []
+
+@pytest.mark.parametrize("kind", ["json", "journal", "sqlite"])
+def test_tombstones_survive_reopen(tmp_path, kind):
+    """삭제 기록과 정리 시점은 저장소를 다시 열어도 유지되어야 한다."""
+    store = open_storage(kind, tmp_path)
+    kept, purged = store.create_event({"title": "남길 일정"}), store.create_event({"title": "정리할 일정"})
+    store.delete_event(purged.id)
+    store.purge_tombstones(retention_seconds=0)
+    floor = store.get_changes()["seq"]
+    store.delete_event(kept.id)
+    store.close()
+
+    reopened = open_storage(kind, tmp_path)
+    try:
+        assert reopened.get_changes(floor - 1) is None
+        assert reopened.get_changes(floor)["deleted"] == [kept.id]
+        assert reopened.get_changes()["events"] == []
+    finally:
+        reopened.close()
+
+def test_changes_after_tombstone_purge_returns_410(client):
+    """삭제 기록이 정리된 뒤에는 그 이전의 동기화 토큰으로 변경 목록을 요청하면 410을 반환해야 한다."""
+    event_id = api_create_event(client).json()["event_id"]
+    token = client.get(f"{CALENDAR_API}/events/changes").json()["next_sync_token"]
+    assert client.delete(f"{CALENDAR_API}/events/{event_id}").status_code == 200
+
+    changes = client.get(f"{CALENDAR_API}/events/changes", params={"since": token})
+    assert changes.status_code == 200
+    assert changes.json()["deleted"] == [event_id]
+
+    with client.app.state.event_storage.lease() as storage:
+        assert storage.purge_tombstones(retention_seconds=0) == 1
+
+    expired = client.get(f"{CALENDAR_API}/events/changes", params={"since": token})
+    assert expired.status_code == 410
+    # 토큰 없이 전체 동기화하면 새 토큰으로 다시 시작할 수 있음
+    full = client.get(f"{CALENDAR_API}/events/changes")
+    assert full.status_code == 200 and full.json()["full_sync"]
+    fresh = client.get(f"{CALENDAR_API}/events/changes", params={"since": full.json()["next_sync_token"]})
+    assert fresh.status_code == 200 and fresh.json()["events"] == []
@@ -0,0 +1,73 @@
+import multiprocessing
+import pytest
+from app.services.event_model import EventVersionConflict
+from tests.conftest import CALENDAR_API, api_create_event, open_storage
+
+WORKERS, ROUNDS = 3, 15
+
+def test_update_with_expected_version(storage):
+    """expected_version이 현재 버전과 다르면 수정하지 않고 현재 버전을 알려야 한다."""
+    event = storage.create_event({"title": "회의"})
+    updated = storage.update_event(event.id, {"title": "먼저 수정"}, expected_version=event.version)
+    assert updated.version > event.version
+
+    with pytest.raises(EventVersionConflict) as conflict:
+        storage.update_event(event.id, {"title": "늦은 수정"}, expected_version=event.version)
+    assert conflict.value.current_version == updated.version
+    assert storage.get_event(event.id).title == "먼저 수정"
+
+def _increment(kind, storage_dir, counter_id):
+    """다른 프로세스와 함께 일정을 만들고, 버전 비교로 카운터를 하나씩 올립니다."""
+    store = open_storage(kind, storage_dir)
+    try:
+        for index in range(ROUNDS):
+            store.create_event({"title": f"작업 {index}"})
+            while True:
+                counter = store.get_event(counter_id)
+                try:
+                    store.update_event(counter_id, {"description": str(int(counter.description) + 1)}, counter.version)
+                    break
+                except EventVersionConflict:
+                    continue
+    finally:
+        store.close()
+
+@pytest.mark.parametrize("kind", ["json", "journal", "sqlite"])
+def test_concurrent_processes_do_not_lose_writes(tmp_path, kind):
+    """여러 프로세스가 같은 저장소에 동시에 써도 모든 일정과 카운터 증가가 남아야 한다."""
+    store = open_storage(kind, tmp_path)
+    counter_id = store.create_event({"title": "카운터", "description": "0"}).id
+    store.close()
+
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_increment, args=(kind, str(tmp_path), counter_id)) for _ in range(WORKERS)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(60)
+        assert worker.exitcode == 0
+
+    store = open_storage(kind, tmp_path)
+    try:
+        assert len(store.get_events()) == WORKERS * ROUNDS + 1
+        assert store.get_event(counter_id).description == str(WORKERS * ROUNDS)
+    finally:
+        store.close()
+
+def test_update_with_stale_etag_returns_412(client):
+    """If-Match의 버전이 현재 버전과 다르면 수정하지 않고 412와 현재 ETag를 반환해야 한다."""
+    created = api_create_event(client)
+    event_id = created.json()["event_id"]
+    etag = created.headers["ETag"]
+
+    updated = client.put(f"{CALENDAR_API}/events/{event_id}", json={"title": "먼저 수정"}, headers={"If-Match": etag})
+    assert updated.status_code == 200, updated.text
+    assert updated.headers["ETag"] != etag
+
+    stale = client.put(f"{CALENDAR_API}/events/{event_id}", json={"title": "늦은 수정"}, headers={"If-Match": etag})
+    assert stale.status_code == 412
+    assert stale.headers["ETag"] == updated.headers["ETag"]
+
+    current = client.get(f"{CALENDAR_API}/events/{event_id}")
+    assert current.json()["event"]["title"] == "먼저 수정"
+    assert current.headers["ETag"] == updated.headers["ETag"]
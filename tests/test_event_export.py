@@ -0,0 +1,97 @@
+import json
+import threading
+import time
+import pytest
+from app.services.event_snapshot import iter_ndjson, ndjson_line
+from tests.conftest import open_storage, settings
+
+def _write_ndjson(path, rows):
+    path.write_text("".join(row if isinstance(row, str) else json.dumps(row, ensure_ascii=False) + "\n" for row in rows),
+                    encoding="utf-8")
+    return path
+
+def _export(storage, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        for chunk in storage.iter_export(chunk_size=2):
+            f.write("".join(ndjson_line(event) for event in chunk))
+    return path
+
+def test_export_import_round_trip(storage, tmp_path):
+    """내보낸 NDJSON을 빈 저장소로 가져오면 같은 일정이 같은 id로 복원되어야 한다."""
+    storage.bulk_create([
+        {"title": "회의", "start_date": "2026-07-01T10:00:00", "end_date": "2026-07-01T11:00:00", "attendees": ["a"]},
+        {"title": "종일 행사", "start_date": "2026-07-02", "end_date": "2026-07-03"},
+        {"title": "매주 운동", "start_date": "2026-07-01T07:00:00", "end_date": "2026-07-01T08:00:00",
+         "repeat_type": "weekly"},
+        {"title": "날짜 없는 메모", "memo": "그대로 보관"},
+    ])
+    exported = _export(storage, tmp_path / "export.ndjson")
+
+    restored = open_storage("json", tmp_path / "restored")
+    try:
+        assert restored.import_events(iter_ndjson(exported)) == {"imported": 4, "skipped": 0}
+        expected = {event.id: event.to_dict() for event in storage.get_events()}
+        assert {event.id: event.to_dict() for event in restored.get_events()} == expected
+        # 가져온 일정은 변경 목록에도 나타남
+        assert len(restored.get_changes(0)["events"]) == 4
+    finally:
+        restored.close()
+
+def test_import_replaces_existing_and_skips_duplicates(storage, tmp_path):
+    """같은 id의 기존 일정은 가져온 일정으로 바뀌고, 파일 안의 중복 id는 처음 것만 사용해야 한다."""
+    existing = storage.create_event({"title": "기존"})
+    source = _write_ndjson(tmp_path / "source.ndjson", [
+        {"id": existing.id, "title": "덮어쓴 일정"},
+        {"id": "new", "title": "새 일정"},
+        {"id": "new", "title": "중복"},
+    ])
+    assert storage.import_events(iter_ndjson(source)) == {"imported": 2, "skipped": 1}
+    assert storage.get_event(existing.id).title == "덮어쓴 일정"
+    assert storage.get_event("new").title == "새 일정"
+
+def test_import_with_bad_line_changes_nothing(storage, tmp_path, monkeypatch):
+    """중간에 잘못된 줄이 있으면 앞의 묶음도 반영하지 않고 저장소를 그대로 두어야 한다."""
+    monkeypatch.setattr(settings, "EVENT_STREAM_CHUNK_SIZE", 2)
+    existing = storage.create_event({"title": "기존"})
+    seq = storage.get_changes()["seq"]
+    source = _write_ndjson(tmp_path / "bad.ndjson", [
+        {"id": f"imported-{index}", "title": f"가져온 일정 {index}"} for index in range(5)
+    ] + ["{잘못된 줄\n"])
+
+    with pytest.raises(ValueError):
+        storage.import_events(iter_ndjson(source))
+    assert [event.id for event in storage.get_events()] == [existing.id]
+    assert storage.get_changes()["seq"] == seq
+
+@pytest.mark.parametrize("mode", ["json", "journal"])
+def test_import_keeps_writes_made_while_merging(tmp_path, mode):
+    """합친 스냅샷을 쓰는 동안(잠금 밖) 생성된 일정도 가져오기 후 메모리와 파일에 남아 있어야 한다."""
+    store = open_storage(mode, tmp_path / "events")
+    store.create_event({"title": "기존"})
+    source = _write_ndjson(tmp_path / "source.ndjson", [{"id": "imported", "title": "가져온 일정"}])
+    prepare = store._prepare_snapshot_state
+    writers = []
+
+    def racing_prepare(path):
+        if not writers:
+            generation = store._generation
+            writer = threading.Thread(target=store.create_event, args=({"title": "가져오는 중 생성"},))
+            writers.append(writer)
+            writer.start()
+            # 생성은 메모리에 바로 반영되고, 파일 저장은 가져오기가 끝날 때까지 쓰기 스레드에서 기다림
+            while store._generation == generation:
+                time.sleep(0.001)
+        return prepare(path)
+
+    store._prepare_snapshot_state = racing_prepare
+    store.import_events(iter_ndjson(source))
+    writers[0].join()
+    titles = sorted(event.title for event in store.get_events())
+    assert titles == ["가져오는 중 생성", "가져온 일정", "기존"]
+    store.close()
+
+    reopened = open_storage(mode, tmp_path / "events")
+    try:
+        assert sorted(event.title for event in reopened.get_events()) == titles
+    finally:
+        reopened.close()
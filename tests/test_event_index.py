@@ -0,0 +1,111 @@
+import itertools
+import random
+import pytest
+from app.services.event_index import EventTextIndex, EventTimeIndex, spans_overlap, sweep_conflicts
+from app.services.event_model import Event
+
+def _brute_force(entries):
+    return {
+        frozenset((a[2], b[2])) for a, b in itertools.combinations(entries, 2)
+        if spans_overlap(a[0], a[1], b[0], b[1])
+    }
+
+def _pairs(conflicts):
+    return {frozenset(pair) for pair in conflicts}
+
+@pytest.mark.parametrize("entries", [
+    [(10, 10, "point"), (10, 20, "meeting")],
+    [(10, 20, "meeting"), (10, 10, "point")],
+    [(10, 10, "a"), (10, 10, "b")],
+    [(0, 10, "before"), (10, 10, "point"), (10, 10, "other")],
+])
+def test_sweep_zero_length_does_not_depend_on_tie_order(entries):
+    """길이가 0인 일정은 시작이 같은 일정과 겹치며, 같은 시작의 순서와 무관해야 한다."""
+    assert _pairs(sweep_conflicts(entries)) == _brute_force(entries)
+
+def test_sweep_matches_brute_force():
+    """스윕 결과는 모든 쌍을 직접 비교한 결과와 같아야 한다."""
+    rng = random.Random(7)
+    for _ in range(200):
+        entries = []
+        for i in range(rng.randint(0, 12)):
+            start = rng.randint(0, 20)
+            entries.append((start, start + rng.choice([0, 0, 1, 3, 8]), i))
+        entries.sort(key=lambda entry: entry[0])
+        conflicts = sweep_conflicts(entries)
+        assert len(conflicts) == len(_pairs(conflicts))
+        assert _pairs(conflicts) == _brute_force(entries)
+
+def test_time_index_overlapping_uses_same_rule():
+    """인덱스의 겹침 조회도 길이가 0인 구간에 같은 규칙을 적용해야 한다."""
+    spans = {"meeting": (10, 20), "point": (10, 10), "before": (0, 10), "later": (15, 15)}
+    index = EventTimeIndex()
+    index.rebuild(spans.items())
+    for start, end in [(10, 10), (15, 15), (20, 20), (0, 10), (5, 12)]:
+        expected = sorted(
+            (span[0], event_id) for event_id, span in spans.items() if spans_overlap(*span, start, end)
+        )
+        assert index.overlapping(start, end) == [event_id for _, event_id in expected]
+
+def test_zero_length_conflicts_match_across_backends(storage):
+    """저장 방식과 관계없이 길이가 0인 일정의 충돌 결과가 같아야 한다."""
+    point = storage.create_event({"title": "알림", "start_date": "2026-03-02T10:00:00", "end_date": "2026-03-02T10:00:00"})
+    meeting = storage.create_event({"title": "회의", "start_date": "2026-03-02T10:00:00", "end_date": "2026-03-02T11:00:00"})
+    before = storage.create_event({"title": "조회", "start_date": "2026-03-02T09:00:00", "end_date": "2026-03-02T10:00:00"})
+
+    assert [e.id for e in storage.find_conflicts(point.id)] == [meeting.id]
+    assert [e.id for e in storage.find_conflicts(before.id)] == []
+    pairs = storage.find_all_conflicts("2026-03-02T10:00:00", "2026-03-02")
+    assert _pairs((first.id, second.id) for first, second in pairs) == {frozenset((point.id, meeting.id))}
+
+def _text_event(event_id, title, description="", location=""):
+    return Event(id=event_id, title=title, description=description, location=location)
+
+def test_text_index_matches_substrings_in_insertion_order():
+    """n-gram 후보 중 본문에 검색어가 포함된 일정만 추가된 순서대로 반환해야 한다."""
+    events = {
+        "a": _text_event("a", "팀 회의", location="본사 3층"),
+        "b": _text_event("b", "회식", description="팀 회의 뒤풀이"),
+        "c": _text_event("c", "Weekly Sync"),
+        "d": _text_event("d", "의회 방청"),
+    }
+    index = EventTextIndex()
+    index.rebuild(events.values())
+    search = lambda query: [event.id for event in index.search(query, events.__getitem__)]
+
+    assert search("회의") == ["a", "b"]
+    assert search("의") == ["a", "b", "d"]
+    assert search("WEEKLY sy") == ["c"]
+    assert search("본사") == ["a"]
+    assert search("없는 말") == []
+    assert search("") == ["a", "b", "c", "d"]
+
+def test_text_index_update_and_remove():
+    """수정 후에는 새 본문으로만 찾고 추가 순서는 유지하며, 제거한 일정은 찾지 않아야 한다."""
+    first, second = _text_event("a", "독서 모임"), _text_event("b", "모임 장소 예약")
+    events = {"a": first, "b": second}
+    index = EventTextIndex()
+    index.rebuild(events.values())
+
+    events["a"] = _text_event("a", "운동 모임")
+    index.update(first, events["a"])
+    assert [event.id for event in index.search("모임", events.__getitem__)] == ["a", "b"]
+    assert index.search("독서", events.__getitem__) == []
+
+    index.remove(second)
+    assert [event.id for event in index.search("모임", events.__getitem__)] == ["a"]
+    assert len(index) == 1
+    # 제거한 일정에만 있던 n-gram은 색인에서 빠져야 함
+    assert index.search("예약", events.__getitem__) == []
+    assert "예약" not in index._postings
+
+def test_search_events_after_writes(storage):
+    """저장소 검색은 생성/수정/삭제를 바로 반영해야 한다."""
+    meeting = storage.create_event({"title": "팀 회의", "location": "본사"})
+    dinner = storage.create_event({"title": "회식", "description": "팀 회의 뒤풀이"})
+    assert [e.id for e in storage.search_events("회의")] == [meeting.id, dinner.id]
+
+    storage.update_event(meeting.id, {"title": "주간 보고"})
+    storage.delete_event(dinner.id)
+    assert storage.search_events("회의") == []
+    assert [e.id for e in storage.search_events("보고")] == [meeting.id]
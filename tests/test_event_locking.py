@@ -0,0 +1,64 @@
+import sqlite3
+import threading
+import time
+import app.services.event_storage_service as event_storage_service
+from tests.conftest import open_storage
+
+def _event(title):
+    return {"title": title, "start": "2024-05-01T10:00:00", "end": "2024-05-01T11:00:00"}
+
+def _timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+def test_json_read_does_not_wait_for_snapshot_write(tmp_path, monkeypatch):
+    """스냅샷 레코드를 직렬화하고 파일을 쓰는 동안에도 조회는 저장소 잠금을 기다리지 않아야 함"""
+    store = open_storage("json", tmp_path)
+    try:
+        existing = store.create_event(_event("기존 일정"))
+        writing = threading.Event()
+        original = event_storage_service.encode_record
+
+        def slow_encode_record(*args, **kwargs):
+            writing.set()
+            time.sleep(0.5)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(event_storage_service, "encode_record", slow_encode_record)
+        writer = threading.Thread(target=store.create_event, args=(_event("새 일정"),))
+        writer.start()
+        assert writing.wait(5)
+        event, elapsed = _timed(lambda: store.get_event(existing.id))
+        writer.join()
+
+        assert event.title == "기존 일정"
+        assert elapsed < 0.25
+        assert len(store.get_events()) == 2
+    finally:
+        store.close()
+
+def test_sqlite_read_does_not_wait_for_blocked_writer(tmp_path):
+    """다른 연결이 쓰기 잠금을 잡고 있어 쓰기가 기다리는 동안에도 조회는 바로 끝나야 함"""
+    store = open_storage("sqlite", tmp_path)
+    try:
+        existing = store.create_event(_event("기존 일정"))
+        other = sqlite3.connect(str(store.db_file), isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        writer = threading.Thread(target=store.create_event, args=(_event("새 일정"),))
+        writer.start()
+        time.sleep(0.2)  # 쓰기가 잠금 대기(busy_timeout)에 들어갈 시간
+        try:
+            event, elapsed = _timed(lambda: store.get_event(existing.id))
+            events, list_elapsed = _timed(store.get_events)
+        finally:
+            other.execute("ROLLBACK")
+            other.close()
+        writer.join()
+
+        assert event.title == "기존 일정"
+        assert [e.title for e in events] == ["기존 일정"]
+        assert max(elapsed, list_elapsed) < 0.25
+        assert len(store.get_events()) == 2
+    finally:
+        store.close()
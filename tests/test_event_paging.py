@@ -0,0 +1,79 @@
+import pytest
+from tests.conftest import CALENDAR_API, api_create_event
+
+def _page_through(store, **query):
+    pages, after = [], None
+    while True:
+        page, after = store.search_page(limit=3, after=after, **query)
+        pages.append(page)
+        if after is None:
+            return pages
+
+def _paging_events():
+    events = [
+        {"title": f"회의 {day}", "start_date": f"2026-05-{day:02d}T{9 + day % 5:02d}:00:00",
+         "end_date": f"2026-05-{day:02d}T{10 + day % 5:02d}:00:00"}
+        for day in range(1, 15)
+    ]
+    # 같은 시각에 시작하는 일정은 id로 순서가 정해짐
+    events += [{"title": "동시 시작", "start_date": "2026-05-03T12:00:00", "end_date": "2026-05-03T13:00:00"}] * 3
+    events += [{"title": f"날짜 없는 할 일 {index}"} for index in range(4)]
+    events.append({"title": "매일 점검", "start_date": "2026-05-01T08:00:00", "end_date": "2026-05-01T08:30:00",
+                   "repeat_type": "daily"})
+    events.append({"title": "격주 회의", "start_date": "2026-05-04T15:00:00", "end_date": "2026-05-04T16:00:00",
+                   "repeat_type": "weekly", "repeat_interval": 2})
+    return events
+
+@pytest.mark.parametrize("query", [
+    {},
+    {"query": "회의"},
+    {"start_date": "2026-05-03", "end_date": "2026-05-20"},
+    {"query": "회의", "start_date": "2026-05-03", "end_date": "2026-05-20"},
+])
+def test_cursor_paging_is_complete_and_ordered(storage, query):
+    """반복 일정과 날짜 없는 일정이 섞여도 페이지를 이어 붙인 결과가 한 번에 조회한 결과와 같아야 한다."""
+    storage.bulk_create(_paging_events())
+    full, next_key = storage.search_page(limit=1000, **query)
+    assert next_key is None
+    keys = [event.sort_key() for event in full]
+    assert keys == sorted(keys) and len(set(keys)) == len(keys)
+
+    pages = _page_through(storage, **query)
+    assert all(len(page) == 3 for page in pages[:-1])
+    assert [event.sort_key() for page in pages for event in page] == keys
+
+def test_cursor_paging_is_stable_across_writes(storage):
+    """페이지 사이에 일정이 추가/삭제되어도 이미 지난 일정은 다시 나오지 않고 남은 일정은 빠지지 않아야 한다."""
+    storage.bulk_create(_paging_events())
+    first, after = storage.search_page(limit=5)
+    rest_before = [event.sort_key() for page in _page_through(storage) for event in page][5:]
+
+    # 커서 앞(이미 본 구간)에 추가된 일정과 삭제된 일정은 다음 페이지에 영향을 주지 않음
+    storage.create_event({"title": "지난 구간 추가", "start_date": "2026-04-01T09:00:00", "end_date": "2026-04-01T10:00:00"})
+    storage.delete_event(first[0].id)
+    added = storage.create_event({"title": "날짜 없는 새 할 일"})
+
+    seen = []
+    while after is not None:
+        page, after = storage.search_page(limit=5, after=after)
+        seen.extend(event.sort_key() for event in page)
+    assert seen == sorted(rest_before + [added.sort_key()])
+    assert not {event.sort_key() for event in first} & set(seen)
+
+def test_search_api_pages_with_cursor(client):
+    """/events/search는 next_cursor로 다음 페이지를 이어 주고, 잘못된 커서는 400을 반환해야 한다."""
+    for index in range(5):
+        api_create_event(client, f"회의 {index}")
+
+    titles, cursor = [], None
+    while True:
+        params = {"max_results": 2, **({"cursor": cursor} if cursor else {})}
+        page = client.get(f"{CALENDAR_API}/events/search", params=params).json()
+        assert page["count"] <= 2
+        titles.extend(event["title"] for event in page["events"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert sorted(titles) == [f"회의 {index}" for index in range(5)]
+
+    assert client.get(f"{CALENDAR_API}/events/search", params={"cursor": "!!"}).status_code == 400
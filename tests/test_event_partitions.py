@@ -0,0 +1,73 @@
+import pytest
+from app.services.event_partitions import DEFAULT_TENANT, EventStoragePartitions
+from tests.conftest import CALENDAR_API, api_create_event
+
+@pytest.fixture(params=["json", "sqlite"])
+def partitions(request, tmp_path):
+    partitions = EventStoragePartitions(request.param, str(tmp_path), max_open=3, idle_seconds=3600)
+    yield partitions
+    partitions.close()
+
+def test_tenants_are_isolated(partitions, tmp_path):
+    """사용자마다 다른 디렉터리의 저장소를 쓰고, 기본 사용자는 EVENT_STORAGE_DIR을 그대로 사용해야 한다."""
+    with partitions.lease("alice") as alice:
+        alice.create_event({"title": "앨리스 일정"})
+    with partitions.lease() as default:
+        assert default.get_events() == []
+        default.create_event({"title": "기본 일정"})
+
+    with partitions.lease("alice") as alice:
+        assert [e.title for e in alice.get_events()] == ["앨리스 일정"]
+    assert (tmp_path / "tenants" / "alice").is_dir()
+    assert not (tmp_path / "tenants" / DEFAULT_TENANT).exists()
+
+@pytest.mark.parametrize("tenant_id", ["../escape", "a/b", "x" * 65, ".empty"])
+def test_invalid_tenant_id_is_rejected(partitions, tenant_id):
+    """디렉터리 밖을 가리키거나 형식에 맞지 않는 사용자 id(내부용 빈 저장소 포함)는 거부해야 한다."""
+    with pytest.raises(ValueError):
+        partitions.acquire(tenant_id)
+
+def test_read_for_unknown_tenant_uses_empty_storage(partitions, tmp_path):
+    """처음 보는 사용자의 조회는 디렉터리를 만들지 않고 빈 저장소로 응답해야 한다."""
+    with partitions.lease("bob", create=False) as storage:
+        assert storage.get_events() == []
+    assert not (tmp_path / "tenants" / "bob").exists()
+    assert "bob" not in partitions.loaded()
+
+def test_least_recently_used_tenant_is_closed_first(partitions):
+    """열린 저장소가 max_open을 넘으면 사용 중이 아닌 것 중 가장 오래 쓰지 않은 저장소부터 닫아야 한다."""
+    tenant_id, busy = partitions.acquire("busy")
+    try:
+        for name in ("a", "b", "c"):
+            with partitions.lease(name) as storage:
+                storage.create_event({"title": name})
+        # 가장 먼저 연 busy는 사용 중이므로 남고, 그다음으로 오래된 a가 닫힘
+        assert set(partitions.loaded()) == {"busy", "b", "c"}
+    finally:
+        partitions.release(tenant_id)
+
+    # 닫힌 저장소도 다시 열면 데이터가 그대로 있음
+    with partitions.lease("a") as storage:
+        assert [e.title for e in storage.get_events()] == ["a"]
+
+def test_idle_tenants_are_evicted(partitions):
+    """idle_seconds 동안 쓰이지 않은 저장소는 evict_idle에서 닫아야 한다."""
+    with partitions.lease("alice"):
+        pass
+    with partitions.lease():
+        pass
+    partitions.idle_seconds = 0
+    assert partitions.evict_idle() == 1
+    assert set(partitions.loaded()) == {DEFAULT_TENANT}
+
+def test_read_for_unknown_session_does_not_create_partition(client, tmp_path):
+    """처음 보는 X-Session-Id의 조회는 빈 결과를 반환하고 사용자 디렉터리를 만들지 않아야 한다."""
+    headers = {"X-Session-Id": "new-session"}
+    search = client.get(f"{CALENDAR_API}/events/search", headers=headers)
+    assert search.status_code == 200 and search.json()["events"] == []
+    assert not (tmp_path / "tenants" / "new-session").exists()
+
+    api_create_event(client, "개인 일정", **headers)
+    assert (tmp_path / "tenants" / "new-session").exists()
+    assert client.get(f"{CALENDAR_API}/events/search", headers=headers).json()["count"] == 1
+    assert client.get(f"{CALENDAR_API}/events/search").json()["count"] == 0
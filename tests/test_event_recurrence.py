@@ -0,0 +1,113 @@
+import calendar
+import random
+import time
+import pytest
+from app.services.event_index import SECONDS_PER_DAY, spans_overlap, to_epoch
+from app.services.event_model import Event
+from app.services.event_recurrence import RecurrenceIndex, RecurrenceRule
+
+def _naive_starts(rule, start, limit):
+    """첫 발생부터 하나씩 세어 가며 발생 시작 시각을 만듭니다. (비교 기준)"""
+    if rule.freq in ("daily", "weekly"):
+        step = rule.interval * SECONDS_PER_DAY * (7 if rule.freq == "weekly" else 1)
+        candidates = (start + index * step for index in range(limit))
+    else:
+        step_months = rule.interval * (12 if rule.freq == "yearly" else 1)
+        year, month, day, hour, minute, second = time.gmtime(start)[:6]
+        candidates = []
+        for index in range(limit):
+            months = month - 1 + index * step_months
+            occurrence_year, occurrence_month = year + months // 12, months % 12 + 1
+            if day <= calendar.monthrange(occurrence_year, occurrence_month)[1]:
+                candidates.append(calendar.timegm((occurrence_year, occurrence_month, day, hour, minute, second)))
+    starts = []
+    for occurrence_start in candidates:
+        if rule.count is not None and len(starts) >= rule.count:
+            break
+        if rule.until is not None and occurrence_start >= rule.until:
+            break
+        starts.append(occurrence_start)
+    return starts
+
+def _naive_occurrences(rule, start, end, window_start, window_end):
+    duration = end - start
+    return [
+        (occurrence_start, occurrence_start + duration)
+        for occurrence_start in _naive_starts(rule, start, 400)
+        if spans_overlap(occurrence_start, occurrence_start + duration, window_start, window_end)
+    ]
+
+@pytest.mark.parametrize("freq", ["daily", "weekly", "monthly", "yearly"])
+def test_occurrences_match_naive_expansion(freq):
+    """기간 시작으로 건너뛰어 계산한 발생이 첫 발생부터 센 결과와 같아야 한다."""
+    rng = random.Random(freq)
+    base = to_epoch("2024-01-31T09:00:00")
+    span_days = {"daily": 60, "weekly": 400, "monthly": 3000, "yearly": 9000}[freq]
+    for _ in range(150):
+        duration = rng.choice([0, 1800, SECONDS_PER_DAY, 3 * SECONDS_PER_DAY])
+        until = base + rng.randint(1, span_days) * SECONDS_PER_DAY if rng.random() < 0.3 else None
+        rule = RecurrenceRule(freq, rng.randint(1, 3), rng.choice([None, 1, 5, 12]), until)
+        window_start = base + rng.randint(-5, span_days) * SECONDS_PER_DAY + rng.choice([0, 3600, 32400])
+        window_end = window_start + rng.choice([0, 3600, SECONDS_PER_DAY, 40 * SECONDS_PER_DAY])
+        assert list(rule.occurrences(base, base + duration, window_start, window_end)) == \
+            _naive_occurrences(rule, base, base + duration, window_start, window_end)
+
+def test_monthly_rule_skips_missing_days():
+    """31일 매월 반복은 31일이 없는 달을 건너뛰고, 건너뛴 달은 횟수에 포함하지 않아야 한다."""
+    start = to_epoch("2026-01-31T10:00:00")
+    rule = RecurrenceRule("monthly", count=4)
+    window = (to_epoch("2026-01-01"), to_epoch("2027-01-01"))
+    starts = [occurrence_start for occurrence_start, _ in rule.occurrences(start, start + 3600, *window)]
+    assert starts == [to_epoch(f"2026-{month:02d}-31T10:00:00") for month in (1, 3, 5, 7)]
+
+def test_yearly_rule_on_leap_day():
+    """2월 29일 매년 반복은 윤년에만 발생해야 한다."""
+    start = to_epoch("2024-02-29")
+    rule = RecurrenceRule("yearly")
+    window = (to_epoch("2024-01-01"), to_epoch("2033-01-01"))
+    starts = [occurrence_start for occurrence_start, _ in rule.occurrences(start, start + SECONDS_PER_DAY, *window)]
+    assert starts == [to_epoch(f"{year}-02-29") for year in (2024, 2028, 2032)]
+
+def test_until_is_inclusive_of_the_last_day():
+    """repeat_until 날짜에 시작하는 발생까지 포함해야 한다."""
+    event = Event.from_dict({
+        "id": "standup", "title": "스탠드업", "start_date": "2026-03-02T09:00:00", "end_date": "2026-03-02T09:15:00",
+        "repeat_type": "daily", "repeat_until": "2026-03-05"
+    })
+    rule = RecurrenceRule.from_event(event)
+    starts = [start for start, _ in rule.occurrences(event.start, event.end, event.start, event.start + 30 * SECONDS_PER_DAY)]
+    assert starts == [to_epoch(f"2026-03-0{day}T09:00:00") for day in (2, 3, 4, 5)]
+
+def test_from_event_ignores_invalid_rules():
+    """반복 형식이 아니거나 값이 잘못된 일정은 반복 일정으로 보지 않아야 한다."""
+    assert RecurrenceRule.from_event(Event.from_dict({"start_date": "2026-03-02", "repeat_type": "hourly"})) is None
+    assert RecurrenceRule.from_event(Event.from_dict({"repeat_type": "daily"})) is None
+    assert RecurrenceRule.from_event(
+        Event.from_dict({"start_date": "2026-03-02", "repeat_type": "daily", "repeat_interval": "격일"})
+    ) is None
+
+def test_recurrence_index_cache_is_cleared_on_change():
+    """규칙이 추가/삭제되면 캐시된 기간별 발생 목록을 다시 계산해야 한다."""
+    start = to_epoch("2026-03-02T09:00:00")
+    window = (start, start + 3 * SECONDS_PER_DAY)
+    index = RecurrenceIndex()
+    index.add("daily", (start, start + 900), RecurrenceRule("daily"))
+    assert [event_id for _, _, event_id in index.occurrences(*window)] == ["daily"] * 3
+
+    index.add("weekly", (start + 3600, start + 7200), RecurrenceRule("weekly"))
+    assert [event_id for _, _, event_id in index.occurrences(*window)] == ["daily", "weekly", "daily", "daily"]
+    index.remove("daily")
+    assert [event_id for _, _, event_id in index.occurrences(*window)] == ["weekly"]
+
+def test_storage_expands_occurrences_in_range(storage):
+    """기간 조회는 반복 일정의 발생을 원본 id와 시작 시각으로 만든 id로 반환해야 한다."""
+    master = storage.create_event({
+        "title": "주간 회의", "start_date": "2026-03-02T10:00:00", "end_date": "2026-03-02T11:00:00",
+        "repeat_type": "weekly", "repeat_count": 3
+    })
+    events = storage.get_events("2026-03-01", "2026-03-31")
+    assert [event.id for event in events] == [
+        f"{master.id}_{day}T100000" for day in ("20260302", "20260309", "20260316")
+    ]
+    assert all(event.extra["recurring_event_id"] == master.id for event in events)
+    assert storage.get_events("2026-03-10", "2026-03-15") == []
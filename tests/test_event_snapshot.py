@@ -0,0 +1,34 @@
+from app.services.event_model import Event
+from app.services.event_snapshot import (
+    RECORD_FLAG_RECURRING, RECORD_FLAG_TOMBSTONE, SnapshotReader, encode_record, encode_tombstone, write_snapshot
+)
+from tests.conftest import SAMPLE_EVENTS
+
+def test_snapshot_round_trip(tmp_path):
+    """스냅샷에 기록한 일정과 삭제 기록이 머리 정보와 본문 모두 그대로 읽혀야 한다."""
+    events = [Event.from_dict(data) for data in SAMPLE_EVENTS]
+    records = [encode_record(event, seq) for seq, event in enumerate(events, 1)]
+    records.append(encode_tombstone("removed", 6, 1767225600.25))
+    path = tmp_path / "events.snap"
+    write_snapshot(path, records, last_seq=6, deleted_seq=5)
+
+    reader = SnapshotReader(path)
+    try:
+        assert (reader.last_seq, reader.deleted_seq) == (6, 5)
+        scanned = list(reader.scan())
+        assert [event_id for event_id, *_ in scanned] == ["meeting", "holiday", "memo", "standup", "removed"]
+
+        for seq, (event, record, (event_id, offset, span, flags, record_seq)) in enumerate(zip(events, records, scanned), 1):
+            assert reader.decode(offset).to_dict() == event.to_dict()
+            assert span == event.span()
+            assert record_seq == seq
+            assert bool(flags & RECORD_FLAG_RECURRING) == (event_id == "standup")
+            assert reader.raw(offset) == record
+
+        event_id, offset, span, flags, seq = scanned[-1]
+        assert flags & RECORD_FLAG_TOMBSTONE and span is None and seq == 6
+        assert reader.deleted_at(offset) == 1767225600.25
+        # 변경 번호만 바꾼 레코드도 같은 본문으로 읽혀야 함
+        assert encode_record(events[0], 9) == reader.raw(scanned[0][1], seq=9)
+    finally:
+        reader.close()
@@ -0,0 +1,145 @@
+import pytest
+from app.services.event_storage_service import EventStorageService
+from tests.conftest import SAMPLE_EVENTS
+
+def _seed(store):
+    """SAMPLE_EVENTS를 저장하고 예시 id → 저장소가 붙인 id를 반환합니다."""
+    return {data["id"]: store.create_event(data).id for data in SAMPLE_EVENTS}
+
+def _snapshot_of(store):
+    return {event.id: (event.to_dict(), store.get_event(event.id).version) for event in store.get_changes()["events"]}
+
+def test_journal_mode_appends_instead_of_rewriting(tmp_path):
+    """저널 모드의 쓰기는 스냅샷을 다시 쓰지 않고 저널에 한 줄씩 덧붙여야 한다."""
+    store = EventStorageService(str(tmp_path), mode="journal")
+    try:
+        store.compact_threshold = 1000
+        snapshot = store.events_file.stat()
+        event = store.create_event({"title": "회의"})
+        store.update_event(event.id, {"title": "주간 회의"})
+        store.delete_event(event.id)
+        store.flush()
+
+        assert (store.events_file.stat().st_ino, store.events_file.stat().st_mtime_ns) == (snapshot.st_ino, snapshot.st_mtime_ns)
+        assert len(store.journal_file.read_text(encoding="utf-8").splitlines()) == 3
+    finally:
+        store.close()
+
+@pytest.mark.parametrize("mode", ["json", "journal"])
+def test_storage_reopen_round_trip(tmp_path, mode):
+    """저장소를 닫았다 다시 열어도 일정, 버전, 변경 번호, 삭제 기록이 유지되어야 한다."""
+    store = EventStorageService(str(tmp_path), mode=mode)
+    ids = _seed(store)
+    store.update_event(ids["meeting"], {"title": "주간 회의"})
+    assert store.delete_event(ids["holiday"])
+    expected = _snapshot_of(store)
+    seq = store.get_changes()["seq"]
+    store.close()
+
+    reopened = EventStorageService(str(tmp_path), mode=mode)
+    try:
+        assert _snapshot_of(reopened) == expected
+        assert reopened.get_changes()["seq"] == seq == len(SAMPLE_EVENTS) + 2
+        assert reopened.get_changes(seq - 1)["deleted"] == [ids["holiday"]]
+    finally:
+        reopened.close()
+
+def _crash_before_snapshot(store):
+    def fail(*args):
+        raise OSError("스냅샷 기록 중 중단")
+    return fail
+
+def _crash_after_snapshot(store):
+    install = store._install_snapshot
+
+    def fail(*args):
+        install(*args)
+        raise OSError("저널 삭제 전 중단")
+    return fail
+
+@pytest.mark.parametrize("crash_point, target", [
+    (_crash_before_snapshot, "_write_snapshot_tmp"),
+    (_crash_after_snapshot, "_install_snapshot"),
+])
+def test_journal_replay_after_crash_mid_compaction(tmp_path, crash_point, target):
+    """압축 도중 중단되어 events.journal.compacting이 남아도, 다시 열면 모든 변경이 순서대로 반영되어야 한다."""
+    store = EventStorageService(str(tmp_path), mode="journal")
+    store.compact_threshold = 3
+    setattr(store, target, crash_point(store))
+
+    ids = {data["id"]: store.create_event(data).id for data in SAMPLE_EVENTS[:3]}
+    store.flush()
+    store._compaction_thread.join()
+    delattr(store, target)
+    assert store.compacting_file.exists()
+
+    # 압축이 끝나지 않은 동안의 변경은 새 저널에 쌓임
+    store.update_event(ids["meeting"], {"title": "장소 변경된 회의"})
+    assert store.delete_event(ids["memo"])
+    store.create_event(SAMPLE_EVENTS[3])
+    expected = _snapshot_of(store)
+    seq = store.get_changes()["seq"]
+    store.close()
+
+    reopened = EventStorageService(str(tmp_path), mode="journal")
+    try:
+        assert _snapshot_of(reopened) == expected
+        assert reopened.get_event(ids["meeting"]).title == "장소 변경된 회의"
+        assert reopened.get_event(ids["memo"]) is None
+        assert reopened.get_changes()["seq"] == seq
+        assert reopened.get_changes(seq - 2)["deleted"] == [ids["memo"]]
+        assert not reopened.compacting_file.exists()
+    finally:
+        reopened.close()
+
+def test_update_coerces_text_fields(storage):
+    """제목 등에 문자열이 아닌 값이 들어와도 문자열로 저장되고 검색되어야 한다."""
+    event = storage.create_event({"title": "회의", "start_date": "2026-03-02T10:00:00"})
+    updated = storage.update_event(event.id, {"title": 123, "location": 4.5})
+    assert (updated.title, updated.location) == ("123", "4.5")
+    assert [e.id for e in storage.search_events("123")] == [event.id]
+    assert storage.get_event(event.id).title == "123"
+
+def test_failed_batch_changes_nothing(storage):
+    """일괄 변경 중 잘못된 항목이 있으면 앞선 항목도 적용되지 않아야 한다."""
+    event = storage.create_event({"title": "회의", "start_date": "2026-03-02T10:00:00"})
+    before = storage.get_changes()["seq"]
+    with pytest.raises(Exception):
+        storage.apply_batch(
+            create=[{"title": "새 일정"}],
+            update=[{"id": event.id, "data": {"title": "바뀐 회의"}}, {"data": {"title": "id 없음"}}],
+            delete=[event.id]
+        )
+    changes = storage.get_changes()
+    assert changes["seq"] == before
+    assert [e.to_dict() for e in changes["events"]] == [event.to_dict()]
+    assert storage.get_event(event.id).title == "회의"
+    assert [e.id for e in storage.search_events("회의")] == [event.id]
+
+def test_batch_applies_repeated_updates_in_order(storage):
+    """같은 일정을 여러 번 수정하면 앞선 수정 결과에 이어서 적용되어야 한다."""
+    event = storage.create_event({"title": "회의", "location": "본사"})
+    result = storage.apply_batch(update=[
+        {"id": event.id, "data": {"title": "주간 회의"}},
+        {"id": event.id, "data": {"location": "지사"}},
+    ])
+    assert len(result["updated"]) == 2
+    current = storage.get_event(event.id)
+    assert (current.title, current.location) == ("주간 회의", "지사")
+    assert [e.id for e in storage.search_events("주간")] == [event.id]
+
+@pytest.mark.parametrize("mode", ["json", "journal"])
+def test_legacy_json_keeps_duplicate_ids(tmp_path, mode):
+    """이전 형식 events.json에서 id가 겹치는 일정은 새 id를 받아 모두 보존되어야 한다."""
+    (tmp_path / "events.json").write_text(
+        '[{"id": "1", "title": "A"}, {"id": "2", "title": "B"}, {"id": "2", "title": "C"}, {"title": "D"}]',
+        encoding="utf-8"
+    )
+    store = EventStorageService(str(tmp_path), mode=mode)
+    try:
+        events = store.get_events()
+        assert [e.title for e in events] == ["A", "B", "C", "D"]
+        assert [e.id for e in events][:2] == ["1", "2"]
+        assert len({e.id for e in events}) == 4
+    finally:
+        store.close()
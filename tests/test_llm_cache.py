@@ -0,0 +1,107 @@
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+import pytz
+from app.services.llm_cache import (
+    KST, CachedChatCompletions, LLMResponseCache, cache_user_input, depends_on_current_time, next_midnight,
+    normalize_prompt
+)
+
+def _messages(user_input, now="09:15"):
+    return [
+        {"role": "system", "content": f"오늘 날짜: 2026-10-18, 현재 시간: {now}"},
+        {"role": "user", "content": user_input},
+    ]
+
+def test_normalize_prompt_ignores_punctuation_spacing_and_case():
+    assert normalize_prompt("내일 일정 뭐 있어?") == normalize_prompt("내일  일정 뭐있어")
+    assert normalize_prompt("Team Sync!") == normalize_prompt("team sync")
+    # 숫자 사이의 마침표는 값의 일부이므로 유지
+    assert normalize_prompt("1.5시간 회의") != normalize_prompt("15시간 회의")
+
+@pytest.mark.parametrize("user_input, expected", [
+    ("내일 오후 3시 회의 추가해줘", False),
+    ("다음주 일정 알려줘", False),
+    ("1시간 뒤에 알림", True),
+    ("30분 후에 회의", True),
+    ("지금 일정 뭐야", True),
+    ("오늘 남은 일정", True),
+    (None, True),
+])
+def test_depends_on_current_time(user_input, expected):
+    assert depends_on_current_time(user_input) is expected
+
+def test_make_key_drops_current_time_only_when_allowed():
+    """현재 시각은 keep_time이 False일 때만 키에서 빠지고, 모델/옵션이 다르면 키도 달라야 한다."""
+    key = lambda now, **kwargs: LLMResponseCache.make_key(_messages("내일 일정", now), "gpt-4o-mini", 0, **kwargs)[0]
+    assert key("09:15", keep_time=False) == key("17:40", keep_time=False)
+    assert key("09:15") != key("17:40")
+
+    base = LLMResponseCache.make_key(_messages("내일 일정"), "gpt-4o-mini", 0)[0]
+    assert base != LLMResponseCache.make_key(_messages("내일 일정"), "gpt-4o", 0)[0]
+    assert base != LLMResponseCache.make_key(_messages("내일 일정"), "gpt-4o-mini", 0.7)[0]
+    assert base != LLMResponseCache.make_key(
+        _messages("내일 일정"), "gpt-4o-mini", 0, response_format={"type": "json_object"}
+    )[0]
+
+def test_next_midnight_is_in_korean_time():
+    now = KST.localize(datetime(2026, 10, 18, 23, 59))
+    assert next_midnight(now) == KST.localize(datetime(2026, 10, 19))
+    assert next_midnight(KST.localize(datetime(2026, 10, 18))) == KST.localize(datetime(2026, 10, 19))
+    # UTC로 전날 15시는 한국 시간으로 이미 다음 날
+    assert next_midnight(datetime(2026, 10, 18, 15, 30, tzinfo=pytz.utc)) == KST.localize(datetime(2026, 10, 20))
+
+def test_cache_evicts_least_recently_used_and_expires_at_midnight():
+    cache = LLMResponseCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+    cache._expires_at = datetime.now(KST) - timedelta(seconds=1)
+    assert cache.get("a") is None
+    assert cache.get_stats()["entries"] == 0
+
+def test_similar_lookup_requires_same_dates_and_numbers():
+    """임베딩이 비슷해도 숫자나 날짜/시간 표현이 다르면 다른 요청으로 취급해야 한다."""
+    cache = LLMResponseCache(similarity_threshold=0.9)
+    _, prompt = cache.make_key(_messages("내일 오후 3시 회의"), "gpt-4o-mini", 0)
+    cache.put("key", "응답", prompt, [1.0, 0.0])
+
+    same = cache.make_key(_messages("내일 오후 3시에 회의"), "gpt-4o-mini", 0)[1]
+    other_day = cache.make_key(_messages("모레 오후 3시 회의"), "gpt-4o-mini", 0)[1]
+    other_hour = cache.make_key(_messages("내일 오후 4시 회의"), "gpt-4o-mini", 0)[1]
+    assert cache.find_similar(same, [1.0, 0.0]) == "응답"
+    assert cache.find_similar(same, [0.0, 1.0]) is None
+    assert cache.find_similar(other_day, [1.0, 0.0]) is None
+    assert cache.find_similar(other_hour, [1.0, 0.0]) is None
+
+class _FakeCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        return f"응답 {self.calls}"
+
+def test_cached_completions_reuse_responses_by_user_input():
+    """현재 시각과 무관한 입력은 시각이 바뀌어도 캐시를 쓰고, 상대 시간 표현이 있으면 다시 호출해야 한다."""
+    completions = _FakeCompletions()
+    cached = CachedChatCompletions(completions, LLMResponseCache())
+
+    async def ask(user_input, now, **kwargs):
+        with cache_user_input(user_input):
+            return await cached.create(model="gpt-4o-mini", messages=_messages(user_input, now), temperature=0, **kwargs)
+
+    async def scenario():
+        assert await ask("내일 일정 알려줘", "09:15") == "응답 1"
+        assert await ask("내일 일정 알려줘?", "17:40") == "응답 1"
+        assert await ask("1시간 뒤 일정", "09:15") == "응답 2"
+        assert await ask("1시간 뒤 일정", "17:40") == "응답 3"
+        # 스트리밍 요청은 캐시하지 않음
+        assert await ask("내일 일정 알려줘", "09:15", stream=True) == "응답 4"
+
+    asyncio.run(scenario())
+    assert completions.calls == 4
+    assert cached.cache.get_stats()["hits"] == 1
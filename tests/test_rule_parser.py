@@ -0,0 +1,48 @@
+from datetime import datetime
+import pytest
+from app.services.llm_service import rule_based_extraction
+
+NOW = datetime(2026, 10, 18, 9, 0)  # 일요일
+
+def _parse(text):
+    result = rule_based_extraction(text, NOW)
+    if result is None:
+        return None
+    info = result["extracted_info"]
+    return result["intent"], info["title"], info["start_date"], info["start_time"]
+
+@pytest.mark.parametrize("text, expected", [
+    ("내일 회의 추가해줘", ("calendar_add", "회의", "2026-10-19", None)),
+    ("내일은 회의 추가해줘", ("calendar_add", "회의", "2026-10-19", None)),
+    ("모레는 독서 모임 잡아줘", ("calendar_add", "독서 모임", "2026-10-20", None)),
+    ("다음주 월요일에는 독서 모임 잡아줘", ("calendar_add", "독서 모임", "2026-10-26", None)),
+    ("내일 오후 3시엔 회의 추가해줘", ("calendar_add", "회의", "2026-10-19", "15:00")),
+    ("내일 오후 3시에 팀 회의 추가해줘", ("calendar_add", "팀 회의", "2026-10-19", "15:00")),
+    ("내일 은행 가야해", ("calendar_add", "은행", "2026-10-19", None)),
+    ("내일 15:30 회의 추가해줘", ("calendar_add", "회의", "2026-10-19", "15:30")),
+    ("내일 오후 12시 회의 추가해줘", ("calendar_add", "회의", "2026-10-19", "12:00")),
+])
+def test_rule_add(text, expected):
+    assert _parse(text) == expected
+
+@pytest.mark.parametrize("text", [
+    "내일 오전 12시 회의 추가해줘",  # 자정/정오 모호
+    "내일 3시 회의 추가해줘",  # 오전/오후 모호
+    "내일 7시 반 저녁 약속 추가해줘",
+    "내일 오후 3시 회의하고 저녁 약속 추가해줘",  # 여러 일정
+    "내일부터 모레까지 휴가 추가해줘",  # 기간 일정
+    "10월 1일 회의 추가해줘",  # 지난 날짜
+    "내일 회의 삭제해줘",
+])
+def test_rule_falls_back_to_llm(text):
+    assert rule_based_extraction(text, NOW) is None
+
+@pytest.mark.parametrize("text, start, end", [
+    ("내일 일정 뭐 있어", "2026-10-19", "2026-10-19"),
+    ("내일은 일정 뭐 있어", "2026-10-19", "2026-10-19"),
+    ("다음주 일정 알려줘", "2026-10-25", "2026-10-31"),
+])
+def test_rule_search(text, start, end):
+    result = rule_based_extraction(text, NOW)
+    assert result["intent"] == "calendar_search"
+    assert (result["extracted_info"]["start_date"], result["extracted_info"]["end_date"]) == (start, end)